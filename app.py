@@ -1,9 +1,32 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 from scraper import CompanyScraper
+from jobs import JobManager, JobStoreFull
+import circuit_breaker
+import hedging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import json
+import time
+import queue
+import threading
 import os
 
 app = Flask(__name__)
 scraper = CompanyScraper()
+jobs = JobManager(scraper)
+
+# How many companies of a batch are scraped at once
+BATCH_MAX_WORKERS = int(os.environ.get('BATCH_MAX_WORKERS', 4))
+BATCH_MAX_ITEMS = int(os.environ.get('BATCH_MAX_ITEMS', 10000))
+# Comment lines sent while waiting on slow sources, so proxies don't drop an idle stream
+SSE_KEEPALIVE = float(os.environ.get('SSE_KEEPALIVE', 15))
+# Shared by every batch request, so concurrent batches can't multiply the scraping load
+batch_executor = ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS, thread_name_prefix='batch')
+
+def parse_deadline(value):
+    """Optional per-request time budget in seconds; raises ValueError if it isn't a number"""
+    if value in (None, ''):
+        return None
+    return float(value)
 
 @app.route('/')
 def index():
@@ -14,17 +37,194 @@ def search_company():
     data = request.json
     company_name = data.get('name', '')
     website = data.get('website', '')
+    # Set refresh to bypass the result cache and crawl again
+    refresh = bool(data.get('refresh', False))
     
     if not company_name and not website:
         return jsonify({'error': 'Company name or website required'}), 400
+    try:
+        # Seconds the lookup may take; sources still running then are left out of the result
+        deadline = parse_deadline(data.get('deadline'))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'deadline must be a number of seconds'}), 400
     
     try:
-        result = scraper.scrape_company(company_name, website)
+        result = scraper.scrape_company(company_name, website, refresh=refresh, deadline=deadline)
         return jsonify(result)
     except Exception as e:
         print(f"Error scraping company: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/search/stream')
+def search_stream():
+    """Server-Sent Events version of /api/search: a 'source' event per finished source, then 'done'"""
+    company_name = request.args.get('name', '')
+    website = request.args.get('website', '')
+    refresh = request.args.get('refresh', '').lower() in ('1', 'true', 'yes')
+    
+    if not company_name and not website:
+        return jsonify({'error': 'Company name or website required'}), 400
+    try:
+        deadline = parse_deadline(request.args.get('deadline'))
+    except ValueError:
+        return jsonify({'error': 'deadline must be a number of seconds'}), 400
+    
+    events = queue.Queue()
+    
+    def on_source(name, partial):
+        events.put(('source', {'source': name, 'result': partial}))
+    
+    def run():
+        try:
+            result = scraper.scrape_company(company_name, website, refresh=refresh, on_source=on_source, deadline=deadline)
+            events.put(('done', result))
+        except Exception as e:
+            print(f"Error scraping company: {e}")
+            events.put(('error', {'error': str(e)}))
+    
+    # The crawl runs to completion even if the client goes away, so its result still gets cached
+    threading.Thread(target=run, name='search-stream', daemon=True).start()
+    
+    def generate():
+        while True:
+            try:
+                event, payload = events.get(timeout=SSE_KEEPALIVE)
+            except queue.Empty:
+                yield ': keep-alive\n\n'
+                continue
+            yield f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+            if event in ('done', 'error'):
+                return
+    
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/api/search/batch', methods=['POST'])
+def search_batch():
+    """Scrape a list of {name, website} items, streaming one NDJSON line per item as it finishes"""
+    data = request.json
+    items = data.get('items') if isinstance(data, dict) else data
+    refresh = bool(data.get('refresh', False)) if isinstance(data, dict) else False
+    
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'A non-empty list of items is required'}), 400
+    if len(items) > BATCH_MAX_ITEMS:
+        return jsonify({'error': f'At most {BATCH_MAX_ITEMS} items per batch'}), 400
+    try:
+        # Applies to each item on its own, not to the batch as a whole
+        deadline = parse_deadline(data.get('deadline')) if isinstance(data, dict) else None
+    except (TypeError, ValueError):
+        return jsonify({'error': 'deadline must be a number of seconds'}), 400
+    
+    def generate():
+        for line in run_batch(items, refresh, deadline):
+            yield json.dumps(line, default=str) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def scrape_batch_item(index, item, refresh, deadline=None):
+    started = time.monotonic()
+    line = {'index': index}
+    try:
+        if not isinstance(item, dict):
+            raise ValueError('Item must be an object with name and/or website')
+        company_name = item.get('name', '')
+        website = item.get('website', '')
+        line.update({'name': company_name, 'website': website})
+        if not company_name and not website:
+            raise ValueError('Company name or website required')
+        line['result'] = scraper.scrape_company(company_name, website, refresh=refresh, deadline=deadline)
+        line['status'] = 'ok'
+    except Exception as e:
+        print(f"Error scraping batch item {index}: {e}")
+        line['status'] = 'error'
+        line['error'] = str(e)
+    line['elapsed_ms'] = int((time.monotonic() - started) * 1000)
+    return line
+
+def run_batch(items, refresh=False, deadline=None):
+    """Yield results in completion order, keeping only a small window of items in flight"""
+    pending = set()
+    queued = iter(enumerate(items))
+    try:
+        while True:
+            # Keep every worker busy plus one item each queued behind it
+            while len(pending) < BATCH_MAX_WORKERS * 2:
+                next_item = next(queued, None)
+                if next_item is None:
+                    break
+                index, item = next_item
+                pending.add(batch_executor.submit(scrape_batch_item, index, item, refresh, deadline))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        # The client may have gone away mid-stream, don't start work nobody will read
+        for future in pending:
+            future.cancel()
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    """Queue a lookup in the background and return its job id without waiting for the crawl"""
+    data = request.json
+    company_name = data.get('name', '')
+    website = data.get('website', '')
+    refresh = bool(data.get('refresh', False))
+    
+    if not company_name and not website:
+        return jsonify({'error': 'Company name or website required'}), 400
+    try:
+        # Jobs default to SCRAPER_JOB_DEADLINE_SECONDS and may ask for up to SCRAPER_MAX_JOB_DEADLINE_SECONDS
+        deadline = parse_deadline(data.get('deadline'))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'deadline must be a number of seconds'}), 400
+    
+    try:
+        job_id = jobs.submit(company_name, website, refresh=refresh, deadline=deadline)
+    except JobStoreFull as e:
+        print(f"Rejecting job: {e}")
+        return jsonify({'error': 'Too many lookups in progress, try again later'}), 503
+    
+    status_url = f'/api/jobs/{job_id}'
+    response = jsonify({'job_id': job_id, 'status': 'queued', 'status_url': status_url})
+    response.headers['Location'] = status_url
+    return response, 202
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown or expired job'}), 404
+    return jsonify(job)
+
+@app.route('/api/jobs/stats')
+def job_stats():
+    return jsonify(jobs.stats())
+
+@app.route('/api/hosts/stats')
+def host_stats():
+    scheduler = scraper.http.scheduler
+    return jsonify(scheduler.stats() if scheduler else {})
+
+@app.route('/api/breakers/stats')
+def breaker_stats():
+    return jsonify(circuit_breaker.breaker_stats())
+
+@app.route('/api/hedging/stats')
+def hedging_stats():
+    return jsonify(hedging.hedge_stats())
+
+@app.route('/api/cache/stats')
+def cache_stats():
+    stats = scraper.result_cache.stats()
+    stats['single_flight'] = scraper.in_flight.stats()
+    stats['quotes'] = scraper.quotes.stats()
+    return jsonify(stats)
+
 if __name__ == '__main__':
     # Try port 8000 first, fallback to 8080 if that fails
     try:
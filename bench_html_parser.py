@@ -0,0 +1,58 @@
+"""Parse time and peak memory of every installed BeautifulSoup backend over saved pages.
+
+Usage: python bench_html_parser.py [page.html ...] [--runs N]
+
+Defaults to the fixture pages in fixtures/pages, which are small hand-written stand-ins
+that only show the script works; pass pages saved from the real sites for numbers worth
+acting on. Backends that aren't installed are skipped; pip install lxml to include it.
+"""
+import os
+import sys
+import glob
+import time
+import tracemalloc
+from bs4 import BeautifulSoup
+
+from html_parser import available_backends, parser_for
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'pages')
+
+
+def measure(html, backend, runs):
+    BeautifulSoup(html, backend)  # warm up
+    started = time.perf_counter()
+    for _ in range(runs):
+        soup = BeautifulSoup(html, backend)
+    elapsed = (time.perf_counter() - started) / runs * 1000
+    elements = len(soup.find_all(True))
+    soup.decompose()
+
+    tracemalloc.start()
+    soup = BeautifulSoup(html, backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    soup.decompose()
+    return elapsed, peak, elements
+
+
+def main(args):
+    runs = 20
+    if '--runs' in args:
+        position = args.index('--runs')
+        runs = int(args[position + 1])
+        del args[position:position + 2]
+    paths = args or sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html')))
+
+    backends = available_backends()
+    print(f"Backends installed: {', '.join(backends)}; 'auto' resolves to {parser_for('website')}")
+    print(f"{'page':<26} {'backend':<12} {'parse ms':>9} {'peak KiB':>9} {'elements':>9}")
+    for path in paths:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            html = f.read()
+        for backend in backends:
+            elapsed, peak, elements = measure(html, backend, runs)
+            print(f"{os.path.basename(path):<26} {backend:<12} {elapsed:9.2f} {peak / 1024:9.0f} {elements:9d}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,146 @@
+"""Compare the single-pass section classifier with the old multi-pass extraction.
+
+Usage: python bench_section_classifier.py [page.html ...] [--runs N]
+
+Without arguments a large synthetic marketing page is generated. Parsing is done once
+per page and excluded from the timings, so only the extraction itself is measured.
+"""
+import re
+import sys
+import time
+from bs4 import BeautifulSoup
+
+from section_classifier import classify_sections, extract_products, extract_leaders
+
+
+def legacy_extract(soup):
+    """The extraction scrape_website used to run: separate find() walks per keyword group"""
+    data = {}
+    about_keywords = ['about us', 'our company', 'who we are', 'about', 'mission', 'vision']
+    about_section = soup.find(id=lambda i: i and any(keyword in i.lower() for keyword in about_keywords))
+    if not about_section:
+        about_section = soup.find(class_=lambda c: c and any(keyword in c.lower() for keyword in about_keywords))
+    if not about_section:
+        about_section = soup.find(lambda tag: tag.name and any(word in tag.get_text().lower() for word in about_keywords))
+    if about_section:
+        data['about'] = about_section.get_text().strip()
+
+    products = []
+    product_keywords = ['products', 'services', 'solutions', 'offerings', 'what we do']
+    product_section = soup.find(id=lambda i: i and any(keyword in i.lower() for keyword in product_keywords))
+    if not product_section:
+        product_section = soup.find(class_=lambda c: c and any(keyword in c.lower() for keyword in product_keywords))
+    if not product_section:
+        product_section = soup.find(lambda tag: tag.name and any(word in tag.get_text().lower() for word in product_keywords))
+    if product_section:
+        for item in product_section.find_all(['h1', 'h2', 'h3', 'h4', 'h5']):
+            if item.get_text().strip() and len(item.get_text().strip()) < 100:
+                products.append(item.get_text().strip())
+        if not products:
+            for item in product_section.find_all(['li']):
+                if item.get_text().strip() and len(item.get_text().strip()) < 100:
+                    products.append(item.get_text().strip())
+    if products:
+        data['products'] = products[:5]
+
+    # The leadership block ran three times in a row; each run started from scratch
+    for _ in range(3):
+        data['leadership'] = []
+        leadership_keywords = ['leadership', 'management', 'team', 'executives', 'founders', 'board', 'directors']
+        leadership_section = soup.find(id=lambda i: i and any(keyword in i.lower() for keyword in leadership_keywords))
+        if not leadership_section:
+            leadership_section = soup.find(class_=lambda c: c and any(keyword in c.lower() for keyword in leadership_keywords))
+        if not leadership_section:
+            leadership_section = soup.find(lambda tag: tag.name and tag.name.lower() in ['h1', 'h2', 'h3', 'h4'] and
+                                           any(word in tag.get_text().lower() for word in leadership_keywords))
+            if leadership_section:
+                leadership_section = leadership_section.find_next(['div', 'section', 'ul'])
+        if leadership_section:
+            for name_elem in leadership_section.find_all(['h3', 'h4', 'h5', 'strong', 'b']):
+                name = name_elem.get_text().strip()
+                position_elem = name_elem.find_next(['p', 'div', 'span'])
+                position = position_elem.get_text().strip() if position_elem else 'Leadership'
+                if name and len(name) < 50:
+                    data['leadership'].append({'name': name, 'position': position})
+            if not data['leadership']:
+                for item in leadership_section.find_all('li'):
+                    text = item.get_text().strip()
+                    if ',' in text or '-' in text or '–' in text:
+                        parts = re.split('[,\\-–]', text, 1)
+                        if len(parts) >= 2:
+                            data['leadership'].append({'name': parts[0].strip(), 'position': parts[1].strip()})
+            if not data['leadership']:
+                for card in leadership_section.find_all(['div', 'article', 'section']):
+                    name_elem = card.find(['h3', 'h4', 'h5', 'strong', 'b'])
+                    if name_elem:
+                        name = name_elem.get_text().strip()
+                        position_elem = card.find(['p', 'div', 'span'])
+                        position = position_elem.get_text().strip() if position_elem else 'Leadership'
+                        if name and len(name) < 50 and name != position:
+                            data['leadership'].append({'name': name, 'position': position})
+    return data
+
+
+def single_pass_extract(soup):
+    data = {}
+    sections = classify_sections(soup)
+    if sections['about']:
+        data['about'] = sections['about'].get_text().strip()
+    products = extract_products(sections['products']) if sections['products'] else []
+    if products:
+        data['products'] = products
+    data['leadership'] = extract_leaders(sections['leadership']) if sections['leadership'] else []
+    return data
+
+
+def synthetic_page(blocks=400):
+    """A long marketing page: deep nav, many feature cards, then the sections we look for"""
+    parts = ['<html><head><title>Acme Corp</title></head><body>']
+    parts.append('<nav class="site-nav">' + ''.join(f'<ul class="menu-{i}"><li><a href="/p{i}">Link {i}</a></li></ul>' for i in range(50)) + '</nav>')
+    for i in range(blocks):
+        parts.append(f'<div class="feature feature-{i}"><div class="card"><h5>Feature {i}</h5>'
+                     f'<p>Lorem ipsum dolor sit amet {i}, consectetur adipiscing elit.</p>'
+                     f'<span class="badge">new</span></div></div>')
+    parts.append('<section class="our-products"><h3>Rockets</h3><h3>Anvils</h3><h3>Portable holes</h3></section>')
+    parts.append('<section id="about-us"><p>Acme Corp has supplied coyotes since 1949.</p></section>')
+    parts.append('<section class="leadership"><h4>Wile E. Coyote</h4><p>Chief Executive Officer</p>'
+                 '<h4>Road Runner</h4><p>Chief Operating Officer</p></section>')
+    parts.append('<footer>' + ''.join(f'<p class="legal-{i}">Legal text {i}</p>' for i in range(100)) + '</footer>')
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+def bench(name, func, soup, runs):
+    func(soup)  # warm up
+    started = time.perf_counter()
+    for _ in range(runs):
+        result = func(soup)
+    elapsed = (time.perf_counter() - started) / runs * 1000
+    print(f"  {name:<12} {elapsed:8.2f} ms per page")
+    return result, elapsed
+
+
+def main(args):
+    runs = 20
+    if '--runs' in args:
+        position = args.index('--runs')
+        runs = int(args[position + 1])
+        del args[position:position + 2]
+
+    pages = [(path, open(path, encoding='utf-8', errors='replace').read()) for path in args]
+    if not pages:
+        pages = [('synthetic page', synthetic_page())]
+
+    for label, html in pages:
+        soup = BeautifulSoup(html, 'html.parser')
+        print(f"{label}: {len(html)} bytes, {len(soup.find_all(True))} elements, {runs} runs")
+        legacy, legacy_ms = bench('legacy', legacy_extract, soup, runs)
+        current, current_ms = bench('single pass', single_pass_extract, soup, runs)
+        print(f"  speedup      {legacy_ms / current_ms:8.1f}x")
+        for key in ('about', 'products', 'leadership'):
+            same = legacy.get(key) == current.get(key)
+            print(f"  {key:<12} {'same' if same else 'differs'}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -6,6 +6,7 @@ from shutil import which
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from render_profile import apply_render_profile, block_requests
 
 logger = logging.getLogger('ChromeDriverInstaller')
 
@@ -72,6 +73,7 @@ def setup_chrome_driver():
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
+    apply_render_profile(chrome_options)
     
     if not is_chrome_installed():
         logger.warning("Chrome not installed. Cannot set up ChromeDriver.")
@@ -90,6 +92,7 @@ def setup_chrome_driver():
             driver = method(chrome_options)
             if driver:
                 logger.info(f"Chrome driver setup successfully using {method.__name__}")
+                block_requests(driver)
                 return driver
         except Exception as e:
             logger.warning(f"{method.__name__} failed: {e}")
@@ -0,0 +1,179 @@
+import os
+import time
+import logging
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+
+from deadline import current_deadline
+
+logger = logging.getLogger('CircuitBreaker')
+
+# Outcomes remembered per provider, and how many are needed before judging it
+WINDOW_SIZE = int(os.environ.get('SCRAPER_BREAKER_WINDOW', 20))
+MIN_CALLS = int(os.environ.get('SCRAPER_BREAKER_MIN_CALLS', 5))
+# Share of recent calls that may fail before the provider is skipped
+FAILURE_RATE = float(os.environ.get('SCRAPER_BREAKER_FAILURE_RATE', 0.5))
+# Empty answers are normal for private companies, so only a provider that is almost
+# always empty (changed markup, exhausted API key) is treated as broken
+EMPTY_RATE = float(os.environ.get('SCRAPER_BREAKER_EMPTY_RATE', 0.9))
+EMPTY_MIN_CALLS = int(os.environ.get('SCRAPER_BREAKER_EMPTY_MIN_CALLS', 10))
+# How long an open breaker skips its provider before letting a probe through
+OPEN_SECONDS = float(os.environ.get('SCRAPER_BREAKER_OPEN_SECONDS', 60))
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+SUCCESS = 'success'
+EMPTY = 'empty'
+FAILURE = 'failure'
+
+# Upstreams that get a breaker; each is named after the code path that calls it
+PROVIDERS = ['alpha_vantage', 'yahoo_lookup', 'yahoo_quote', 'yahoo_quote_batch',
+             'bing_news', 'google_news', 'wikipedia_api']
+
+# Providers the current lookup skipped or got nothing from; see track_degraded()
+_degraded = contextvars.ContextVar('degraded_providers', default=None)
+
+
+class CircuitBreaker:
+    """Skips a provider while most of its recent calls fail or come back empty.
+
+    Closed: calls go through and outcomes are recorded. Open: allow() returns False until
+    OPEN_SECONDS have passed. Half-open: one probe call is let through; a good answer
+    closes the breaker, anything else opens it again.
+    """
+
+    def __init__(self, name, window_size=WINDOW_SIZE, open_seconds=OPEN_SECONDS):
+        self.name = name
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self.outcomes = deque(maxlen=window_size)
+        self.opened_at = None
+        self.probing = False
+        self.probe_started = 0.0
+        self.lock = threading.Lock()
+        self.skipped = 0
+        self.times_opened = 0
+
+    def allow(self):
+        """Whether the provider should be called now; counts the call as skipped if not"""
+        with self.lock:
+            now = time.monotonic()
+            if self.state == OPEN and now - self.opened_at >= self.open_seconds:
+                self.state = HALF_OPEN
+                self.probing = False
+                logger.info(f"Circuit for {self.name} half-open, probing")
+            if self.state == CLOSED:
+                return True
+            # A probe that never reported back doesn't keep the provider shut forever
+            if self.state == HALF_OPEN and (not self.probing or now - self.probe_started >= self.open_seconds):
+                self.probing = True
+                self.probe_started = now
+                return True
+            self.skipped += 1
+        _note_degraded(self.name)
+        return False
+
+    def record_success(self):
+        self._record(SUCCESS)
+
+    def record_empty(self):
+        self._record(EMPTY)
+
+    def record_failure(self):
+        self._record(FAILURE)
+
+    def _record(self, outcome):
+        deadline = current_deadline()
+        if outcome != SUCCESS and deadline is not None and deadline.cancelled:
+            # A hedged call we cut short because the other one won; says nothing about the provider.
+            # Calls that merely ran out of time still count: a hung provider looks exactly like that.
+            return
+        if outcome != SUCCESS:
+            _note_degraded(self.name)
+        with self.lock:
+            if self.state == HALF_OPEN:
+                self.probing = False
+                if outcome == SUCCESS:
+                    self.state = CLOSED
+                    self.outcomes.clear()
+                    logger.info(f"Circuit for {self.name} closed again")
+                else:
+                    self._open(f"probe came back {outcome}")
+                return
+            if self.state == OPEN:
+                # A call that started before the breaker opened
+                return
+            self.outcomes.append(outcome)
+            calls = len(self.outcomes)
+            failures = self.outcomes.count(FAILURE)
+            empties = self.outcomes.count(EMPTY)
+            if calls >= MIN_CALLS and failures / calls >= FAILURE_RATE:
+                self._open(f"{failures} of the last {calls} calls failed")
+            elif calls >= EMPTY_MIN_CALLS and (failures + empties) / calls >= EMPTY_RATE:
+                self._open(f"{failures + empties} of the last {calls} calls found nothing")
+
+    def _open(self, reason):
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+        self.outcomes.clear()
+        logger.warning(f"Circuit for {self.name} opened for {self.open_seconds:.0f}s: {reason}")
+
+    def snapshot(self):
+        with self.lock:
+            state = self.state
+            if state == OPEN and time.monotonic() - self.opened_at >= self.open_seconds:
+                state = HALF_OPEN  # the next call will probe
+            return {
+                'state': state,
+                'recent_calls': len(self.outcomes),
+                'recent_failures': self.outcomes.count(FAILURE),
+                'recent_empty': self.outcomes.count(EMPTY),
+                'skipped': self.skipped,
+                'times_opened': self.times_opened
+            }
+
+
+def _note_degraded(name):
+    providers = _degraded.get()
+    if providers is not None:
+        providers.add(name)
+
+
+@contextmanager
+def track_degraded():
+    """Collect the providers that were skipped, failed or came back empty within the block.
+
+    Threads the block hands work to with a copy of its context report into the same set.
+    """
+    providers = set()
+    token = _degraded.set(providers)
+    try:
+        yield providers
+    finally:
+        _degraded.reset(token)
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name):
+    """Return the process-wide breaker for a provider"""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        return _breakers[name]
+
+
+def breaker_states():
+    """{provider: state} for every provider, for a result's data_quality"""
+    return {name: get_breaker(name).snapshot()['state'] for name in PROVIDERS}
+
+
+def breaker_stats():
+    return {name: get_breaker(name).snapshot() for name in PROVIDERS}
@@ -0,0 +1,2 @@
+# test_scraper.py and test_chrome.py are manual scripts that hit the network and need Chrome
+collect_ignore = ['test_scraper.py', 'test_chrome.py']
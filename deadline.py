@@ -0,0 +1,92 @@
+import os
+import time
+import contextvars
+from contextlib import contextmanager
+
+# Total time a company lookup may take unless the caller asks for something else
+DEFAULT_DEADLINE = float(os.environ.get('SCRAPER_DEADLINE_SECONDS', 30))
+# Callers may shorten or stretch the budget, but not beyond these bounds
+MIN_DEADLINE = 1
+MAX_DEADLINE = float(os.environ.get('SCRAPER_MAX_DEADLINE_SECONDS', 120))
+
+_current = contextvars.ContextVar('deadline', default=None)
+
+
+class DeadlineExceeded(Exception):
+    """The lookup's time budget ran out before this step could finish"""
+
+
+class Deadline:
+    def __init__(self, seconds, parent=None):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        self.parent = parent
+        if parent is not None:
+            self.expires_at = min(self.expires_at, parent.expires_at)
+        self._cancelled = False
+
+    def cancel(self):
+        """Expire now, so work running under this deadline stops at its next check"""
+        self._cancelled = True
+        self.expires_at = time.monotonic()
+
+    @property
+    def cancelled(self):
+        """Whether this deadline, or one it is nested in, was cancelled rather than run out"""
+        return self._cancelled or (self.parent is not None and self.parent.cancelled)
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self):
+        return time.monotonic() >= self.expires_at
+
+    def __repr__(self):
+        return f'Deadline({self.seconds}s, {self.remaining():.2f}s left)'
+
+
+def clamp_deadline(seconds, default=DEFAULT_DEADLINE, maximum=MAX_DEADLINE):
+    """A caller-supplied budget in seconds, bounded to what we allow; None gets the default"""
+    if seconds is None:
+        return default
+    return min(maximum, max(MIN_DEADLINE, float(seconds)))
+
+
+@contextmanager
+def deadline_scope(seconds):
+    """Run the block with a deadline that code below it, and threads it hands work to, can see.
+
+    The new deadline never outlasts an enclosing one, and cancelling it leaves the
+    enclosing one untouched.
+    """
+    deadline = Deadline(seconds, parent=_current.get())
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def current_deadline():
+    return _current.get()
+
+
+def check_deadline():
+    """Raise DeadlineExceeded if the current deadline has passed"""
+    deadline = _current.get()
+    if deadline is not None and deadline.expired:
+        raise DeadlineExceeded(f"Deadline of {deadline.seconds}s exceeded")
+
+
+def bounded_timeout(timeout):
+    """timeout shrunk to the time left before the current deadline.
+
+    Raises DeadlineExceeded when no time is left; None stays None outside a deadline.
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return timeout
+    check_deadline()
+    remaining = deadline.remaining()
+    return remaining if timeout is None else min(timeout, remaining)
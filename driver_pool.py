@@ -0,0 +1,184 @@
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger('DriverPool')
+
+# Pool sizing can be tuned per deployment without code changes
+DEFAULT_POOL_SIZE = int(os.environ.get('SCRAPER_DRIVER_POOL_SIZE', 2))
+DEFAULT_CHECKOUT_TIMEOUT = float(os.environ.get('SCRAPER_DRIVER_CHECKOUT_TIMEOUT', 30))
+DEFAULT_MAX_USES = int(os.environ.get('SCRAPER_DRIVER_MAX_USES', 50))
+DEFAULT_MAX_AGE = float(os.environ.get('SCRAPER_DRIVER_MAX_AGE', 30 * 60))
+# After Chrome fails to start with no session left, pause this long before trying again,
+# doubling on every further failure up to MAX_RETRY_AFTER
+DEFAULT_RETRY_AFTER = float(os.environ.get('SCRAPER_DRIVER_RETRY_AFTER', 30))
+MAX_RETRY_AFTER = float(os.environ.get('SCRAPER_DRIVER_MAX_RETRY_AFTER', 10 * 60))
+
+
+class _PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.monotonic()
+        self.uses = 0
+
+
+class DriverPool:
+    """Bounded pool of headless Chrome sessions that request threads check out and back in"""
+
+    def __init__(self, factory, size=DEFAULT_POOL_SIZE, checkout_timeout=DEFAULT_CHECKOUT_TIMEOUT,
+                 max_uses=DEFAULT_MAX_USES, max_age=DEFAULT_MAX_AGE, retry_after=DEFAULT_RETRY_AFTER):
+        self.factory = factory
+        self.size = max(0, size)
+        self.checkout_timeout = checkout_timeout
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.idle = []
+        self.in_use = {}
+        self.total = 0  # idle + checked out + being created
+        self.disabled = self.size == 0
+        self.retry_after = retry_after
+        self.retry_at = 0.0  # no new sessions are started before this, after failed creates
+        self.create_failures = 0
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def checkout(self, timeout=None):
+        """Return a healthy driver, or None if the browser is unavailable or none frees up in time"""
+        if timeout is None:
+            timeout = self.checkout_timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            with self.condition:
+                while True:
+                    if self.disabled or self.closed:
+                        return None
+                    if self.idle:
+                        entry = self.idle.pop()
+                        create = False
+                        break
+                    if self.total == 0 and time.monotonic() < self.retry_at:
+                        # Chrome just failed to start; don't make every caller wait on it again
+                        return None
+                    if self.total < self.size:
+                        self.total += 1
+                        entry = None
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.warning(f"Timed out after {timeout}s waiting for a Chrome session")
+                        return None
+                    self.condition.wait(remaining)
+
+            if create:
+                entry = self._create()
+                if entry is None:
+                    return None
+            elif not self._is_healthy(entry):
+                self._discard(entry)
+                continue
+
+            with self.condition:
+                entry.uses += 1
+                self.in_use[id(entry.driver)] = entry
+            return entry.driver
+
+    def checkin(self, driver, healthy=True):
+        """Return a driver to the pool, recycling it if it is broken, worn out or too old"""
+        if driver is None:
+            return
+        with self.condition:
+            entry = self.in_use.pop(id(driver), None)
+        if entry is None:
+            return
+
+        worn_out = entry.uses >= self.max_uses or time.monotonic() - entry.created_at >= self.max_age
+        if not healthy or worn_out or self.closed:
+            if worn_out:
+                logger.info(f"Recycling Chrome session after {entry.uses} uses")
+            self._discard(entry)
+            return
+
+        with self.condition:
+            self.idle.append(entry)
+            self.condition.notify()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Check out a driver for the duration of a with block; yields None when no browser is available"""
+        driver = self.checkout(timeout)
+        healthy = True
+        try:
+            yield driver
+        except WebDriverException:
+            # Parsing errors are the caller's problem, but a browser error may leave the session unusable
+            healthy = False
+            raise
+        finally:
+            self.checkin(driver, healthy)
+
+    def close(self):
+        """Quit every idle session; sessions still checked out are quit when they come back"""
+        with self.condition:
+            self.closed = True
+            entries = self.idle
+            self.idle = []
+            self.condition.notify_all()
+        for entry in entries:
+            self._discard(entry)
+
+    def stats(self):
+        with self.condition:
+            return {
+                'size': self.size,
+                'total': self.total,
+                'idle': len(self.idle),
+                'in_use': len(self.in_use),
+                'disabled': self.disabled,
+                'retry_in': round(max(0.0, self.retry_at - time.monotonic()), 1) if self.total == 0 else 0.0
+            }
+
+    def _create(self):
+        try:
+            driver = self.factory()
+        except Exception as e:
+            logger.error(f"Error creating Chrome session: {e}")
+            driver = None
+
+        if driver is None:
+            with self.condition:
+                self.total -= 1
+                # Without any working session there is no point in retrying on every checkout
+                if self.total == 0:
+                    self.create_failures += 1
+                    pause = min(MAX_RETRY_AFTER, self.retry_after * 2 ** (self.create_failures - 1))
+                    self.retry_at = time.monotonic() + pause
+                    logger.warning(f"Chrome sessions unavailable, browser pool paused for {pause:.0f}s")
+                self.condition.notify_all()
+            return None
+
+        with self.condition:
+            self.create_failures = 0
+        logger.info("Created new Chrome session for the pool")
+        return _PooledDriver(driver)
+
+    def _is_healthy(self, entry):
+        try:
+            entry.driver.current_url  # Test if session is valid
+            return True
+        except Exception as e:
+            logger.warning(f"Chrome session failed health check, replacing it: {e}")
+            return False
+
+    def _discard(self, entry):
+        try:
+            entry.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting Chrome session: {e}")
+        with self.condition:
+            self.total -= 1
+            self.condition.notify()
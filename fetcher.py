@@ -0,0 +1,176 @@
+import os
+import re
+import time
+import logging
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+from page_ready import wait_until_ready, DEFAULT_MAX_WAIT, PAGE_LOAD_TIMEOUT
+from render_profile import block_requests
+from deadline import bounded_timeout
+from html_parser import make_soup
+from http_client import get_http_client, MAX_PAGE_BYTES
+from http_cache import RENDERED_MAX_AGE
+
+logger = logging.getLogger('TieredFetcher')
+
+# Pages with less visible text than this are treated as client-rendered shells
+MIN_TEXT_LENGTH = 200
+# A SPA root or a noscript warning only marks a shell when the page is also fairly empty
+SHELL_TEXT_LENGTH = 1000
+SPA_ROOT_IDS = ['root', 'app', '__next', '__nuxt', '___gatsby', 'svelte', 'ember-app']
+NOSCRIPT_WARNINGS = ['enable javascript', 'javascript is disabled', 'javascript is required',
+                     'requires javascript', 'turn on javascript', 'javascript must be enabled']
+# Bot walls that a real browser usually gets through
+ESCALATE_STATUS_CODES = [403]
+
+# Domains whose tier we remember, and for how long; sites get rebuilt, so one remembered
+# as client-rendered is tried over plain HTTP again once its entry expires
+MAX_DOMAINS = int(os.environ.get('SCRAPER_TIER_MEMORY_SIZE', 5000))
+DOMAIN_TIER_TTL = float(os.environ.get('SCRAPER_TIER_TTL', 24 * 3600))
+
+HTTP_TIER = 'http'
+BROWSER_TIER = 'browser'
+
+
+class Page:
+    """HTML for a fetched URL and which tier produced it"""
+
+    def __init__(self, url, html, tier, status_code=200):
+        self.url = url
+        self.html = html
+        self.tier = tier
+        self.status_code = status_code
+
+    @property
+    def ok(self):
+        return self.status_code == 200
+
+
+class TieredFetcher:
+    """Fetch pages over plain HTTP and only escalate to Chrome when a page needs JavaScript"""
+
+    def __init__(self, driver_pool, http_client=None, max_domains=MAX_DOMAINS, tier_ttl=DOMAIN_TIER_TTL):
+        self.driver_pool = driver_pool
+        self.http = http_client or get_http_client()
+        self.max_domains = max_domains
+        self.tier_ttl = tier_ttl
+        self.domain_tiers = OrderedDict()  # domain -> (expires_at, tier that worked last time), least recently used first
+        self.lock = threading.Lock()
+
+    def fetch(self, url, source='website', headers=None):
+        """Return a Page for url, or None if neither tier could load it"""
+        domain = urlparse(url).netloc.lower()
+        tier = self._known(domain)
+
+        page = None
+        if tier != BROWSER_TIER:
+            page = self._fetch_http(url, headers)
+            if page and page.ok and not self.needs_javascript(page.html, source):
+                self._remember(domain, HTTP_TIER)
+                return page
+            if page and not page.ok and page.status_code not in ESCALATE_STATUS_CODES:
+                # Missing pages and server errors look the same in a browser
+                return page
+            if page and page.ok:
+                logger.info(f"{url} looks client-rendered, escalating to Chrome")
+                self._remember(domain, BROWSER_TIER)
+
+        browser_page = self._fetch_browser(url, source)
+        if browser_page:
+            return browser_page
+        if page is None and tier == BROWSER_TIER:
+            # Remembered as needing a browser, but none is available right now
+            page = self._fetch_http(url, headers)
+        # Without a browser a client-rendered shell is still better than nothing
+        return page
+
+    def known_tier(self, url):
+        """The tier that last worked for url's domain, or None if it hasn't been fetched yet"""
+        return self._known(urlparse(url).netloc.lower())
+
+    def needs_javascript(self, html, source='website'):
+        """Detect pages that only render their content client-side"""
+        soup = make_soup(html, source)
+        noscript_text = ' '.join(tag.get_text(' ').lower() for tag in soup.find_all('noscript'))
+        for tag in soup(['script', 'style', 'noscript', 'template']):
+            tag.decompose()
+
+        body = soup.body or soup
+        text_length = len(re.sub(r'\s+', ' ', body.get_text(' ')).strip())
+        if text_length < MIN_TEXT_LENGTH:
+            return True
+        if text_length < SHELL_TEXT_LENGTH:
+            if body.find(id=lambda i: i and i.lower() in SPA_ROOT_IDS):
+                return True
+            if any(warning in noscript_text for warning in NOSCRIPT_WARNINGS):
+                return True
+        return False
+
+    def _known(self, domain):
+        with self.lock:
+            entry = self.domain_tiers.get(domain)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self.domain_tiers[domain]
+                return None
+            self.domain_tiers.move_to_end(domain)
+            return entry[1]
+
+    def _remember(self, domain, tier):
+        with self.lock:
+            entry = self.domain_tiers.pop(domain, None)
+            if entry is None or entry[1] != tier:
+                logger.info(f"Using {tier} tier for {domain}")
+            self.domain_tiers[domain] = (time.monotonic() + self.tier_ttl, tier)
+            while len(self.domain_tiers) > self.max_domains:
+                self.domain_tiers.popitem(last=False)
+
+    def _fetch_http(self, url, headers=None):
+        try:
+            response = self.http.get(url, headers=headers, max_bytes=MAX_PAGE_BYTES)
+            return Page(response.url, response.text, HTTP_TIER, response.status_code)
+        except Exception as e:
+            logger.warning(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+    def _fetch_browser(self, url, source):
+        cache = self.http.cache
+        if cache:
+            # Rendered pages can't be revalidated, so reuse them only while they're young
+            entry = cache.get(url)
+            if entry and entry.meta.get('rendered') and entry.age < RENDERED_MAX_AGE:
+                logger.info(f"Using cached rendering of {url}")
+                return Page(entry.meta.get('final_url') or url, entry.body.decode('utf-8'), BROWSER_TIER)
+
+        scheduler = self.http.scheduler
+        if scheduler and not scheduler.allowed(url):
+            logger.info(f"robots.txt disallows {url}, not loading it in Chrome")
+            return None
+
+        # Errors are caught outside the with block so the pool sees them first and
+        # replaces a session a WebDriverException may have left unusable
+        try:
+            # Waiting for a free Chrome session counts against the lookup's deadline too
+            with self.driver_pool.driver(timeout=bounded_timeout(self.driver_pool.checkout_timeout)) as driver:
+                if not driver:
+                    return None
+                # Ads, trackers and heavy resources are cut off; stylesheets only load for sources that need them
+                block_requests(driver, source)
+                # Navigations count against the host's budget just like plain GETs
+                with self.http.slot(url, robots=False):
+                    # Neither the navigation nor the wait for content may outlast the lookup's deadline
+                    driver.set_page_load_timeout(bounded_timeout(PAGE_LOAD_TIMEOUT))
+                    driver.get(url)
+                    wait_until_ready(driver, source, max_wait=bounded_timeout(DEFAULT_MAX_WAIT))
+                # The DOM is already in memory, but parsing it all is what gets expensive
+                page = Page(driver.current_url, driver.page_source[:MAX_PAGE_BYTES], BROWSER_TIER)
+        except Exception as e:
+            logger.error(f"Browser fetch failed for {url}: {e}")
+            return None
+
+        if cache:
+            cache.put(url, page.html.encode('utf-8'), rendered=True, final_url=page.url)
+        return page
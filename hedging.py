@@ -0,0 +1,236 @@
+import os
+import time
+import logging
+import threading
+import contextvars
+from collections import deque
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from deadline import deadline_scope, bounded_timeout, current_deadline, DeadlineExceeded, DEFAULT_DEADLINE
+
+logger = logging.getLogger('Hedging')
+
+# The alternate starts once the primary is slower than this share of its recent calls
+HEDGE_PERCENTILE = float(os.environ.get('SCRAPER_HEDGE_PERCENTILE', 0.9))
+# Used until a primary has enough history for a percentile to mean anything
+DEFAULT_HEDGE_DELAY = float(os.environ.get('SCRAPER_HEDGE_DELAY', 2.0))
+MIN_HEDGE_DELAY = 0.1
+MIN_SAMPLES = 10
+LATENCY_WINDOW = 200
+# Threads per provider. Cancelling a hedge is cooperative, so a call hung in a library we
+# can't time out keeps its thread; separate pools keep that from starving other providers.
+PROVIDER_WORKERS = int(os.environ.get('SCRAPER_HEDGE_PROVIDER_WORKERS', 8))
+
+PRIMARY = 'primary'
+ALTERNATE = 'alternate'
+
+
+class LatencyTracker:
+    """Recent latencies of one provider, for picking the moment to hedge"""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.samples = deque(maxlen=window)
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.hedged = 0
+        self.unstarted = 0
+        self.wins = {PRIMARY: 0, ALTERNATE: 0}
+
+    def record(self, seconds):
+        with self.lock:
+            self.samples.append(seconds)
+
+    def percentile(self, fraction):
+        with self.lock:
+            if len(self.samples) < MIN_SAMPLES:
+                return None
+            ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def hedge_delay(self):
+        observed = self.percentile(HEDGE_PERCENTILE)
+        return DEFAULT_HEDGE_DELAY if observed is None else max(MIN_HEDGE_DELAY, observed)
+
+    def count(self, hedged, winner, unstarted=0):
+        with self.lock:
+            self.calls += 1
+            self.hedged += int(hedged)
+            self.unstarted += unstarted
+            if winner:
+                self.wins[winner] += 1
+
+    def stats(self):
+        p50 = self.percentile(0.5)
+        p90 = self.percentile(0.9)
+        with self.lock:
+            return {
+                'calls': self.calls,
+                'hedged': self.hedged,
+                'unstarted': self.unstarted,
+                'primary_wins': self.wins[PRIMARY],
+                'alternate_wins': self.wins[ALTERNATE],
+                'samples': len(self.samples),
+                'p50_ms': None if p50 is None else int(p50 * 1000),
+                'p90_ms': None if p90 is None else int(p90 * 1000)
+            }
+
+
+class _ProviderPool:
+    """Threads for one provider's calls; a call is refused rather than queued when all are busy"""
+
+    def __init__(self, provider, workers=PROVIDER_WORKERS):
+        self.provider = provider
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f'hedge-{provider}')
+        self.free = threading.BoundedSemaphore(workers)
+
+    def submit(self, func):
+        if not self.free.acquire(blocking=False):
+            return None
+
+        def run():
+            try:
+                return func()
+            finally:
+                self.free.release()
+
+        future = self.executor.submit(run)
+        # A call cancelled before it started never runs, so its worker is handed back here
+        future.add_done_callback(lambda done: done.cancelled() and self.free.release())
+        return future
+
+
+_trackers = {}
+_pools = {}
+_registry_lock = threading.Lock()
+
+
+def get_latency_tracker(name):
+    with _registry_lock:
+        if name not in _trackers:
+            _trackers[name] = LatencyTracker()
+        return _trackers[name]
+
+
+def hedge_stats():
+    with _registry_lock:
+        names = list(_trackers)
+    return {name: get_latency_tracker(name).stats() for name in names}
+
+
+def _get_pool(provider):
+    with _registry_lock:
+        if provider not in _pools:
+            _pools[provider] = _ProviderPool(provider)
+        return _pools[provider]
+
+
+class _Branch:
+    def __init__(self, role, func, tracker):
+        self.role = role
+        self.func = func
+        self.tracker = tracker
+        self.deadline = None
+        self.future = None
+        self.started = None
+        self.cancelled = False
+        self.recorded = False
+        self.lock = threading.Lock()
+
+    def run(self):
+        outer = current_deadline()
+        self.started = time.monotonic()
+        # Each branch gets its own deadline so the loser can be cancelled on its own
+        with deadline_scope(outer.remaining() if outer else DEFAULT_DEADLINE) as deadline:
+            self.deadline = deadline
+            if self.cancelled:
+                deadline.cancel()
+            try:
+                result = self.func()
+            except Exception as e:
+                logger.warning(f"Hedged {self.role} call failed: {e}")
+                result = None
+        self._record_latency()
+        return result
+
+    def cancel(self):
+        self.future.cancel()
+        # A primary that lost is at least this slow; dropping it would drag the p90 down
+        self._record_latency()
+        self.cancelled = True
+        if self.deadline is not None:
+            self.deadline.cancel()
+
+    def _record_latency(self):
+        with self.lock:
+            # One sample per call, from whichever of run() and cancel() gets here first
+            if self.role != PRIMARY or self.started is None or self.recorded:
+                return
+            self.recorded = True
+            self.tracker.record(time.monotonic() - self.started)
+
+
+def hedged_call(name, primary, alternate, usable=bool, providers=None):
+    """Call primary, and alternate too if primary hasn't answered by its p90 latency.
+
+    Returns the first result that usable() accepts, cancelling the other call: its
+    deadline is expired, so it stops at its next request, retry or rate-limit wait.
+    If neither result is usable the primary's is returned. Both run in a copy of the
+    caller's context, so they share its deadline.
+
+    providers names the (primary, alternate) upstreams; each has its own pool of threads,
+    and a call whose pool is full of stuck calls is skipped instead of waited for.
+    """
+    tracker = get_latency_tracker(name)
+    providers = providers or (f'{name}_{PRIMARY}', f'{name}_{ALTERNATE}')
+    pools = {PRIMARY: _get_pool(providers[0]), ALTERNATE: _get_pool(providers[1])}
+    branches = {}
+    started = set()
+    unstarted = []
+
+    def start(role, func):
+        started.add(role)
+        branch = _Branch(role, func, tracker)
+        future = pools[role].submit(partial(contextvars.copy_context().run, branch.run))
+        if future is None:
+            logger.warning(f"{name}: every {pools[role].provider} worker is stuck in a call, skipping the {role}")
+            unstarted.append(role)
+            return None
+        branch.future = future
+        branches[future] = branch
+        return future
+
+    primary_future = start(PRIMARY, primary)
+    pending = {primary_future} if primary_future else set()
+    done = set()
+    results = {}
+    winner = None
+    try:
+        if pending:
+            delay = tracker.hedge_delay()
+            done, pending = wait(pending, timeout=bounded_timeout(delay))
+            if not done:
+                logger.info(f"{name}: primary slower than {delay:.2f}s, hedging")
+        while True:
+            for future in done:
+                branch = branches[future]
+                results[branch.role] = future.result()
+                if usable(results[branch.role]):
+                    winner = branch.role
+                    return results[branch.role]
+            if ALTERNATE not in started:
+                # Primary is slow, couldn't start, or answered with nothing usable
+                alternate_future = start(ALTERNATE, alternate)
+                if alternate_future:
+                    pending.add(alternate_future)
+            if not pending:
+                return results.get(PRIMARY)
+            done, pending = wait(pending, timeout=bounded_timeout(None), return_when=FIRST_COMPLETED)
+            if not done:
+                return results.get(PRIMARY)
+    except DeadlineExceeded:
+        return results.get(PRIMARY)
+    finally:
+        for future in pending:
+            branches[future].cancel()
+        tracker.count(ALTERNATE in started, winner, len(unstarted))
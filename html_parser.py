@@ -0,0 +1,85 @@
+import os
+import re
+import logging
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+logger = logging.getLogger('HtmlParser')
+
+# 'auto' picks the first one that is installed. lxml is opt-in through SCRAPER_HTML_PARSER
+# until bench_html_parser.py has compared it with html.parser on real saved pages.
+PREFERRED_BACKENDS = ['html.parser']
+FALLBACK_BACKEND = 'html.parser'
+
+# SCRAPER_HTML_PARSER sets the backend for every source, SCRAPER_HTML_PARSER_<SOURCE> overrides one source
+DEFAULT_BACKEND = os.environ.get('SCRAPER_HTML_PARSER', 'auto')
+SOURCE_BACKENDS = {
+    'website': 'auto',
+    'wikipedia': 'auto',
+    'yahoo_lookup': 'auto',
+    'yahoo_quote': 'auto',
+    'news': 'auto'
+}
+
+# Set SCRAPER_BOUNDED_PARSING=0 to parse pages exactly as downloaded
+BOUNDED_PARSING = os.environ.get('SCRAPER_BOUNDED_PARSING', '1') != '0'
+# Inline scripts, styles and SVG are often most of a page's bytes and we never read them.
+# The lookahead keeps custom elements such as <svg-icon> from matching, and a
+# self-closing <svg/> has no body to remove.
+HEAVY_CONTENT = re.compile(r'<(script|style|svg)(?=[\s/>])[^>]*(?<!/)>.*?</\1\s*>|<!--.*?-->', re.IGNORECASE | re.DOTALL)
+
+
+def _classes(attrs):
+    # While parsing, class is still the raw attribute string
+    value = attrs.get('class') or ''
+    return value.split() if isinstance(value, str) else value
+
+
+# Regions to build trees for when a source only needs part of the page
+WIKIPEDIA_CONTENT = SoupStrainer(id='mw-content-text')
+YAHOO_LOOKUP_TABLE = SoupStrainer('table', attrs={'data-test': 'lookup-table'})
+YAHOO_QUOTE_FIELDS = SoupStrainer(lambda name, attrs: name == 'td' or 'data-field' in attrs)
+BING_NEWS_CARDS = SoupStrainer(lambda name, attrs: 'news-card' in _classes(attrs))
+
+_warned = set()
+
+
+def backend_available(backend):
+    return builder_registry.lookup(backend) is not None
+
+
+def available_backends():
+    return [backend for backend in ['lxml', 'html5lib', 'html.parser'] if backend_available(backend)]
+
+
+def parser_for(source='website'):
+    """Name of the tree builder to use for pages from this source"""
+    backend = os.environ.get(f'SCRAPER_HTML_PARSER_{source.upper()}')
+    if not backend:
+        backend = DEFAULT_BACKEND if DEFAULT_BACKEND != 'auto' else SOURCE_BACKENDS.get(source, 'auto')
+    if backend == 'auto':
+        return next(backend for backend in PREFERRED_BACKENDS if backend_available(backend))
+    if not backend_available(backend):
+        if backend not in _warned:
+            _warned.add(backend)
+            logger.warning(f"HTML parser backend {backend} is not installed, using {FALLBACK_BACKEND}")
+        return FALLBACK_BACKEND
+    return backend
+
+
+def strip_heavy_content(html):
+    """Drop script, style and svg elements and comments before they reach the parser"""
+    return HEAVY_CONTENT.sub('', html)
+
+
+def make_soup(html, source='website', parse_only=None, **kwargs):
+    """Parse html with the backend configured for source.
+
+    In bounded mode script/style/svg content is skipped, and parse_only restricts the
+    tree to the region the caller needs (one of the strainers above).
+    """
+    if not BOUNDED_PARSING:
+        return BeautifulSoup(html, parser_for(source), **kwargs)
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    return BeautifulSoup(strip_heavy_content(html), parser_for(source), parse_only=parse_only, **kwargs)
@@ -0,0 +1,171 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+
+logger = logging.getLogger('HttpCache')
+
+# Set SCRAPER_HTTP_CACHE_DIR to an empty string to disable the disk cache
+DEFAULT_CACHE_DIR = os.environ.get('SCRAPER_HTTP_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.http_cache'))
+DEFAULT_MAX_BYTES = int(os.environ.get('SCRAPER_HTTP_CACHE_BYTES', 200 * 1024 * 1024))
+# Browser-rendered pages have no validators to revalidate with, so they are reused for a short while only
+RENDERED_MAX_AGE = float(os.environ.get('SCRAPER_RENDERED_CACHE_MAX_AGE', 15 * 60))
+# Evict down to this fraction of the cap so we don't rescan the directory on every write
+EVICT_TO = 0.9
+
+
+class CacheEntry:
+    def __init__(self, url, body, meta):
+        self.url = url
+        self.body = body
+        self.meta = meta
+
+    @property
+    def etag(self):
+        return self.meta.get('etag')
+
+    @property
+    def last_modified(self):
+        return self.meta.get('last_modified')
+
+    @property
+    def age(self):
+        return time.time() - self.meta.get('stored_at', 0)
+
+
+class DiskCache:
+    """Size-bounded on-disk store of fetched bodies keyed by URL, with their validators"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.size = None  # computed lazily from the directory
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, url):
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url:
+            return None
+        # Reads count as use for LRU eviction
+        self._touch(body_path, meta_path)
+        return CacheEntry(url, body, meta)
+
+    def put(self, url, body, **meta):
+        """Store body for url; meta holds validators and anything needed to rebuild the response"""
+        if len(body) > self.max_bytes:
+            return
+        body_path, meta_path = self._paths(url)
+        meta['url'] = url
+        meta['stored_at'] = time.time()
+        try:
+            os.makedirs(os.path.dirname(body_path), exist_ok=True)
+            old_size = self._file_size(body_path) + self._file_size(meta_path)
+            self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+            new_size = self._file_size(body_path) + self._file_size(meta_path)
+        except OSError as e:
+            logger.warning(f"Could not cache {url}: {e}")
+            return
+        with self.lock:
+            if self.size is not None:
+                self.size += new_size - old_size
+        self._evict_if_needed()
+
+    def refresh(self, url, entry):
+        """Mark an entry as freshly validated after a 304; only its metadata is rewritten"""
+        body_path, meta_path = self._paths(url)
+        meta = dict(entry.meta, url=url, stored_at=time.time())
+        try:
+            old_size = self._file_size(meta_path)
+            self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+            new_size = self._file_size(meta_path)
+        except OSError as e:
+            logger.warning(f"Could not refresh cached {url}: {e}")
+            return
+        entry.meta = meta
+        self._touch(body_path)
+        with self.lock:
+            if self.size is not None:
+                self.size += new_size - old_size
+
+    def _paths(self, url):
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, digest[:2], digest)
+        return base + '.body', base + '.json'
+
+    def _write_atomic(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _touch(self, *paths):
+        for path in paths:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+    def _file_size(self, path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def _scan(self):
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _evict_if_needed(self):
+        with self.lock:
+            if self.size is None:
+                self.size = sum(size for _, size, _ in self._scan())
+            if self.size <= self.max_bytes:
+                return
+
+            # Least recently used first; a body and its metadata share a stem and go together
+            entries = {}
+            for mtime, size, path in self._scan():
+                stem = os.path.splitext(path)[0]
+                last_used, total, paths = entries.get(stem, (0, 0, []))
+                entries[stem] = (max(last_used, mtime), total + size, paths + [path])
+
+            target = self.max_bytes * EVICT_TO
+            removed = 0
+            for last_used, total, paths in sorted(entries.values()):
+                if self.size <= target:
+                    break
+                for path in paths:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                self.size -= total
+                removed += 1
+            logger.info(f"Evicted {removed} cached responses, cache now {self.size} bytes")
@@ -0,0 +1,214 @@
+import os
+import time
+import random
+import logging
+import threading
+import requests
+from contextlib import nullcontext
+from requests.adapters import HTTPAdapter
+
+from http_cache import DiskCache, DEFAULT_CACHE_DIR
+from politeness import PolitenessScheduler, ROBOTS_TIMEOUT
+from deadline import bounded_timeout, current_deadline
+
+logger = logging.getLogger('HttpClient')
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+# Fail fast on hosts that don't answer, but give slow pages time to arrive
+CONNECT_TIMEOUT = float(os.environ.get('SCRAPER_HTTP_CONNECT_TIMEOUT', 3.05))
+READ_TIMEOUT = float(os.environ.get('SCRAPER_HTTP_READ_TIMEOUT', 10))
+MAX_RETRIES = int(os.environ.get('SCRAPER_HTTP_MAX_RETRIES', 2))
+BACKOFF_BASE = 0.5  # seconds, doubled on every retry
+MAX_BACKOFF = 8
+# Number of hosts to keep connection pools for, and connections kept per host
+POOL_HOSTS = int(os.environ.get('SCRAPER_HTTP_POOL_HOSTS', 20))
+POOL_PER_HOST = int(os.environ.get('SCRAPER_HTTP_POOL_PER_HOST', 8))
+# Pages are cut off here; everything we scrape sits well within the first couple of megabytes
+MAX_PAGE_BYTES = int(os.environ.get('SCRAPER_MAX_PAGE_BYTES', 2 * 1024 * 1024))
+READ_CHUNK_SIZE = 64 * 1024
+
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+# Statuses that mean the host wants everyone to slow down, not just this request
+THROTTLE_STATUS_CODES = [429, 503]
+
+
+class HttpClient:
+    """Keep-alive HTTP session shared by every scraper, with default headers, retried GETs and per-host pacing"""
+
+    def __init__(self, pool_hosts=POOL_HOSTS, pool_per_host=POOL_PER_HOST, max_retries=MAX_RETRIES, cache=None, polite=True):
+        self.max_retries = max_retries
+        self.cache = cache
+        self.scheduler = PolitenessScheduler(fetch_robots=self._fetch_robots) if polite else None
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        # pool_block caps concurrent connections per host instead of opening throwaway extras
+        adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_per_host, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, url, headers=None, timeout=None, retries=None, max_bytes=None, robots=True, **kwargs):
+        """GET url, revalidating against the disk cache when there is a cached copy.
+
+        With max_bytes the body is streamed and cut off after that many bytes; such
+        responses have response.truncated set and are never cached. Requests are paced
+        per host, and raise RobotsDisallowed for pages robots.txt rules out unless
+        robots is false (for APIs, which robots.txt doesn't speak for).
+        """
+        # Only plain GETs of a complete URL map cleanly onto a cache key
+        use_cache = self.cache is not None and not kwargs.get('params') and not kwargs.get('stream')
+        entry = self.cache.get(url) if use_cache else None
+        if entry and (entry.etag or entry.last_modified):
+            headers = dict(headers or {})
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        if max_bytes:
+            kwargs['stream'] = True
+        with self.slot(url, robots):
+            response = self._get_with_retries(url, headers, timeout, retries, **kwargs)
+            response.from_cache = False
+            response.truncated = False
+            if max_bytes:
+                self._read_capped(response, max_bytes)
+
+        if response.status_code == 304 and entry:
+            logger.info(f"Not modified, reusing cached body for {url}")
+            self.cache.refresh(url, entry)
+            return self._cached_response(response, entry)
+        if use_cache and response.status_code == 200 and not response.truncated:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            # Without validators we couldn't tell when the copy goes stale
+            if etag or last_modified:
+                self.cache.put(url, response.content, etag=etag, last_modified=last_modified,
+                               final_url=response.url, encoding=response.encoding,
+                               content_type=response.headers.get('Content-Type'))
+        return response
+
+    def _get_with_retries(self, url, headers=None, timeout=None, retries=None, **kwargs):
+        """GET url, retrying connection errors, timeouts and retryable statuses with jittered backoff"""
+        if timeout is None:
+            timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+        if retries is None:
+            retries = self.max_retries
+
+        attempt = 0
+        while True:
+            try:
+                response = self.session.get(url, headers=headers, timeout=self._bounded(timeout), **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self._backoff(attempt)
+                if attempt >= retries or not self._time_for_retry(delay):
+                    raise
+                logger.warning(f"GET {url} failed ({e}), retrying in {delay:.2f}s")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= retries:
+                    return response
+                delay = self._retry_after(response) or self._backoff(attempt)
+                if not self._time_for_retry(delay):
+                    return response
+                logger.warning(f"GET {url} returned {response.status_code}, retrying in {delay:.2f}s")
+                if self.scheduler and response.status_code in THROTTLE_STATUS_CODES:
+                    # Other requests to this host would only earn the same answer
+                    self.scheduler.back_off(url, delay)
+                response.close()
+            time.sleep(delay)
+            if self.scheduler:
+                self.scheduler.throttle(url)
+            attempt += 1
+
+    def slot(self, url, robots=True):
+        """Context manager pacing one request to url's host; the browser tier uses it too"""
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.slot(url, robots)
+
+    def throttle(self, url):
+        """Wait for a turn at url's host without holding a slot, for requests we can't time out"""
+        if self.scheduler is not None:
+            self.scheduler.throttle(url)
+
+    def allowed(self, url):
+        """Whether robots.txt lets us fetch url, for requests made outside get()"""
+        return self.scheduler is None or self.scheduler.allowed(url)
+
+    def close(self):
+        self.session.close()
+
+    def _fetch_robots(self, url):
+        response = self.session.get(url, timeout=(CONNECT_TIMEOUT, ROBOTS_TIMEOUT))
+        return response.status_code, response.text
+
+    def _read_capped(self, response, max_bytes):
+        chunks = []
+        size = 0
+        try:
+            for chunk in response.iter_content(READ_CHUNK_SIZE):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= max_bytes:
+                    response.truncated = size > max_bytes or bool(response.raw.read(1))
+                    break
+        finally:
+            # Drops the connection if we stopped early, rather than draining a huge body
+            response.close()
+        response._content = b''.join(chunks)[:max_bytes]
+        response._content_consumed = True
+        if response.truncated:
+            logger.warning(f"Response from {response.url} exceeded {max_bytes} bytes, truncated")
+
+    def _cached_response(self, response, entry):
+        # Turn the 304 into the 200 the caller would have got, with the stored body
+        response.status_code = 200
+        response._content = entry.body
+        response.encoding = entry.meta.get('encoding')
+        response.url = entry.meta.get('final_url') or response.url
+        if entry.meta.get('content_type'):
+            response.headers['Content-Type'] = entry.meta['content_type']
+        response.from_cache = True
+        return response
+
+    def _bounded(self, timeout):
+        # Neither the connect nor the read timeout may outlast the lookup's deadline
+        if isinstance(timeout, tuple):
+            return tuple(bounded_timeout(part) for part in timeout)
+        return bounded_timeout(timeout)
+
+    def _time_for_retry(self, delay):
+        deadline = current_deadline()
+        return deadline is None or deadline.remaining() > delay
+
+    def _backoff(self, attempt):
+        # Full jitter keeps concurrent retries against the same host from lining up
+        return random.uniform(0, min(MAX_BACKOFF, BACKOFF_BASE * (2 ** attempt)))
+
+    def _retry_after(self, response):
+        value = response.headers.get('Retry-After')
+        if value and value.isdigit():
+            return min(MAX_BACKOFF, int(value))
+        return None
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client():
+    """Return the process-wide HttpClient so every caller reuses the same warm connections"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            cache = None
+            if DEFAULT_CACHE_DIR:
+                try:
+                    cache = DiskCache()
+                except OSError as e:
+                    logger.warning(f"HTTP disk cache disabled: {e}")
+            _shared_client = HttpClient(cache=cache)
+        return _shared_client
@@ -0,0 +1,176 @@
+import os
+import time
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from deadline import clamp_deadline
+
+logger = logging.getLogger('Jobs')
+
+DEFAULT_WORKERS = int(os.environ.get('SCRAPER_JOB_WORKERS', 4))
+DEFAULT_MAX_JOBS = int(os.environ.get('SCRAPER_JOB_STORE_SIZE', 1000))
+# How long a finished job's result stays available for polling
+DEFAULT_JOB_TTL = float(os.environ.get('SCRAPER_JOB_TTL', 60 * 60))
+# Jobs exist for lookups too slow to wait on, so they get a longer budget than requests
+DEFAULT_JOB_DEADLINE = float(os.environ.get('SCRAPER_JOB_DEADLINE_SECONDS', 120))
+MAX_JOB_DEADLINE = float(os.environ.get('SCRAPER_MAX_JOB_DEADLINE_SECONDS', 600))
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class JobStoreFull(Exception):
+    """Raised when every slot in the store holds a job that hasn't finished yet"""
+
+
+class Job:
+    def __init__(self, company_name, website, refresh=False):
+        self.id = uuid.uuid4().hex
+        self.company_name = company_name
+        self.website = website
+        self.refresh = refresh
+        self.status = QUEUED
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.expires_at = None
+        self.result = None
+        self.error = None
+        # Sources we expect to run; finance only runs once the company has been verified
+        self.progress = {}
+        if website:
+            self.progress['website'] = 'pending'
+        if company_name:
+            self.progress.update({'wikipedia': 'pending', 'finance': 'pending', 'news': 'pending'})
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+    def to_dict(self):
+        data = {
+            'job_id': self.id,
+            'status': self.status,
+            'name': self.company_name,
+            'website': self.website,
+            'progress': dict(self.progress),
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+        if self.status == DONE:
+            data['result'] = self.result
+        if self.status == FAILED:
+            data['error'] = self.error
+        return data
+
+
+class JobStore:
+    """Bounded store of jobs; finished jobs expire after ttl and are evicted oldest first"""
+
+    def __init__(self, max_jobs=DEFAULT_MAX_JOBS, ttl=DEFAULT_JOB_TTL):
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self.jobs = OrderedDict()  # job id -> Job, in creation order
+        self.lock = threading.Lock()
+
+    def add(self, job):
+        with self.lock:
+            self._expire()
+            if len(self.jobs) >= self.max_jobs:
+                # Make room by dropping the oldest finished job; unfinished ones are never dropped
+                oldest = next((job_id for job_id, j in self.jobs.items() if j.finished), None)
+                if oldest is None:
+                    raise JobStoreFull(f"{len(self.jobs)} jobs are still pending")
+                del self.jobs[oldest]
+            self.jobs[job.id] = job
+
+    def get(self, job_id):
+        with self.lock:
+            self._expire()
+            job = self.jobs.get(job_id)
+            return job.to_dict() if job else None
+
+    def update(self, job_id, **changes):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return
+            progress = changes.pop('progress', None)
+            if progress:
+                job.progress.update(progress)
+            for key, value in changes.items():
+                setattr(job, key, value)
+            if job.finished and job.expires_at is None:
+                job.expires_at = time.monotonic() + self.ttl
+
+    def stats(self):
+        with self.lock:
+            counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+            for job in self.jobs.values():
+                counts[job.status] += 1
+            return {'jobs': len(self.jobs), 'max_jobs': self.max_jobs, 'ttl': self.ttl, **counts}
+
+    def _expire(self):
+        now = time.monotonic()
+        expired = [job_id for job_id, job in self.jobs.items() if job.expires_at is not None and job.expires_at <= now]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+
+class JobManager:
+    """Run scrape_company lookups on a background worker pool and track them in a JobStore"""
+
+    def __init__(self, scraper, workers=DEFAULT_WORKERS, store=None):
+        self.scraper = scraper
+        self.store = store or JobStore()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='job')
+
+    def submit(self, company_name, website=None, refresh=False, deadline=None):
+        """Queue a lookup and return its job id straight away; raises JobStoreFull when saturated.
+
+        deadline is the lookup's budget in seconds once it starts running, up to MAX_JOB_DEADLINE.
+        """
+        job = Job(company_name, website, refresh)
+        self.store.add(job)
+        deadline = clamp_deadline(deadline, default=DEFAULT_JOB_DEADLINE, maximum=MAX_JOB_DEADLINE)
+        self.executor.submit(self._run, job.id, company_name, website, refresh, deadline)
+        logger.info(f"Queued job {job.id} for {company_name} ({website})")
+        return job.id
+
+    def get(self, job_id):
+        return self.store.get(job_id)
+
+    def stats(self):
+        return self.store.stats()
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+    def _run(self, job_id, company_name, website, refresh, deadline=None):
+        self.store.update(job_id, status=RUNNING, started_at=time.time())
+
+        reported = []
+
+        def on_source(name, partial):
+            reported.append(name)
+            self.store.update(job_id, progress={name: DONE})
+
+        try:
+            result = self.scraper.scrape_company(company_name, website, refresh=refresh, on_source=on_source,
+                                                 deadline=deadline, max_deadline=MAX_JOB_DEADLINE)
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            self.store.update(job_id, status=FAILED, error=str(e), finished_at=time.time())
+            return
+
+        # Sources that never reported either weren't needed or the whole result came from the cache
+        job = self.store.get(job_id) or {}
+        remaining = 'skipped' if reported else 'cached'
+        progress = {name: remaining for name, state in job.get('progress', {}).items() if state == 'pending'}
+        self.store.update(job_id, status=DONE, result=result, finished_at=time.time(), progress=progress)
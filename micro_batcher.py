@@ -0,0 +1,121 @@
+import logging
+import threading
+from contextlib import nullcontext
+from concurrent.futures import Future
+
+from deadline import current_deadline, deadline_scope
+
+logger = logging.getLogger('MicroBatcher')
+
+
+class MicroBatcher:
+    """Collect individual key requests for a short window and fetch them with one batched call.
+
+    fetch_batch(keys) must return a dict of key -> value; keys it leaves out resolve to None.
+    A batch is sent when max_batch keys are waiting or max_wait seconds after the first one
+    arrived, whichever comes first. Concurrent requests for the same key share one future.
+
+    With incremental, fetch_batch(keys, resolve) also gets resolve(key, value) to hand a
+    value to its waiting callers before the rest of the batch is done. A batch runs until
+    the latest deadline of the callers in it, and for at most max_time seconds.
+    """
+
+    def __init__(self, fetch_batch, max_batch=50, max_wait=0.05, name='batch', incremental=False, max_time=None):
+        self.fetch_batch = fetch_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.name = name
+        self.incremental = incremental
+        self.max_time = max_time
+        self.pending = {}  # key -> Future, waiting for the next batch
+        self.deadlines = []  # deadlines of the callers waiting for the next batch, None if unbounded
+        self.timer = None
+        self.lock = threading.Lock()
+        self.batches = 0
+        self.requests = 0
+
+    def submit(self, key):
+        """Queue key for the next batch and return a Future for its value"""
+        deadline = current_deadline()
+        with self.lock:
+            self.requests += 1
+            self.deadlines.append(deadline)
+            future = self.pending.get(key)
+            if future is not None:
+                return future
+            future = Future()
+            self.pending[key] = future
+            if len(self.pending) >= self.max_batch:
+                taken = self._take()
+            else:
+                taken = None
+                if self.timer is None:
+                    self.timer = threading.Timer(self.max_wait, self.flush)
+                    self.timer.daemon = True
+                    self.timer.start()
+        if taken:
+            # A full batch goes out straight away on the caller's thread
+            self._run(taken)
+        return future
+
+    def get_many(self, keys, timeout=None):
+        futures = {key: self.submit(key) for key in keys}
+        return {key: future.result(timeout) for key, future in futures.items()}
+
+    def flush(self):
+        with self.lock:
+            taken = self._take()
+        if taken[0]:
+            self._run(taken)
+
+    def stats(self):
+        with self.lock:
+            return {'requests': self.requests, 'batches': self.batches, 'pending': len(self.pending)}
+
+    def _take(self):
+        batch = self.pending
+        deadlines = self.deadlines
+        self.pending = {}
+        self.deadlines = []
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if batch:
+            self.batches += 1
+        return batch, deadlines
+
+    def _scope(self, deadlines):
+        # The timer thread has no deadline of its own. Borrow the most patient caller's, so
+        # one hurried caller can't cut the batch short for everyone else; each caller still
+        # stops waiting on its own future when its own deadline passes.
+        budget = None
+        if deadlines and None not in deadlines:
+            budget = max(deadline.remaining() for deadline in deadlines)
+        if self.max_time is not None:
+            budget = self.max_time if budget is None else min(budget, self.max_time)
+        return deadline_scope(budget) if budget is not None else nullcontext()
+
+    def _run(self, taken):
+        batch, deadlines = taken
+        keys = list(batch)
+        logger.info(f"Fetching {self.name} batch of {len(keys)}")
+
+        def resolve(key, value):
+            future = batch.get(key)
+            if future is not None and not future.done():
+                future.set_result(value)
+
+        try:
+            with self._scope(deadlines):
+                if self.incremental:
+                    values = self.fetch_batch(keys, resolve) or {}
+                else:
+                    values = self.fetch_batch(keys) or {}
+        except Exception as e:
+            logger.error(f"{self.name} batch of {len(keys)} failed: {e}")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key in keys:
+            resolve(key, values.get(key))
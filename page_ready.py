@@ -0,0 +1,48 @@
+import os
+import logging
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+logger = logging.getLogger('PageReady')
+
+# Upper bound on how long to wait for any single page, in seconds
+DEFAULT_MAX_WAIT = float(os.environ.get('SCRAPER_PAGE_MAX_WAIT', 10))
+# 'eager' returns from driver.get() at DOMContentLoaded instead of waiting for every image and script
+PAGE_LOAD_STRATEGY = os.environ.get('SCRAPER_PAGE_LOAD_STRATEGY', 'eager')
+# Longest a single navigation may take before driver.get() gives up
+PAGE_LOAD_TIMEOUT = float(os.environ.get('SCRAPER_PAGE_LOAD_TIMEOUT', 30))
+POLL_FREQUENCY = 0.1
+
+# Element that only exists once the content we scrape from each source has rendered.
+# Sources without an entry (e.g. company websites) wait for document.readyState instead.
+READY_SELECTORS = {
+    'wikipedia': '#mw-content-text',
+    'yahoo_lookup': 'table[data-test="lookup-table"]',
+    'yahoo_quote': '[data-field="regularMarketPrice"]'
+}
+
+
+def document_complete(driver):
+    return driver.execute_script('return document.readyState') == 'complete'
+
+
+def wait_until_ready(driver, source='website', max_wait=None):
+    """Wait until the current page for this source is ready to scrape.
+
+    Returns False if the page never became ready within max_wait.
+    """
+    if max_wait is None:
+        max_wait = DEFAULT_MAX_WAIT
+    wait = WebDriverWait(driver, max_wait, poll_frequency=POLL_FREQUENCY)
+    selector = READY_SELECTORS.get(source)
+    try:
+        if selector:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+        else:
+            wait.until(document_complete)
+        return True
+    except TimeoutException:
+        logger.warning(f"Page for {source} not ready after {max_wait}s, scraping what has loaded")
+        return False
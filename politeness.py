@@ -0,0 +1,240 @@
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from deadline import bounded_timeout, current_deadline, DeadlineExceeded
+
+logger = logging.getLogger('Politeness')
+
+# Sustained requests per second, burst size and concurrent requests allowed per host.
+# The burst fits one company's site crawl (robots.txt, sitemap and six pages).
+DEFAULT_RATE = float(os.environ.get('SCRAPER_HOST_RATE', 2))
+DEFAULT_BURST = int(os.environ.get('SCRAPER_HOST_BURST', 8))
+DEFAULT_MAX_IN_FLIGHT = int(os.environ.get('SCRAPER_HOST_MAX_IN_FLIGHT', 4))
+# Set SCRAPER_RESPECT_ROBOTS=0 to skip robots.txt checks (crawl delays are then ignored too)
+RESPECT_ROBOTS = os.environ.get('SCRAPER_RESPECT_ROBOTS', '1') != '0'
+ROBOTS_TTL = int(os.environ.get('SCRAPER_ROBOTS_TTL', 24 * 3600))
+# A robots.txt we couldn't fetch is retried sooner than one we could
+ROBOTS_ERROR_TTL = 600
+ROBOTS_TIMEOUT = 5
+# The longest crawl delay we honour; anything slower would stall a whole batch
+MAX_CRAWL_DELAY = float(os.environ.get('SCRAPER_MAX_CRAWL_DELAY', 10))
+ROBOTS_USER_AGENT = 'Mozilla/5.0'
+# Hosts whose pacing and robots.txt we remember; company sites are mostly one-offs
+MAX_HOSTS = int(os.environ.get('SCRAPER_MAX_HOSTS', 1000))
+
+# Budgets for the hosts every lookup hits: (requests per second, burst, max in flight)
+HOST_LIMITS = {
+    'en.wikipedia.org': (5, 10, 2),
+    'query1.finance.yahoo.com': (2, 4, 2),
+    'query2.finance.yahoo.com': (2, 4, 2),
+    'finance.yahoo.com': (1, 2, 2),
+    'www.bing.com': (1, 2, 2),
+    'www.google.com': (1, 2, 1),
+    # The free tier allows 5 calls a minute
+    'www.alphavantage.co': (5 / 60, 5, 1)
+}
+
+
+class RobotsDisallowed(Exception):
+    """robots.txt asks crawlers to stay away from this URL"""
+
+
+class TokenBucket:
+    """Tokens refill at rate per second up to burst; callers reserve one and sleep until it's theirs"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def reserve(self, now):
+        """Take a token and return how long to wait before using it.
+
+        Tokens may go negative, which queues callers one refill interval apart instead
+        of letting them all wake up and burst together.
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+    def block(self, now, seconds):
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = min(self.tokens, 0.0)
+
+
+class HostState:
+    def __init__(self, host, rate, burst, max_in_flight):
+        self.host = host
+        self.lock = threading.Lock()
+        self.bucket = TokenBucket(rate, burst)
+        self.slots = threading.BoundedSemaphore(max_in_flight)
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.robots = None
+        self.robots_expires = 0.0
+        self.robots_lock = threading.Lock()  # one robots.txt download per host at a time
+        self.requests = 0
+        self.waited = 0.0
+        self.disallowed = 0
+        self.back_offs = 0
+
+
+class PolitenessScheduler:
+    """Paces requests per host: a token bucket, a cap on requests in flight and robots.txt rules.
+
+    fetch_robots(url) must return (status_code, text) and should not go through the
+    scheduler itself; robots.txt downloads still take a token from their host's bucket.
+    """
+
+    def __init__(self, fetch_robots=None, respect_robots=RESPECT_ROBOTS, host_limits=None, max_hosts=MAX_HOSTS):
+        self.fetch_robots = fetch_robots
+        self.respect_robots = respect_robots and fetch_robots is not None
+        self.host_limits = HOST_LIMITS if host_limits is None else host_limits
+        self.max_hosts = max_hosts
+        self.hosts = OrderedDict()  # host -> HostState, least recently used first
+        self.lock = threading.Lock()
+
+    def _state(self, url):
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        with self.lock:
+            state = self.hosts.get(host)
+            if state is None:
+                rate, burst, max_in_flight = self.host_limits.get(host, (DEFAULT_RATE, DEFAULT_BURST, DEFAULT_MAX_IN_FLIGHT))
+                state = self.hosts[host] = HostState(host, rate, burst, max_in_flight)
+                self._evict()
+            else:
+                self.hosts.move_to_end(host)
+            return state, parsed
+
+    def _evict(self):
+        # A host with requests in flight stays, or its next request would get fresh slots
+        for host in list(self.hosts):
+            if len(self.hosts) <= self.max_hosts:
+                return
+            if self.hosts[host].in_flight == 0:
+                del self.hosts[host]
+
+    @contextmanager
+    def slot(self, url, robots=True):
+        """Hold one of url's host slots for the duration of a request.
+
+        Raises RobotsDisallowed when robots is true and robots.txt forbids the URL. APIs
+        we're explicitly invited to use (MediaWiki, quote endpoints) pass robots=False.
+        """
+        state, parsed = self._state(url)
+        if robots and self.respect_robots and not self._allowed(state, parsed, url):
+            with state.lock:
+                state.disallowed += 1
+            raise RobotsDisallowed(f"robots.txt disallows {url}")
+
+        if not state.slots.acquire(timeout=bounded_timeout(None)):
+            raise DeadlineExceeded(f"Timed out waiting for a slot on {state.host}")
+        try:
+            with state.lock:
+                state.in_flight += 1
+            self._take_token(state)
+            yield
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+            state.slots.release()
+
+    def throttle(self, url):
+        """Wait for a token without taking a slot, e.g. before retrying inside a slot"""
+        self._take_token(self._state(url)[0])
+
+    def back_off(self, url, seconds):
+        """Hold back every request to url's host for seconds, after a 429 or 503"""
+        state, _ = self._state(url)
+        with state.lock:
+            state.bucket.block(time.monotonic(), seconds)
+            state.back_offs += 1
+        logger.warning(f"Backing off {state.host} for {seconds:.1f}s")
+
+    def allowed(self, url):
+        if not self.respect_robots:
+            return True
+        state, parsed = self._state(url)
+        return self._allowed(state, parsed, url)
+
+    def _take_token(self, state):
+        deadline = current_deadline()
+        with state.lock:
+            wait = state.bucket.reserve(time.monotonic())
+            if deadline and wait > deadline.remaining():
+                # Hand the token back; sleeping past the deadline helps nobody
+                state.bucket.tokens += 1
+                raise DeadlineExceeded(f"No request budget left for {state.host} before the deadline")
+            state.requests += 1
+            state.waited += wait
+        if wait > 0:
+            time.sleep(wait)
+
+    def _allowed(self, state, parsed, url):
+        robots = self._robots(state, parsed)
+        return robots is None or robots.can_fetch(ROBOTS_USER_AGENT, url)
+
+    def _robots(self, state, parsed):
+        if time.monotonic() < state.robots_expires:
+            return state.robots
+        with state.robots_lock:
+            if time.monotonic() < state.robots_expires:
+                return state.robots
+            robots_url = f"{parsed.scheme or 'https'}://{state.host}/robots.txt"
+            robots, ttl = None, ROBOTS_TTL
+            self._take_token(state)
+            try:
+                status_code, text = self.fetch_robots(robots_url)
+                if status_code == 200:
+                    robots = RobotFileParser(robots_url)
+                    robots.parse(text.splitlines())
+                elif status_code >= 500:
+                    ttl = ROBOTS_ERROR_TTL
+                # Any other status means there are no rules for this host
+            except Exception as e:
+                logger.info(f"Could not load {robots_url}: {e}")
+                ttl = ROBOTS_ERROR_TTL
+            self._apply_crawl_delay(state, robots)
+            state.robots = robots
+            state.robots_expires = time.monotonic() + ttl
+            return robots
+
+    def _apply_crawl_delay(self, state, robots):
+        delay = robots.crawl_delay(ROBOTS_USER_AGENT) if robots else None
+        if not delay:
+            return
+        delay = min(float(delay), MAX_CRAWL_DELAY)
+        with state.lock:
+            if state.bucket.rate > 1 / delay:
+                logger.info(f"{state.host} asks for a crawl delay of {delay}s")
+                state.bucket.rate = 1 / delay
+                state.bucket.burst = 1
+                state.bucket.tokens = min(state.bucket.tokens, 1.0)
+
+    def stats(self):
+        with self.lock:
+            hosts = list(self.hosts.values())
+        return {
+            state.host: {
+                'rate': round(state.bucket.rate, 3),
+                'burst': state.bucket.burst,
+                'max_in_flight': state.max_in_flight,
+                'in_flight': state.in_flight,
+                'requests': state.requests,
+                'waited_seconds': round(state.waited, 2),
+                'disallowed': state.disallowed,
+                'back_offs': state.back_offs
+            }
+            for state in hosts
+        }
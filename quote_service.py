@@ -0,0 +1,238 @@
+import os
+import time
+import logging
+import threading
+
+from http_client import get_http_client
+from micro_batcher import MicroBatcher
+from circuit_breaker import get_breaker
+from deadline import bounded_timeout, DeadlineExceeded
+
+logger = logging.getLogger('QuoteService')
+
+# Quotes move, so they are only reused briefly
+QUOTE_TTL = float(os.environ.get('SCRAPER_QUOTE_TTL', 60))
+# Yahoo accepts many symbols per call; lookups arriving within the window share one request
+QUOTE_BATCH_SIZE = int(os.environ.get('SCRAPER_QUOTE_BATCH_SIZE', 50))
+QUOTE_BATCH_WAIT = float(os.environ.get('SCRAPER_QUOTE_BATCH_WAIT', 0.05))
+QUOTE_TIMEOUT = float(os.environ.get('SCRAPER_QUOTE_TIMEOUT', 20))
+ALPHA_VANTAGE_API_KEY = os.environ.get('ALPHA_VANTAGE_API_KEY', 'demo')
+# Alpha Vantage allows 5 calls a minute, one at a time, so only a few misses per batch are worth trying
+ALPHA_VANTAGE_MAX_FALLBACKS = int(os.environ.get('SCRAPER_ALPHA_VANTAGE_MAX_FALLBACKS', 2))
+
+YAHOO_QUOTE_URL = 'https://query2.finance.yahoo.com/v7/finance/quote'
+# The quote endpoint wants a crumb tied to the session's cookie, which fc.yahoo.com hands out
+YAHOO_COOKIE_URL = 'https://fc.yahoo.com'
+YAHOO_CRUMB_URL = 'https://query2.finance.yahoo.com/v1/test/getcrumb'
+ALPHA_VANTAGE_URL = 'https://www.alphavantage.co/query'
+
+
+def format_number(value, suffix=''):
+    return f"{value:.2f}{suffix}"
+
+
+def format_market_cap(value):
+    for divisor, unit in ((1e12, 'T'), (1e9, 'B'), (1e6, 'M')):
+        if value >= divisor:
+            return f"{value / divisor:.3f}{unit}"
+    return f"{value:.0f}"
+
+
+class QuoteService:
+    """Stock quotes by ticker, fetched in batches and kept in a short-lived cache.
+
+    Symbols requested at about the same time are fetched with a single Yahoo quote call;
+    up to ALPHA_VANTAGE_MAX_FALLBACKS the batch doesn't cover fall back to Alpha Vantage
+    one by one. Each caller gets its quote as soon as it arrives.
+    """
+
+    def __init__(self, http_client=None, ttl=QUOTE_TTL, batch_size=QUOTE_BATCH_SIZE, batch_wait=QUOTE_BATCH_WAIT):
+        self.http = http_client or get_http_client()
+        self.ttl = ttl
+        self.cache = {}  # symbol -> (expires_at, quote)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.yahoo_breaker = get_breaker('yahoo_quote_batch')
+        self.alpha_vantage_breaker = get_breaker('alpha_vantage')
+        self.crumb = None
+        self.crumb_lock = threading.Lock()
+        self.batcher = MicroBatcher(self._fetch_quotes, max_batch=batch_size, max_wait=batch_wait, name='quote',
+                                    incremental=True, max_time=QUOTE_TIMEOUT)
+
+    def get_quote(self, symbol):
+        """Return a dict with stock_price, previous_close, change and change_percent, or None"""
+        return self.get_quotes([symbol]).get(symbol.upper())
+
+    def get_quotes(self, symbols):
+        """Return {symbol: quote or None} for many symbols, sharing batches with concurrent callers"""
+        symbols = [symbol.upper() for symbol in symbols if symbol]
+        quotes = {}
+        missing = []
+        now = time.monotonic()
+        with self.lock:
+            for symbol in symbols:
+                entry = self.cache.get(symbol)
+                if entry and entry[0] > now:
+                    quotes[symbol] = dict(entry[1])
+                    self.hits += 1
+                else:
+                    missing.append(symbol)
+                    self.misses += 1
+        if missing:
+            try:
+                fetched = self.batcher.get_many(missing, timeout=bounded_timeout(QUOTE_TIMEOUT))
+            except Exception as e:
+                logger.warning(f"Quote lookup failed for {missing}: {e}")
+                fetched = {}
+            for symbol in missing:
+                quote = fetched.get(symbol)
+                quotes[symbol] = dict(quote) if quote else None
+        return quotes
+
+    def stats(self):
+        with self.lock:
+            stats = {'cached': len(self.cache), 'ttl': self.ttl, 'hits': self.hits, 'misses': self.misses}
+        stats.update(self.batcher.stats())
+        return stats
+
+    def _fetch_quotes(self, symbols, resolve):
+        quotes = self._fetch_yahoo(symbols)
+        self._cache(quotes)
+        for symbol, quote in quotes.items():
+            resolve(symbol, quote)
+
+        misses = [symbol for symbol in symbols if symbol not in quotes]
+        for symbol in misses[ALPHA_VANTAGE_MAX_FALLBACKS:]:
+            resolve(symbol, None)
+        for symbol in misses[:ALPHA_VANTAGE_MAX_FALLBACKS]:
+            try:
+                quote = self._fetch_alpha_vantage(symbol)
+            except DeadlineExceeded:
+                # The rate limit would keep the rest waiting past the callers' deadline
+                logger.info(f"No time left for Alpha Vantage fallbacks, {symbol} and later misses skipped")
+                break
+            if quote:
+                quotes[symbol] = quote
+                self._cache({symbol: quote})
+            resolve(symbol, quote)
+        return quotes
+
+    def _cache(self, quotes):
+        # Only real quotes are cached; a miss may just be a rate limit
+        expires_at = time.monotonic() + self.ttl
+        with self.lock:
+            for symbol, quote in quotes.items():
+                self.cache[symbol] = (expires_at, quote)
+            self._expire()
+
+    def _crumb(self, refresh=False):
+        with self.crumb_lock:
+            if self.crumb and not refresh:
+                return self.crumb
+            self.crumb = None
+            try:
+                # Answers 404, but sets the cookie the crumb is bound to
+                self.http.get(YAHOO_COOKIE_URL, robots=False, retries=0)
+                response = self.http.get(YAHOO_CRUMB_URL, robots=False)
+                crumb = response.text.strip()
+                if response.status_code == 200 and crumb and '<' not in crumb:
+                    self.crumb = crumb
+                else:
+                    logger.warning(f"Yahoo crumb request returned {response.status_code}")
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                logger.warning(f"Could not get a Yahoo crumb: {e}")
+            return self.crumb
+
+    def _fetch_yahoo(self, symbols):
+        quotes = {}
+        if not self.yahoo_breaker.allow():
+            return quotes
+        try:
+            crumb = self._crumb()
+            response = self._request_yahoo(symbols, crumb)
+            if response.status_code in (401, 403) and crumb:
+                # The crumb went stale along with its cookie
+                response = self._request_yahoo(symbols, self._crumb(refresh=True))
+            if response.status_code != 200:
+                logger.warning(f"Yahoo quote batch returned {response.status_code}")
+                self.yahoo_breaker.record_failure()
+                return quotes
+            results = response.json().get('quoteResponse', {}).get('result') or []
+        except DeadlineExceeded:
+            # Never got to ask Yahoo, which says nothing about Yahoo
+            return quotes
+        except Exception as e:
+            logger.warning(f"Yahoo quote batch failed: {e}")
+            self.yahoo_breaker.record_failure()
+            return quotes
+
+        for item in results:
+            symbol = (item.get('symbol') or '').upper()
+            price = item.get('regularMarketPrice')
+            if not symbol or price is None:
+                continue
+            quote = {'stock_price': format_number(price)}
+            if item.get('regularMarketPreviousClose') is not None:
+                quote['previous_close'] = format_number(item['regularMarketPreviousClose'])
+            if item.get('regularMarketChange') is not None:
+                quote['change'] = format_number(item['regularMarketChange'])
+            if item.get('regularMarketChangePercent') is not None:
+                quote['change_percent'] = format_number(item['regularMarketChangePercent'], '%')
+            if item.get('marketCap'):
+                quote['market_cap'] = format_market_cap(item['marketCap'])
+            if item.get('trailingPE'):
+                quote['pe_ratio'] = format_number(item['trailingPE'])
+            quotes[symbol] = quote
+        logger.info(f"Yahoo returned {len(quotes)} of {len(symbols)} quotes")
+        if quotes:
+            self.yahoo_breaker.record_success()
+        else:
+            self.yahoo_breaker.record_empty()
+        return quotes
+
+    def _request_yahoo(self, symbols, crumb):
+        params = {'symbols': ','.join(symbols)}
+        if crumb:
+            params['crumb'] = crumb
+        return self.http.get(YAHOO_QUOTE_URL, params=params, robots=False)
+
+    def _fetch_alpha_vantage(self, symbol):
+        # Alpha Vantage has no batch quote endpoint
+        if not self.alpha_vantage_breaker.allow():
+            return None
+        params = {'function': 'GLOBAL_QUOTE', 'symbol': symbol, 'apikey': ALPHA_VANTAGE_API_KEY}
+        try:
+            response = self.http.get(ALPHA_VANTAGE_URL, params=params, robots=False)
+            if response.status_code != 200:
+                self.alpha_vantage_breaker.record_failure()
+                return None
+            quote = response.json().get('Global Quote') or {}
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.warning(f"Alpha Vantage API failed for {symbol}: {e}")
+            self.alpha_vantage_breaker.record_failure()
+            return None
+
+        if '05. price' not in quote:
+            # Also what an exhausted or demo key gets back for most symbols
+            self.alpha_vantage_breaker.record_empty()
+            return None
+        self.alpha_vantage_breaker.record_success()
+        data = {'stock_price': quote['05. price']}
+        if '08. previous close' in quote:
+            data['previous_close'] = quote['08. previous close']
+        if '09. change' in quote:
+            data['change'] = quote['09. change']
+        if '10. change percent' in quote:
+            data['change_percent'] = quote['10. change percent']
+        logger.info(f"Found stock price via Alpha Vantage: {data['stock_price']} for {symbol}")
+        return data
+
+    def _expire(self):
+        now = time.monotonic()
+        for symbol in [symbol for symbol, (expires_at, _) in self.cache.items() if expires_at <= now]:
+            del self.cache[symbol]
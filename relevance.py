@@ -0,0 +1,139 @@
+import re
+from functools import lru_cache
+
+# Words suggesting a page is about a business, per source
+WEBSITE_COMPANY_TERMS = ['company', 'corporation', 'inc', 'incorporated', 'llc', 'ltd', 'limited',
+                         'gmbh', 'ag', 'co', 'corp', 'about us', 'contact us', 'our team', 'careers',
+                         'products', 'services', 'solutions', 'customers', 'clients']
+WIKIPEDIA_COMPANY_TERMS = ['company', 'corporation', 'inc', 'incorporated', 'llc', 'ltd', 'limited', 'gmbh', 'ag', 'co', 'corp',
+                           'founded', 'headquartered', 'business', 'industry', 'products', 'services']
+# A shorter list for telling a company article apart from other search hits
+COMPANY_ARTICLE_TERMS = ['company', 'corporation', 'founded', 'business', 'industry']
+# Words suggesting an article is about something other than a company
+NON_COMPANY_TERMS = ['ancient', 'river', 'mythology', 'historical', 'history',
+                     'century', 'bc', 'b.c.', 'geographical', 'geography']
+LEGAL_FORM_TERMS = ['company', 'corporation', 'inc', 'incorporated', 'llc', 'ltd', 'limited']
+
+# Points for each distinct term matched in a group, and the most the group can add (None for no cap)
+WEIGHTS = {
+    'website': {'indicator': (2, 2), 'name': (3, 3), 'name_part': (1, None), 'domain': (2, 2)},
+    'wikipedia': {'indicator': (1, None), 'name': (3, 3), 'name_part': (1, None), 'domain': (2, 2)}
+}
+INDICATORS = {
+    'website': WEBSITE_COMPANY_TERMS,
+    'wikipedia': WIKIPEDIA_COMPANY_TERMS
+}
+
+# Terms only match whole words, so 'co' doesn't match inside 'cocoa'
+WORD_BEFORE = r'(?<![a-z0-9])'
+WORD_AFTER = r'(?![a-z0-9])'
+
+
+class TermMatcher:
+    """Finds which of several groups of terms occur as whole words in a text.
+
+    All terms are compiled into one regex and the text is scanned once. A term matched
+    inside a longer one (e.g. 'acme' in 'acme corp') still counts for its own groups.
+    """
+
+    def __init__(self, groups):
+        self.groups = {}  # term -> groups it belongs to
+        for group, terms in groups.items():
+            for term in terms:
+                term = term.lower().strip()
+                if term:
+                    self.groups.setdefault(term, []).append(group)
+        # Longest first so the regex prefers 'about us' over 'about'
+        terms = sorted(self.groups, key=len, reverse=True)
+        self.pattern = re.compile(WORD_BEFORE + '(?:' + '|'.join(re.escape(term) for term in terms) + ')' + WORD_AFTER) if terms else None
+        # Shorter terms contained in each multi-word term; the scan only reports the longer one
+        self.implied = {term: [other for other in terms if other != term and re.search(WORD_BEFORE + re.escape(other) + WORD_AFTER, term)]
+                        for term in terms if not term.isalnum()}
+
+    def find(self, text):
+        """{group: [terms]} for every group with a match, terms in order of first appearance"""
+        found = {}
+        if not self.pattern or not text:
+            return found
+        seen = set()
+        for match in self.pattern.finditer(text.lower()):
+            term = match.group()
+            for hit in [term] + self.implied.get(term, []):
+                if hit in seen:
+                    continue
+                seen.add(hit)
+                for group in self.groups[hit]:
+                    found.setdefault(group, []).append(hit)
+        return found
+
+
+class Relevance:
+    def __init__(self, score, matches):
+        self.score = score
+        self.matches = matches  # group -> matched terms
+
+    def terms(self, group):
+        return self.matches.get(group, [])
+
+    def __repr__(self):
+        return f'Relevance({self.score}, {self.matches!r})'
+
+
+class RelevanceScorer:
+    """Scores how strongly texts refer to one company.
+
+    Matches the source's company indicators, the full company name, its significant name
+    parts and optionally the website's domain, then weights them per WEIGHTS[source].
+    """
+
+    def __init__(self, company_name, source='wikipedia', domain=None):
+        self.source = source
+        self.weights = WEIGHTS[source]
+        name = (company_name or '').lower().strip()
+        groups = {'indicator': INDICATORS[source]}
+        if name:
+            groups['name'] = [name]
+            groups['name_part'] = [part for part in name.split() if len(part) > 2]
+        if domain:
+            groups['domain'] = [domain.lower()]
+        self.matcher = _matcher(tuple((group, tuple(terms)) for group, terms in groups.items()))
+
+    def score(self, text):
+        matches = self.matcher.find(text)
+        score = 0
+        for group, terms in matches.items():
+            points, cap = self.weights[group]
+            score += points * len(terms) if cap is None else min(cap, points * len(terms))
+        return Relevance(score, matches)
+
+    def score_many(self, texts):
+        return [self.score(text) for text in texts]
+
+
+@lru_cache(maxsize=256)
+def _matcher(groups):
+    # Companies come back around often enough that recompiling every time would show up
+    return TermMatcher(dict(groups))
+
+
+def domain_label(website):
+    """The registrable part of a website's host, e.g. 'acme' for https://www.acme.com/about"""
+    return website.replace('https://', '').replace('http://', '').replace('www.', '').split('.')[0].lower()
+
+
+_non_company = TermMatcher({'non_company': NON_COMPANY_TERMS})
+_company_article = TermMatcher({'company': COMPANY_ARTICLE_TERMS})
+_legal_form = TermMatcher({'legal_form': LEGAL_FORM_TERMS})
+
+
+def non_company_terms(text):
+    """Words in text suggesting it describes something other than a company"""
+    return _non_company.find(text).get('non_company', [])
+
+
+def reads_like_company(text):
+    return bool(_company_article.find(text))
+
+
+def has_legal_form(company_name):
+    return bool(_legal_form.find(company_name))
@@ -0,0 +1,97 @@
+import os
+import logging
+import weakref
+
+logger = logging.getLogger('RenderProfile')
+
+# Set SCRAPER_BLOCK_RESOURCES=0 to let Chrome load every subresource again, e.g. to debug a page
+BLOCK_RESOURCES = os.environ.get('SCRAPER_BLOCK_RESOURCES', '1') != '0'
+# Sources whose pages keep their stylesheets. We only read page_source, but arbitrary company
+# sites may hide or lazy-load content depending on layout; Wikipedia and Yahoo render without CSS.
+CSS_SOURCES = {
+    source.strip()
+    for source in os.environ.get('SCRAPER_RENDER_CSS_SOURCES', 'website').split(',')
+    if source.strip()
+}
+
+# 2 = block. Images are switched off in the renderer, so they aren't even requested.
+CHROME_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.default_content_setting_values.geolocation': 2,
+    'profile.default_content_setting_values.media_stream': 2
+}
+CHROME_ARGUMENTS = [
+    '--blink-settings=imagesEnabled=false',
+    '--disable-remote-fonts',
+    '--autoplay-policy=user-gesture-required',
+    '--mute-audio',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync'
+]
+
+# Network.setBlockedURLs patterns; '*' matches any run of characters
+FONT_PATTERNS = ['*.woff', '*.woff?*', '*.woff2', '*.woff2?*', '*.ttf', '*.otf', '*.eot']
+MEDIA_PATTERNS = ['*.mp4', '*.webm', '*.ogg', '*.mp3', '*.m3u8', '*.mov', '*.avi']
+# Images are already off in the renderer; these catch preloads and favicons
+IMAGE_PATTERNS = ['*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico']
+CSS_PATTERNS = ['*.css', '*.css?*']
+# Ad, analytics and tag-manager hosts; none of them serve anything we extract
+TRACKER_HOSTS = [
+    'doubleclick.net', 'googlesyndication.com', 'googleadservices.com', 'adservice.google.com',
+    'google-analytics.com', 'googletagmanager.com', 'googletagservices.com',
+    'facebook.net', 'connect.facebook.com', 'hotjar.com', 'scorecardresearch.com',
+    'quantserve.com', 'amazon-adsystem.com', 'adsrvr.org', 'criteo.com', 'criteo.net',
+    'taboola.com', 'outbrain.com', 'chartbeat.com', 'chartbeat.net', 'segment.io',
+    'cdn.segment.com', 'nr-data.net', 'newrelic.com', 'optimizely.com', 'clarity.ms',
+    'bat.bing.com', 'ads.linkedin.com', 'snap.licdn.com', 'analytics.tiktok.com',
+    'analytics.yahoo.com', 'udc.yahoo.com', 'beap.gemini.yahoo.com'
+]
+TRACKER_PATTERNS = [pattern for host in TRACKER_HOSTS for pattern in (f'*://{host}/*', f'*://*.{host}/*')]
+
+# The blocklist last sent to each Chrome session, so a pooled session is only
+# reconfigured when it moves to a source with a different allowlist
+_applied = weakref.WeakKeyDictionary()
+
+
+def apply_render_profile(chrome_options):
+    """Add the prefs and flags that stop Chrome loading images, fonts and media"""
+    if not BLOCK_RESOURCES:
+        return chrome_options
+    for argument in CHROME_ARGUMENTS:
+        chrome_options.add_argument(argument)
+    chrome_options.add_experimental_option('prefs', CHROME_PREFS)
+    return chrome_options
+
+
+def blocked_patterns(source='website'):
+    """URL patterns Chrome should refuse to request while loading a page for source"""
+    if not BLOCK_RESOURCES:
+        return []
+    patterns = TRACKER_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + IMAGE_PATTERNS
+    if source not in CSS_SOURCES:
+        patterns = patterns + CSS_PATTERNS
+    return patterns
+
+
+def block_requests(driver, source='website'):
+    """Intercept the session's requests so blocked resources and trackers never leave the browser.
+
+    The blocklist holds for every later navigation of the session, so this only talks
+    to Chrome when the source's allowlist differs from the one last applied. Returns
+    False if the session doesn't speak the DevTools protocol.
+    """
+    patterns = blocked_patterns(source)
+    key = tuple(patterns)
+    if _applied.get(driver) == key:
+        return True
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    except Exception as e:
+        logger.warning(f"Could not set up request blocking: {e}")
+        return False
+    _applied[driver] = key
+    return True
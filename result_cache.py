@@ -0,0 +1,102 @@
+import os
+import re
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger('ResultCache')
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get('SCRAPER_RESULT_CACHE_ENTRIES', 500))
+DEFAULT_MAX_BYTES = int(os.environ.get('SCRAPER_RESULT_CACHE_BYTES', 50 * 1024 * 1024))
+DEFAULT_TTL = float(os.environ.get('SCRAPER_RESULT_CACHE_TTL', 6 * 60 * 60))
+# Lookups that timed out or lost a provider are kept only briefly, in case it was a blip
+DEGRADED_TTL = float(os.environ.get('SCRAPER_RESULT_CACHE_DEGRADED_TTL', 5 * 60))
+
+
+def normalize_lookup_key(company_name, website=None):
+    """Key for a lookup that ignores case, extra whitespace and cosmetic URL differences"""
+    name = re.sub(r'\s+', ' ', (company_name or '').strip().lower())
+    site = (website or '').strip().lower()
+    site = re.sub(r'^https?://', '', site)
+    site = re.sub(r'^www\.', '', site).rstrip('/')
+    return (name, site)
+
+
+class ResultCache:
+    """Bounded in-memory cache of scrape results with LRU eviction and per-entry expiry.
+
+    Results are stored serialized, which gives an exact size for the memory cap and
+    hands every caller its own copy to modify.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entries = OrderedDict()  # key -> (expires_at, payload)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        return self._get(key, count=True)
+
+    def peek(self, key):
+        """Like get, but not counted in the hit and miss stats; for checking again after a miss"""
+        return self._get(key, count=False)
+
+    def _get(self, key, count):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += count
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += count
+                return None
+            self.entries.move_to_end(key)
+            self.hits += count
+        return json.loads(payload)
+
+    def put(self, key, value, ttl=None):
+        payload = json.dumps(value, default=str)
+        if len(payload) > self.max_bytes:
+            logger.warning(f"Result for {key} is too large to cache ({len(payload)} bytes)")
+            return
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), payload)
+            self.size += len(payload)
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                oldest = next(iter(self.entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.entries),
+                'bytes': self.size,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'expirations': self.expirations,
+                'evictions': self.evictions
+            }
+
+    def _remove(self, key):
+        _, payload = self.entries.pop(key)
+        self.size -= len(payload)
@@ -1,21 +1,37 @@
-import requests
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 import re
 import logging
 import os
 import platform
 import datetime
+from urllib.parse import urljoin
 from GoogleNews import GoogleNews
 
 # Import our custom ChromeDriver installer
 from chromedriver_installer import setup_chrome_driver
+from source_executor import SourceExecutor
+from driver_pool import DriverPool, DEFAULT_POOL_SIZE
+from page_ready import PAGE_LOAD_STRATEGY
+from render_profile import apply_render_profile
+from fetcher import TieredFetcher
+from http_client import get_http_client, MAX_PAGE_BYTES
+from politeness import RobotsDisallowed
+from result_cache import ResultCache, normalize_lookup_key, DEGRADED_TTL
+from single_flight import SingleFlight
+from hedging import hedged_call
+from deadline import deadline_scope, clamp_deadline, current_deadline, DeadlineExceeded, MAX_DEADLINE
+from circuit_breaker import get_breaker, breaker_states, track_degraded
+from ticker_index import get_ticker_index
+from quote_service import QuoteService
+from wikipedia_api import WikipediaApi, WikipediaApiError
+from wiki_dump_index import load_wiki_index
+from site_crawler import SiteCrawler
+from section_classifier import classify_sections, extract_products, extract_leaders
+from relevance import RelevanceScorer, domain_label, non_company_terms, reads_like_company, has_legal_form
+from html_parser import make_soup, WIKIPEDIA_CONTENT, YAHOO_LOOKUP_TABLE, YAHOO_QUOTE_FIELDS, BING_NEWS_CARDS
 
 # Configure logging
 logging.basicConfig(
@@ -23,14 +39,39 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# Products kept when they're gathered from several pages of a website
+MAX_WEBSITE_PRODUCTS = 10
+# Where the GoogleNews library sends its queries
+GOOGLE_NEWS_SEARCH_URL = 'https://www.google.com/search'
+
 class CompanyScraper:
-    def __init__(self):
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE):
         # Setup logger
         self.logger = logging.getLogger('CompanyScraper')
-        # Setup headless browser
-        self.setup_browser()
+        # Setup pool of headless browsers shared by all request threads
+        self.setup_browser(pool_size)
+        # Finished lookups, so repeat searches skip the crawl
+        self.result_cache = ResultCache()
+        self.in_flight = SingleFlight()
+        self.ticker_index = get_ticker_index()
+        self.quotes = QuoteService(self.http)
+        self.wikipedia = WikipediaApi(self.http)
+        # Offline infoboxes from a Wikipedia dump, when one has been built
+        self.wiki_index = load_wiki_index()
     
-    def setup_browser(self):
+    def setup_browser(self, pool_size=DEFAULT_POOL_SIZE):
+        # Sessions are created lazily by the pool on first checkout
+        chrome_available = self.is_chrome_available()
+        if not chrome_available:
+            # Fallback to requests-based scraping
+            self.logger.info("Falling back to requests-based scraping without browser")
+        self.driver_pool = DriverPool(self._create_driver, size=pool_size if chrome_available else 0)
+        # Plain HTTP first, Chrome only for pages that need JavaScript
+        self.http = get_http_client()
+        self.fetcher = TieredFetcher(self.driver_pool, self.http)
+        self.site_crawler = SiteCrawler(self.fetcher, self.http)
+    
+    def _chrome_options(self):
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -44,7 +85,13 @@ class CompanyScraper:
         chrome_options.add_argument("--disable-setuid-sandbox")
         chrome_options.add_argument("--disable-features=IsolateOrigins,site-per-process")
         chrome_options.add_argument("--ignore-certificate-errors")
-        
+        # Readiness is detected per source, so don't block on every subresource
+        chrome_options.page_load_strategy = PAGE_LOAD_STRATEGY
+        # We only read page_source, so skip images, fonts and media
+        return apply_render_profile(chrome_options)
+    
+    def is_chrome_available(self):
+        """Check if Google Chrome is installed on this machine"""
         try:
             # Check if Chrome is installed
             import os
@@ -80,52 +127,51 @@ class CompanyScraper:
             
             if not chrome_installed:
                 self.logger.warning("Google Chrome not found on system. Browser automation will not be available.")
-                self.driver = None
-                return
-            
-            # Try multiple methods to setup ChromeDriver
-            methods = [
-                self._setup_with_webdriver_manager,
-                self._setup_with_cached_driver,
-                self._setup_with_chromedriver_binary,
-                self._setup_direct_chrome
-            ]
-            
-            for method in methods:
-                try:
-                    self.logger.info(f"Trying Chrome setup method: {method.__name__}")
-                    success = method(chrome_options)
-                    if success:
-                        self.wait = WebDriverWait(self.driver, 10)  # 10 second wait
-                        self.logger.info(f"Chrome driver setup successfully using {method.__name__}")
-                        return
-                except Exception as method_error:
-                    self.logger.warning(f"{method.__name__} failed: {method_error}")
-            
-            # If all methods failed
-            raise Exception("All ChromeDriver setup methods failed")
-            
+            return chrome_installed
         except Exception as e:
-            self.logger.error(f"Error setting up Chrome driver: {e}")
-            # Fallback to requests-based scraping
-            self.logger.info("Falling back to requests-based scraping without browser")
-            self.driver = None
+            self.logger.error(f"Error checking for Chrome: {e}")
+            return False
+    
+    def _create_driver(self):
+        """Create a new Chrome session for the driver pool, or None if every setup method fails"""
+        chrome_options = self._chrome_options()
+        
+        # Try multiple methods to setup ChromeDriver
+        methods = [
+            self._setup_with_webdriver_manager,
+            self._setup_with_cached_driver,
+            self._setup_with_chromedriver_binary,
+            self._setup_direct_chrome
+        ]
+        
+        for method in methods:
+            try:
+                self.logger.info(f"Trying Chrome setup method: {method.__name__}")
+                driver = method(chrome_options)
+                if driver:
+                    self.logger.info(f"Chrome driver setup successfully using {method.__name__}")
+                    return driver
+            except Exception as method_error:
+                self.logger.warning(f"{method.__name__} failed: {method_error}")
+        
+        self.logger.error("All ChromeDriver setup methods failed")
+        return None
     
     def _setup_with_webdriver_manager(self, chrome_options):
         """Setup Chrome using webdriver-manager"""
         try:
             from webdriver_manager.chrome import ChromeDriverManager
             # Don't specify version - let ChromeDriverManager find the compatible version
-            self.driver = webdriver.Chrome(
+            driver = webdriver.Chrome(
                 service=Service(ChromeDriverManager().install()),
                 options=chrome_options
             )
             # Verify driver is working with a simple operation
-            self.driver.get('about:blank')
-            return True
+            driver.get('about:blank')
+            return driver
         except Exception as e:
             self.logger.warning(f"ChromeDriverManager setup failed: {e}")
-            return False
+            return None
     
     def _setup_with_cached_driver(self, chrome_options):
         """Setup Chrome using cached driver path"""
@@ -144,16 +190,15 @@ class CompanyScraper:
             for driver_path in possible_paths:
                 if os.path.exists(driver_path):
                     self.logger.info(f"Found cached ChromeDriver at: {driver_path}")
-                    self.driver = webdriver.Chrome(
+                    return webdriver.Chrome(
                         service=Service(driver_path),
                         options=chrome_options
                     )
-                    return True
             
-            return False
+            return None
         except Exception as e:
             self.logger.warning(f"Cached driver setup failed: {e}")
-            return False
+            return None
     
     def _setup_with_chromedriver_binary(self, chrome_options):
         """Setup Chrome using chromedriver-binary package if installed"""
@@ -163,35 +208,84 @@ class CompanyScraper:
                 import chromedriver_binary_auto
                 chromedriver_binary_auto.add_chromedriver_to_path()
                 self.logger.info("Using chromedriver-binary-auto package")
-                self.driver = webdriver.Chrome(options=chrome_options)
-                return True
+                return webdriver.Chrome(options=chrome_options)
             except ImportError:
                 self.logger.info("chromedriver-binary-auto package not installed, trying chromedriver-binary")
             
             # Fall back to regular chromedriver-binary
             import chromedriver_binary
             self.logger.info("Using chromedriver-binary package")
-            self.driver = webdriver.Chrome(options=chrome_options)
-            return True
+            return webdriver.Chrome(options=chrome_options)
         except ImportError:
             self.logger.info("No chromedriver-binary packages installed")
-            return False
+            return None
         except Exception as e:
             self.logger.warning(f"chromedriver-binary setup failed: {e}")
-            return False
+            return None
     
     def _setup_direct_chrome(self, chrome_options):
         """Try direct Chrome setup as last resort"""
         try:
             self.logger.info("Attempting direct Chrome setup")
-            self.driver = webdriver.Chrome(options=chrome_options)
-            return True
+            return webdriver.Chrome(options=chrome_options)
         except Exception as e:
             self.logger.warning(f"Direct Chrome setup failed: {e}")
-            return False
+            return None
+    
+    def scrape_company(self, company_name, website=None, refresh=False, on_source=None, deadline=None, max_deadline=None):
+        """Look up a company, serving repeat lookups from the result cache unless refresh is set.
+        
+        on_source(name, partial) is called from worker threads with a result-shaped partial
+        as soon as each source finishes. Cached results, and lookups that join an identical
+        one already in flight, are returned without any callbacks.
+        
+        deadline is the lookup's time budget in seconds (SCRAPER_DEADLINE_SECONDS by default),
+        capped at max_deadline or SCRAPER_MAX_DEADLINE_SECONDS. Sources still running when it
+        passes are listed in data_quality['timed_out_sources'] and the result holds whatever
+        the others gathered.
+        """
+        key = normalize_lookup_key(company_name, website)
+        if not refresh:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                self.logger.info(f"Serving cached result for {company_name} ({website})")
+                return cached
+        
+        # Concurrent lookups of the same company share a single crawl
+        with deadline_scope(clamp_deadline(deadline, maximum=max_deadline or MAX_DEADLINE)):
+            try:
+                return self.in_flight.do(key, self._scrape_and_cache, key, company_name, website, refresh, on_source)
+            except DeadlineExceeded:
+                # We joined a lookup with a longer budget than ours, and ours ran out first
+                self.logger.warning(f"Gave up waiting for the in-flight lookup of {company_name}, out of time")
+                return self._timed_out_result(company_name, website)
+    
+    def _timed_out_result(self, company_name, website):
+        result = self._new_result(company_name, website)
+        sources = (['website'] if website else []) + (['wikipedia', 'finance', 'news'] if company_name else [])
+        result['data_quality']['timed_out_sources'] = sources
+        return result
+    
+    def _scrape_and_cache(self, key, company_name, website, refresh, on_source):
+        if not refresh:
+            # An identical lookup may have finished between our cache miss and getting here
+            cached = self.result_cache.peek(key)
+            if cached is not None:
+                return cached
+        
+        with track_degraded() as degraded_providers:
+            result = self._scrape_company(company_name, website, on_source)
+        if degraded_providers:
+            result['data_quality']['degraded_providers'] = sorted(degraded_providers)
+        # A lookup that ran out of time or lost a provider it needed may just have hit a
+        # temporary outage, so it is only kept briefly; one that found nothing isn't kept
+        degraded = bool(degraded_providers or result['data_quality'].get('timed_out_sources'))
+        if result['overview'] or result['financials'] or result['news']:
+            self.result_cache.put(key, result, ttl=DEGRADED_TTL if degraded else None)
+        return result
     
-    def scrape_company(self, company_name, website=None):
-        result = {
+    def _new_result(self, company_name, website):
+        return {
             'name': company_name,
             'website': website,
             'overview': {},
@@ -203,6 +297,9 @@ class CompanyScraper:
             'data_quality': {},
             'source_urls': {}  # Store URLs for each source to make them clickable
         }
+    
+    def _scrape_company(self, company_name, website=None, on_source=None):
+        result = self._new_result(company_name, website)
         
         # REQUIRE website for proper company identification
         if not website:
@@ -210,159 +307,191 @@ class CompanyScraper:
             result['warning'] = "No company website provided. Results may include generic information not specific to the company."
             result['data_quality']['website_missing'] = True
 
-        # Try to scrape company website first - this is the primary source and REQUIRED for accurate data
-        company_verified = False
-        website_relevance_score = 0
-        
-        if website:
-            self.logger.info(f"Scraping company website: {website}")
-            website_data = self.scrape_website(website)
-            self.update_result(result, website_data, 'Company Website')
+        def run_source(name, scrape, arg, verify=None):
+            # Scrape and assess in the worker so the source can be reported the moment it's done
+            try:
+                data = scrape(arg)
+            except Exception as e:
+                self.logger.error(f"Source {name} failed: {e}")
+                data = None
+            section = {'data': data, 'quality': {}, 'accepted': True}
+            deadline = current_deadline()
+            if deadline and deadline.expired:
+                # Whatever the source gathered before its requests were cut short is still kept
+                section['timed_out'] = True
+            if verify:
+                section['accepted'] = verify(company_name, website, data, section['quality'])
+            if on_source:
+                partial = self._new_result(company_name, website)
+                self._merge_sections(partial, company_name, {name: section})
+                try:
+                    on_source(name, partial)
+                except Exception as e:
+                    self.logger.error(f"Progress callback failed for {name}: {e}")
+            return section
+
+        # Website, Wikipedia and news don't depend on each other, so start them all at once.
+        # Finance is only started once the company identity has been verified.
+        with SourceExecutor(max_workers=4) as executor:
+            if website:
+                self.logger.info(f"Scraping company website: {website}")
+                executor.submit('website', run_source, 'website', self.scrape_website, website, self._verify_website)
+            if company_name:
+                self.logger.info(f"Scraping Wikipedia for: {company_name}")
+                executor.submit('wikipedia', run_source, 'wikipedia', self.scrape_wikipedia, company_name, self._verify_wikipedia)
+                self.logger.info(f"Scraping news for: {company_name}")
+                executor.submit('news', run_source, 'news', self.scrape_news, company_name)
             
-            # Verify we have relevant company data, not generic information
-            # If we have a company name, check if it appears in the website content
-            if website_data and ('title' in website_data or 'description' in website_data or 'about' in website_data):
-                website_content = (website_data.get('title', '') + ' ' + website_data.get('description', '') + ' ' + 
-                                  website_data.get('about', '')).lower()
-                
-                # For debugging
-                self.logger.info(f"Website content snippet: {website_content[:100]}...")
-                
-                # Stronger verification that this is a company website
-                company_indicators = ['company', 'corporation', 'inc', 'incorporated', 'llc', 'ltd', 'limited', 
-                                     'gmbh', 'ag', 'co', 'corp', 'about us', 'contact us', 'our team', 'careers',
-                                     'products', 'services', 'solutions', 'customers', 'clients']
-                
-                # Check if this looks like a company website
-                is_company_website = any(indicator in website_content for indicator in company_indicators)
-                if is_company_website:
-                    website_relevance_score += 2
-                    self.logger.info("Website appears to be a company website (found company indicators)")
-                
-                # If we have a company name, check if it appears in the website content
-                if company_name:
-                    company_name_parts = company_name.lower().split()
-                    significant_parts = [part for part in company_name_parts if len(part) > 2]
-                    
-                    # Check for full company name match
-                    if company_name.lower() in website_content:
-                        website_relevance_score += 3
-                        self.logger.info(f"Full company name '{company_name}' found in website content")
-                    
-                    # Check for partial matches
-                    company_matches = [part for part in significant_parts if part in website_content]
-                    if company_matches:
-                        website_relevance_score += len(company_matches)
-                        self.logger.info(f"Found {len(company_matches)} company name parts in website content: {company_matches}")
-                
-                # Domain name match with company name
-                if company_name:
-                    domain = website.replace('https://', '').replace('http://', '').replace('www.', '').split('.')[0].lower()
-                    if domain in company_name.lower() or any(part in domain for part in significant_parts):
-                        website_relevance_score += 2
-                        self.logger.info(f"Domain name '{domain}' matches company name parts")
-                
-                # Final relevance determination
-                if website_relevance_score >= 3:
-                    result['data_quality']['website_relevance'] = 'high'
-                    company_verified = True
-                    self.logger.info(f"Company website verified with score {website_relevance_score}")
-                elif website_relevance_score > 0:
-                    result['data_quality']['website_relevance'] = 'medium'
-                    company_verified = True
-                    self.logger.info(f"Company website partially verified with score {website_relevance_score}")
-                else:
-                    result['data_quality']['website_relevance'] = 'low'
-                    self.logger.warning(f"Company website could not be verified (score: {website_relevance_score})")
-        # Try to scrape Wikipedia - but only use if relevant to the company
-        if company_name:
-            self.logger.info(f"Scraping Wikipedia for: {company_name}")
-            wiki_data = self.scrape_wikipedia(company_name)
+            # The website is the primary source and REQUIRED for accurate data
+            sections = {}
+            sections['website'] = executor.result('website')
+            company_verified = bool(sections['website'] and sections['website']['accepted'])
             
-            # Check if Wikipedia data appears to be about the company
-            if wiki_data and 'overview' in wiki_data:
-                wiki_overview = wiki_data['overview'].lower()
-                wiki_relevance_score = 0
-                
-                # For debugging
-                self.logger.info(f"Wikipedia overview snippet: {wiki_overview[:100]}...")
-                
-                # Check if this is about a company (look for company indicators)
-                company_indicators = ['company', 'corporation', 'inc', 'incorporated', 'llc', 'ltd', 'limited', 'gmbh', 'ag', 'co', 'corp', 
-                                     'founded', 'headquartered', 'business', 'industry', 'products', 'services']
-                company_indicator_matches = [indicator for indicator in company_indicators if indicator in wiki_overview]
-                is_company_article = len(company_indicator_matches) >= 1
-                
-                if is_company_article:
-                    wiki_relevance_score += len(company_indicator_matches)
-                    self.logger.info(f"Wikipedia article contains {len(company_indicator_matches)} company indicators")
-                
-                # Check for company name in overview
-                if company_name.lower() in wiki_overview:
-                    wiki_relevance_score += 3
-                    self.logger.info(f"Full company name '{company_name}' found in Wikipedia overview")
-                
-                # Check for partial name matches
-                company_name_parts = company_name.lower().split()
-                significant_parts = [part for part in company_name_parts if len(part) > 2]
-                company_matches = [part for part in significant_parts if part in wiki_overview]
-                
-                if company_matches:
-                    wiki_relevance_score += len(company_matches)
-                    self.logger.info(f"Found {len(company_matches)} company name parts in Wikipedia: {company_matches}")
-                
-                # Check for website domain match
-                if website:
-                    domain = website.replace('https://', '').replace('http://', '').replace('www.', '').split('.')[0].lower()
-                    if domain in wiki_overview:
-                        wiki_relevance_score += 2
-                        self.logger.info(f"Website domain '{domain}' found in Wikipedia content")
-                
-                # Final relevance determination
-                if wiki_relevance_score >= 4:
-                    self.logger.info(f"Wikipedia data appears highly relevant to {company_name} (score: {wiki_relevance_score})")
-                    self.update_result(result, wiki_data, 'Wikipedia')
-                    result['data_quality']['wikipedia_relevance'] = 'high'
-                elif wiki_relevance_score >= 2:
-                    self.logger.info(f"Wikipedia data appears somewhat relevant to {company_name} (score: {wiki_relevance_score})")
-                    self.update_result(result, wiki_data, 'Wikipedia')
-                    result['data_quality']['wikipedia_relevance'] = 'medium'
-                else:
-                    self.logger.warning(f"Wikipedia data does not appear relevant to {company_name} as a company (score: {wiki_relevance_score})")
-                    result['data_quality']['wikipedia_relevance'] = 'low'
-                    # Don't update result with potentially irrelevant data
-        # Try to scrape financial data - only if we have confirmed this is a company
-        # Try to scrape financial data - only if we have confirmed this is a company
-        if company_name and (company_verified or ('data_quality' in result and 
-                                            (result['data_quality'].get('wikipedia_relevance') == 'high' or 
-                                             result['data_quality'].get('wikipedia_relevance') == 'medium'))):
-            self.logger.info(f"Scraping financial data for: {company_name}")
-            finance_data = self.scrape_finance(company_name)
-            if finance_data:
-                self.update_result(result, finance_data, 'Financial Data')
+            # Don't wait for Wikipedia if the website already verified the company
+            if company_name and company_verified:
+                self.logger.info(f"Scraping financial data for: {company_name}")
+                executor.submit('finance', run_source, 'finance', self.scrape_finance, company_name)
+            
+            # Wikipedia - but only use if relevant to the company
+            sections['wikipedia'] = executor.result('wikipedia')
+            wiki_relevant = bool(sections['wikipedia'] and sections['wikipedia']['accepted'])
+            
+            # Otherwise financial data is only fetched once Wikipedia confirmed this is a company
+            if company_name and not executor.started('finance') and wiki_relevant:
+                self.logger.info(f"Scraping financial data for: {company_name}")
+                executor.submit('finance', run_source, 'finance', self.scrape_finance, company_name)
+            
+            sections['finance'] = executor.result('finance')
+            sections['news'] = executor.result('news')
+        
+        self._merge_sections(result, company_name, {name: section for name, section in sections.items() if section})
+        timed_out = executor.timed_out + [name for name, section in sections.items() if section and section.get('timed_out')]
+        if timed_out:
+            self.logger.warning(f"Lookup for {company_name} ran out of time waiting for {', '.join(timed_out)}")
+            result['data_quality']['timed_out_sources'] = sorted(set(timed_out))
+        if company_name and not (company_verified or wiki_relevant):
+            self.logger.warning(f"Skipping financial data for {company_name} as company identity could not be verified")
+            result['data_quality']['finance_skipped'] = 'Company identity not verified'
+        # Open breakers explain sources that came back empty without being tried
+        result['data_quality']['providers'] = breaker_states()
+        
+        return result
+    
+    def _merge_sections(self, result, company_name, sections):
+        """Merge finished sources into result in a fixed order, so it doesn't depend on which finished first"""
+        website_section = sections.get('website')
+        if website_section:
+            self.update_result(result, website_section['data'], 'Company Website')
+            result['data_quality'].update(website_section['quality'])
+        
+        wiki_section = sections.get('wikipedia')
+        if wiki_section:
+            if wiki_section['accepted']:
+                self.update_result(result, wiki_section['data'], 'Wikipedia')
+            result['data_quality'].update(wiki_section['quality'])
+        
+        finance_section = sections.get('finance')
+        if finance_section:
+            if finance_section['data']:
+                self.update_result(result, finance_section['data'], 'Financial Data')
                 result['data_quality']['financial_data'] = 'found'
             else:
                 self.logger.warning(f"No financial data found for {company_name}")
                 result['data_quality']['financial_data'] = 'not_found'
-        elif company_name:
-            self.logger.warning(f"Skipping financial data for {company_name} as company identity could not be verified")
-            result['data_quality']['finance_skipped'] = 'Company identity not verified'
         
-        # Scrape news articles for the company
-        if company_name:
-            self.logger.info(f"Scraping news for: {company_name}")
-            news_data = self.scrape_news(company_name)
+        # Add news articles to result
+        news_section = sections.get('news')
+        if news_section:
+            news_data = news_section['data']
             if news_data and news_data['articles']:
-                # Add news articles to result
                 result['news'] = news_data['articles']
                 result['data_quality']['news'] = 'found'
-                result['sources']['news'] = 'Google News'
-                result['source_urls']['news'] = 'https://news.google.com'
+                result['sources']['news'] = news_data.get('provider', 'Google News')
+                result['source_urls']['news'] = news_data['source_url']
             else:
                 self.logger.warning(f"No news found for {company_name}")
                 result['data_quality']['news'] = 'not_found'
+    
+    def _verify_website(self, company_name, website, website_data, quality):
+        """Score how well the website content matches the company, recording the verdict in quality"""
+        # Verify we have relevant company data, not generic information
+        if not (website_data and ('title' in website_data or 'description' in website_data or 'about' in website_data)):
+            return False
         
-        return result
+        website_content = (website_data.get('title', '') + ' ' + website_data.get('description', '') + ' ' + 
+                          website_data.get('about', ''))
+        
+        # For debugging
+        self.logger.info(f"Website content snippet: {website_content[:100].lower()}...")
+        
+        relevance = RelevanceScorer(company_name, 'website').score(website_content)
+        website_relevance_score = relevance.score
+        if relevance.terms('indicator'):
+            self.logger.info(f"Website appears to be a company website (found company indicators: {relevance.terms('indicator')})")
+        if relevance.terms('name'):
+            self.logger.info(f"Full company name '{company_name}' found in website content")
+        if relevance.terms('name_part'):
+            self.logger.info(f"Found {len(relevance.terms('name_part'))} company name parts in website content: {relevance.terms('name_part')}")
+        
+        # Domain name match with company name
+        if company_name:
+            domain = domain_label(website)
+            significant_parts = [part for part in company_name.lower().split() if len(part) > 2]
+            if domain in company_name.lower() or any(part in domain for part in significant_parts):
+                website_relevance_score += 2
+                self.logger.info(f"Domain name '{domain}' matches company name parts")
+        
+        # Final relevance determination
+        if website_relevance_score >= 3:
+            quality['website_relevance'] = 'high'
+            self.logger.info(f"Company website verified with score {website_relevance_score}")
+            return True
+        elif website_relevance_score > 0:
+            quality['website_relevance'] = 'medium'
+            self.logger.info(f"Company website partially verified with score {website_relevance_score}")
+            return True
+        
+        quality['website_relevance'] = 'low'
+        self.logger.warning(f"Company website could not be verified (score: {website_relevance_score})")
+        return False
+    
+    def _verify_wikipedia(self, company_name, website, wiki_data, quality):
+        """Score whether the Wikipedia article is about this company, recording the verdict in quality"""
+        # Check if Wikipedia data appears to be about the company
+        if not (wiki_data and 'overview' in wiki_data):
+            return False
+        
+        wiki_overview = wiki_data['overview']
+        
+        # For debugging
+        self.logger.info(f"Wikipedia overview snippet: {wiki_overview[:100].lower()}...")
+        
+        scorer = RelevanceScorer(company_name, 'wikipedia', domain=domain_label(website) if website else None)
+        relevance = scorer.score(wiki_overview)
+        wiki_relevance_score = relevance.score
+        if relevance.terms('indicator'):
+            self.logger.info(f"Wikipedia article contains {len(relevance.terms('indicator'))} company indicators")
+        if relevance.terms('name'):
+            self.logger.info(f"Full company name '{company_name}' found in Wikipedia overview")
+        if relevance.terms('name_part'):
+            self.logger.info(f"Found {len(relevance.terms('name_part'))} company name parts in Wikipedia: {relevance.terms('name_part')}")
+        if relevance.terms('domain'):
+            self.logger.info(f"Website domain '{relevance.terms('domain')[0]}' found in Wikipedia content")
+        
+        # Final relevance determination
+        if wiki_relevance_score >= 4:
+            self.logger.info(f"Wikipedia data appears highly relevant to {company_name} (score: {wiki_relevance_score})")
+            quality['wikipedia_relevance'] = 'high'
+            return True
+        elif wiki_relevance_score >= 2:
+            self.logger.info(f"Wikipedia data appears somewhat relevant to {company_name} (score: {wiki_relevance_score})")
+            quality['wikipedia_relevance'] = 'medium'
+            return True
+        
+        self.logger.warning(f"Wikipedia data does not appear relevant to {company_name} as a company (score: {wiki_relevance_score})")
+        quality['wikipedia_relevance'] = 'low'
+        # Don't update result with potentially irrelevant data
+        return False
     def scrape_website(self, website):
         if not website.startswith(('http://', 'https://')):
             website = f"https://{website}"
@@ -371,752 +500,303 @@ class CompanyScraper:
             'source_url': website  # Store the source URL to track where data came from
         }
         try:
-            if self.driver:
-                self.logger.info(f"Scraping website: {website}")
-                try:
-                    # Check if driver is still valid and restart if needed
-                    try:
-                        self.driver.current_url  # Test if session is valid
-                    except Exception as session_error:
-                        self.logger.warning(f"Chrome driver session invalid, restarting: {session_error}")
-                        self.setup_browser()  # Recreate the browser session
-                    
-                    # Now try to navigate to the website
-                    self.driver.get(website)
-                    time.sleep(3)  # Wait for page to load
-                except Exception as e:
-                    self.logger.error(f"Error navigating to {website}: {e}")
-                    # Fall back to requests
-                    self.logger.info(f"Falling back to requests for {website}")
-                    # Fall back to requests
-                    self.logger.info(f"Falling back to requests for {website}")
-                    try:
-                        response = requests.get(website, timeout=10)
-                        if response.status_code == 200:
-                            soup = BeautifulSoup(response.text, 'html.parser')
-                            # Extract title
-                            if soup.title:
-                                data['title'] = soup.title.text.strip()
-                                self.logger.info(f"Found title via requests: {data['title']}")
-                            # Extract description
-                            meta_desc = soup.find('meta', attrs={'name': 'description'})
-                            if meta_desc and 'content' in meta_desc.attrs:
-                                data['description'] = meta_desc['content']
-                                self.logger.info(f"Found description via requests: {data['description'][:50]}..." if len(data['description']) > 50 else data['description'])
-                            return data
-                    except Exception as req_e:
-                        self.logger.error(f"Requests fallback also failed for {website}: {req_e}")
-                        return data
-
-                
-                # Extract company description
-                description_elements = self.driver.find_elements(By.XPATH, 
-                    "//meta[@name='description']")
-                if description_elements:
-                    data['description'] = description_elements[0].get_attribute('content')
-                    self.logger.info(f"Found description: {data['description'][:50]}..." if 'description' in data and len(data['description']) > 50 else "No description found")
-                
-                # Try to extract title
-                title = self.driver.title
-                if title:
-                    data['title'] = title
-                    self.logger.info(f"Found title: {title}")
-                
-                # Extract page content
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                
-                # Try to find about section - more comprehensive search
-                about_keywords = ['about us', 'our company', 'who we are', 'about', 'mission', 'vision']
-                
-                # Check for about sections by ID or class
-                about_section = soup.find(id=lambda i: i and any(keyword in i.lower() for keyword in about_keywords))
-                if not about_section:
-                    about_section = soup.find(class_=lambda c: c and any(keyword in c.lower() for keyword in about_keywords))
-                
-                # Check for about sections by content
-                if not about_section:
-                    about_section = soup.find(lambda tag: tag.name and 
-                                             any(word in tag.get_text().lower() 
-                                                 for word in about_keywords))
-                
-                if about_section:
-                    data['about'] = about_section.get_text().strip()
-                    self.logger.info(f"Found about section: {data['about'][:50]}..." if len(data['about']) > 50 else data['about'])
-                
-                # Try to find products/services - more comprehensive search
-                products = []
-                product_keywords = ['products', 'services', 'solutions', 'offerings', 'what we do']
-                
-                # Try by ID or class first
-                product_section = soup.find(id=lambda i: i and any(keyword in i.lower() for keyword in product_keywords))
-                if not product_section:
-                    product_section = soup.find(class_=lambda c: c and any(keyword in c.lower() for keyword in product_keywords))
-                
-                # Try by content
-                if not product_section:
-                    product_section = soup.find(lambda tag: tag.name and 
-                                               any(word in tag.get_text().lower() 
-                                                   for word in product_keywords))
-                
-                if product_section:
-                    # Look for headings first
-                    for item in product_section.find_all(['h1', 'h2', 'h3', 'h4', 'h5']):
-                        if item.get_text().strip() and len(item.get_text().strip()) < 100:  # Reasonable length for a product name
-                            products.append(item.get_text().strip())
-                    
-                    # If no headings found, try list items
-                    if not products:
-                        for item in product_section.find_all(['li']):
-                            if item.get_text().strip() and len(item.get_text().strip()) < 100:
-                                products.append(item.get_text().strip())
-                
-                if products:
-                    data['products'] = products[:5]  # Limit to 5 products
-                    self.logger.info(f"Found {len(products)} products/services")
-
-                # Try to find leadership information
-                data['leadership'] = []  # Initialize leadership array
-                leadership_keywords = ['leadership', 'management', 'team', 'executives', 'founders']
-                
-                # Look for leadership sections
-                leadership_section = soup.find(id=lambda i: i and any(keyword in i.lower() for keyword in leadership_keywords))
-                if not leadership_section:
-                    leadership_section = soup.find(class_=lambda c: c and any(keyword in c.lower() for keyword in leadership_keywords))
-                
-                if leadership_section:
-                    # Try to find leadership elements - often in headings followed by descriptions
-                    for name_elem in leadership_section.find_all(['h3', 'h4', 'h5', 'strong', 'b']):
-                        name = name_elem.get_text().strip()
-                        position_elem = name_elem.find_next(['p', 'div', 'span'])
-                        position = position_elem.get_text().strip() if position_elem else 'Leadership'
-                        
-                        if name and len(name) < 50:  # Reasonable length for a name
-                            data['leadership'].append({
-                                'name': name,
-                                'position': position
-                            })
-                            self.logger.info(f"Found leader from website: {name} ({position})")
-                # Try to find leadership information
-                data['leadership'] = []  # Initialize leadership array
-                leadership_keywords = ['leadership', 'management', 'team', 'executives', 'founders', 'board', 'directors']
-                
-                # Look for leadership sections
-                leadership_section = soup.find(id=lambda i: i and any(keyword in i.lower() for keyword in leadership_keywords))
-                if not leadership_section:
-                    leadership_section = soup.find(class_=lambda c: c and any(keyword in c.lower() for keyword in leadership_keywords))
-                
-                # Try by content
-                if not leadership_section:
-                    leadership_section = soup.find(lambda tag: tag.name and tag.name.lower() in ['h1', 'h2', 'h3', 'h4'] and 
-                                                  any(word in tag.get_text().lower() for word in leadership_keywords))
-                    if leadership_section:
-                        # Get the next sibling elements that might contain the team info
-                        leadership_section = leadership_section.find_next(['div', 'section', 'ul'])
-                
-                if leadership_section:
-                    # Try to find leadership elements - often in headings followed by descriptions
-                    leaders = []
-                    
-                    # Look for common leadership patterns
-                    # Pattern 1: h3/h4 with name followed by position in p or div
-                    for name_elem in leadership_section.find_all(['h3', 'h4', 'h5', 'strong', 'b']):
-                        name = name_elem.get_text().strip()
-                        position_elem = name_elem.find_next(['p', 'div', 'span'])
-                        position = position_elem.get_text().strip() if position_elem else 'Leadership'
-                        
-                        if name and len(name) < 50:  # Reasonable length for a name
-                            data['leadership'].append({
-                                'name': name,
-                                'position': position
-                            })
-                            self.logger.info(f"Found leader from website: {name} ({position})")
-                    
-                    # If no leaders found, try other common patterns
-                    if not data['leadership']:
-                        # Look for list items that might contain leadership info
-                        for item in leadership_section.find_all('li'):
-                            text = item.get_text().strip()
-                            # Try to separate name and position
-                            if ',' in text or '-' in text or '–' in text:
-                                parts = re.split('[,\-–]', text, 1)
-                                if len(parts) >= 2:
-                                    name = parts[0].strip()
-                                    position = parts[1].strip()
-                                    data['leadership'].append({
-                                        'name': name,
-                                        'position': position
-                                    })
-                                    self.logger.info(f"Found leader from list: {name} ({position})")
-                    
-                    # If still no leaders found, try looking for structured data
-                    if not data['leadership']:
-                        for card in leadership_section.find_all(['div', 'article', 'section']):
-                            # Look for name and position within the card
-                            name_elem = card.find(['h3', 'h4', 'h5', 'strong', 'b'])
-                            if name_elem:
-                                name = name_elem.get_text().strip()
-                                position_elem = card.find(['p', 'div', 'span'])
-                                position = position_elem.get_text().strip() if position_elem else 'Leadership'
-                                
-                                if name and len(name) < 50 and name != position:  # Avoid duplicates
-                                    data['leadership'].append({
-                                        'name': name,
-                                        'position': position
-                                    })
-                                    self.logger.info(f"Found leader from card: {name} ({position})")
-                # Try to find leadership information
-                data['leadership'] = []  # Initialize leadership array
-                leadership_keywords = ['leadership', 'management', 'team', 'executives', 'founders', 'board', 'directors']
-                
-                # Look for leadership sections
-                leadership_section = soup.find(id=lambda i: i and any(keyword in i.lower() for keyword in leadership_keywords))
-                if not leadership_section:
-                    leadership_section = soup.find(class_=lambda c: c and any(keyword in c.lower() for keyword in leadership_keywords))
-                
-                # Try by content
-                if not leadership_section:
-                    leadership_section = soup.find(lambda tag: tag.name and tag.name.lower() in ['h1', 'h2', 'h3', 'h4'] and 
-                                                  any(word in tag.get_text().lower() for word in leadership_keywords))
-                    if leadership_section:
-                        # Get the next sibling elements that might contain the team info
-                        leadership_section = leadership_section.find_next(['div', 'section', 'ul'])
-                
-                if leadership_section:
-                    # Try to find leadership elements - often in headings followed by descriptions
-                    leaders = []
-                    
-                    # Look for common leadership patterns
-                    # Pattern 1: h3/h4 with name followed by position in p or div
-                    for name_elem in leadership_section.find_all(['h3', 'h4', 'h5', 'strong', 'b']):
-                        name = name_elem.get_text().strip()
-                        position_elem = name_elem.find_next(['p', 'div', 'span'])
-                        position = position_elem.get_text().strip() if position_elem else 'Leadership'
-                        
-                        if name and len(name) < 50:  # Reasonable length for a name
-                            data['leadership'].append({
-                                'name': name,
-                                'position': position
-                            })
-                            self.logger.info(f"Found leader from website: {name} ({position})")
-                    
-                    # If no leaders found, try other common patterns
-                    if not data['leadership']:
-                        # Look for list items that might contain leadership info
-                        for item in leadership_section.find_all('li'):
-                            text = item.get_text().strip()
-                            # Try to separate name and position
-                            if ',' in text or '-' in text or '–' in text:
-                                parts = re.split('[,\-–]', text, 1)
-                                if len(parts) >= 2:
-                                    name = parts[0].strip()
-                                    position = parts[1].strip()
-                                    data['leadership'].append({
-                                        'name': name,
-                                        'position': position
-                                    })
-                                    self.logger.info(f"Found leader from list: {name} ({position})")
-                    
-                    # If still no leaders found, try looking for structured data
-                    if not data['leadership']:
-                        for card in leadership_section.find_all(['div', 'article', 'section']):
-                            # Look for name and position within the card
-                            name_elem = card.find(['h3', 'h4', 'h5', 'strong', 'b'])
-                            if name_elem:
-                                name = name_elem.get_text().strip()
-                                position_elem = card.find(['p', 'div', 'span'])
-                                position = position_elem.get_text().strip() if position_elem else 'Leadership'
-                                
-                                if name and len(name) < 50 and name != position:  # Avoid duplicates
-                                    data['leadership'].append({
-                                        'name': name,
-                                        'position': position
-                                    })
-                                    self.logger.info(f"Found leader from card: {name} ({position})")
-                # Try to find leadership information
-                data['leadership'] = []  # Initialize leadership array
-                leadership_keywords = ['leadership', 'management', 'team', 'executives', 'founders', 'board', 'directors']
+            self.logger.info(f"Scraping website: {website}")
+            # The landing page plus whichever about, team and product pages the site has
+            pages = self.site_crawler.crawl(website)
+            if not pages:
+                self.logger.warning(f"Could not load website {website}")
+                return data
+            
+            # Extract page content
+            soup = pages[0].soup
+            
+            # Try to extract title
+            if soup.title and soup.title.text.strip():
+                data['title'] = soup.title.text.strip()
+                self.logger.info(f"Found title: {data['title']}")
+            
+            # Extract company description
+            meta_desc = soup.find('meta', attrs={'name': 'description'})
+            if meta_desc and meta_desc.get('content'):
+                data['description'] = meta_desc['content']
+                self.logger.info(f"Found description: {data['description'][:50]}..." if len(data['description']) > 50 else data['description'])
+            
+            products = []
+            data['leadership'] = []
+            leader_names = set()
+            for page in pages:
+                # About, products and leadership sections are all located in a single pass
+                sections = classify_sections(page.soup)
+                if page.section and not sections[page.section]:
+                    # A /team or /products page is that section even without a telling id, class or heading
+                    sections[page.section] = page.soup.find('main') or page.soup.body
                 
-                # Look for leadership sections
-                leadership_section = soup.find(id=lambda i: i and any(keyword in i.lower() for keyword in leadership_keywords))
-                if not leadership_section:
-                    leadership_section = soup.find(class_=lambda c: c and any(keyword in c.lower() for keyword in leadership_keywords))
+                if sections['about'] and 'about' not in data:
+                    data['about'] = sections['about'].get_text().strip()
+                    self.logger.info(f"Found about section on {page.url}: {data['about'][:50]}..." if len(data['about']) > 50 else data['about'])
                 
-                # Try by content
-                if not leadership_section:
-                    leadership_section = soup.find(lambda tag: tag.name and tag.name.lower() in ['h1', 'h2', 'h3', 'h4'] and 
-                                                  any(word in tag.get_text().lower() for word in leadership_keywords))
-                    if leadership_section:
-                        # Get the next sibling elements that might contain the team info
-                        leadership_section = leadership_section.find_next(['div', 'section', 'ul'])
+                if sections['products']:
+                    products.extend(product for product in extract_products(sections['products']) if product not in products)
                 
-                if leadership_section:
-                    # Try to find leadership elements - often in headings followed by descriptions
-                    leaders = []
-                    
-                    # Look for common leadership patterns
-                    # Pattern 1: h3/h4 with name followed by position in p or div
-                    for name_elem in leadership_section.find_all(['h3', 'h4', 'h5', 'strong', 'b']):
-                        name = name_elem.get_text().strip()
-                        position_elem = name_elem.find_next(['p', 'div', 'span'])
-                        position = position_elem.get_text().strip() if position_elem else 'Leadership'
-                        
-                        if name and len(name) < 50:  # Reasonable length for a name
-                            data['leadership'].append({
-                                'name': name,
-                                'position': position
-                            })
-                            self.logger.info(f"Found leader from website: {name} ({position})")
-                    
-                    # If no leaders found, try other common patterns
-                    if not data['leadership']:
-                        # Look for list items that might contain leadership info
-                        for item in leadership_section.find_all('li'):
-                            text = item.get_text().strip()
-                            # Try to separate name and position
-                            if ',' in text or '-' in text or '–' in text:
-                                parts = re.split('[,\-–]', text, 1)
-                                if len(parts) >= 2:
-                                    name = parts[0].strip()
-                                    position = parts[1].strip()
-                                    data['leadership'].append({
-                                        'name': name,
-                                        'position': position
-                                    })
-                                    self.logger.info(f"Found leader from list: {name} ({position})")
-                    
-                    # If still no leaders found, try looking for structured data
-                    if not data['leadership']:
-                        for card in leadership_section.find_all(['div', 'article', 'section']):
-                            # Look for name and position within the card
-                            name_elem = card.find(['h3', 'h4', 'h5', 'strong', 'b'])
-                            if name_elem:
-                                name = name_elem.get_text().strip()
-                                position_elem = card.find(['p', 'div', 'span'])
-                                position = position_elem.get_text().strip() if position_elem else 'Leadership'
-                                
-                                if name and len(name) < 50 and name != position:  # Avoid duplicates
-                                    data['leadership'].append({
-                                        'name': name,
-                                        'position': position
-                                    })
-                                    self.logger.info(f"Found leader from card: {name} ({position})")
+                for leader in extract_leaders(sections['leadership']) if sections['leadership'] else []:
+                    if leader['name'].lower() not in leader_names:
+                        leader_names.add(leader['name'].lower())
+                        data['leadership'].append(leader)
+                        self.logger.info(f"Found leader from website: {leader['name']} ({leader['position']})")
+            
+            if products:
+                data['products'] = products[:MAX_WEBSITE_PRODUCTS]
+                self.logger.info(f"Found {len(data['products'])} products/services")
         except Exception as e:
             self.logger.error(f"Error scraping website {website}: {e}")
         
         return data
     
     def scrape_wikipedia(self, company_name):
+        """Wikipedia overview and infobox details: offline index, then the MediaWiki API, then rendered pages"""
+        if self.wiki_index:
+            data = self.wiki_index.lookup(company_name)
+            if data:
+                self.logger.info(f"Found {company_name} in the offline Wikipedia index: {data['article_title']}")
+                return data
+        try:
+            return self._scrape_wikipedia_api(company_name)
+        except WikipediaApiError as e:
+            self.logger.warning(f"Wikipedia API unavailable ({e}), falling back to page scraping")
+        return self._scrape_wikipedia_html(company_name)
+    
+    def _scrape_wikipedia_api(self, company_name):
+        """Look the company up with one batched title query and one lead-section parse"""
+        # The disambiguated title is tried alongside the plain name in the same batch
+        candidates = [company_name]
+        if not has_legal_form(company_name):
+            candidates.append(f"{company_name} (company)")
+        pages = self.wikipedia.get_pages(candidates)
+        page = next((pages[title] for title in reversed(candidates) if title in pages and not pages[title].disambiguation), None)
+        
+        if page is None or non_company_terms(page.intro):
+            if page is not None:
+                self.logger.warning(f"Wikipedia article {page.title} appears to be about a non-company entity")
+            page = self._search_wikipedia_api(company_name) or page
+        if page is None:
+            self.logger.warning(f"No Wikipedia results found for {company_name}")
+            return {}
+        
+        data = {'source_url': page.url, 'overview': page.intro}
+        self.logger.info(f"Found Wikipedia overview via API: {page.intro[:50]}...")
+        indicators = non_company_terms(page.intro)
+        if indicators:
+            data['is_company_article'] = False
+            data['non_company_indicators'] = indicators
+        
+        try:
+            soup = make_soup(self.wikipedia.lead_html(page.title), 'wikipedia')
+            self._parse_wikipedia_infobox(soup, data)
+        except WikipediaApiError as e:
+            self.logger.warning(f"Could not load the infobox for {page.title}: {e}")
+        return data
+    
+    def _search_wikipedia_api(self, company_name):
+        """Best search hit that reads like a company article, or None"""
+        titles = self.wikipedia.search(f"{company_name} company", limit=3)
+        if not titles:
+            return None
+        pages = self.wikipedia.get_pages(titles)
+        candidates = [pages[title] for title in titles if title in pages and not pages[title].disambiguation]
+        candidates = [page for page in candidates if reads_like_company(page.intro)]
+        if not candidates:
+            return None
+        # Score every company-like hit at once and keep the best, earlier hits winning ties
+        scores = RelevanceScorer(company_name, 'wikipedia').score_many(page.intro for page in candidates)
+        best = max(range(len(candidates)), key=lambda i: (scores[i].score, -i))
+        self.logger.info(f"Found company-specific Wikipedia article: {candidates[best].title} (score {scores[best].score})")
+        return candidates[best]
+    
+    def _scrape_wikipedia_html(self, company_name):
         data = {
             'source_url': f"https://en.wikipedia.org/wiki/{company_name.replace(' ', '_')}"  # Store source URL
         }
         try:
             # Add company to search terms to increase relevance
-            if not any(term in company_name.lower() for term in ['company', 'corporation', 'inc', 'incorporated', 'llc', 'ltd', 'limited']):
+            if not has_legal_form(company_name):
                 search_term = f"{company_name} company"
                 data['source_url'] = f"https://en.wikipedia.org/wiki/{search_term.replace(' ', '_')}"
             
             # Try exact match first
             search_url = data['source_url']
             self.logger.info(f"Scraping Wikipedia: {search_url}")
-
+            page = self.fetcher.fetch(search_url, 'wikipedia')
             
-            if self.driver:
-                try:
-                    # Check if driver is still valid and restart if needed
-                    try:
-                        self.driver.current_url  # Test if session is valid
-                    except Exception as session_error:
-                        self.logger.warning(f"Chrome driver session invalid, restarting: {session_error}")
-                        self.setup_browser()  # Recreate the browser session
-                    
-                    # Now try to navigate to Wikipedia
-                    self.driver.get(search_url)
-                    time.sleep(2)
-                except Exception as e:
-                    self.logger.error(f"Error navigating to Wikipedia: {e}")
-                    # Fall back to requests
-                    self.logger.info(f"Falling back to requests for Wikipedia")
-                    try:
-                        response = requests.get(search_url, timeout=10)
-                        if response.status_code == 200:
-                            soup = BeautifulSoup(response.text, 'html.parser')
-                            # Continue with normal processing using the soup object
-                            # Get company overview
-                            first_paragraph = soup.select_one('#mw-content-text p:not(.mw-empty-elt)')
-                            if first_paragraph:
-                                data['overview'] = first_paragraph.get_text().strip()
-                                self.logger.info(f"Found Wikipedia overview via requests: {data['overview'][:50]}..." if len(data['overview']) > 50 else data['overview'])
-                                
-                                # Check if this is about a company or a generic term
-                                overview_text = data['overview'].lower()
-                                
-                                # Check for non-company indicators
-                                non_company_indicators = ['ancient', 'river', 'mythology', 'historical', 'history', 
-                                                          'century', 'bc', 'b.c.', 'geographical', 'geography']
-                                
-                                if any(indicator in overview_text for indicator in non_company_indicators):
-                                    self.logger.warning(f"Wikipedia article appears to be about a non-company entity (found non-company indicators)")
-                                    data['is_company_article'] = False
-                                    data['non_company_indicators'] = [ind for ind in non_company_indicators if ind in overview_text]
-                                    
-                                    # Try searching for the company name with "company" explicitly added
-                                    company_search_url = f"https://en.wikipedia.org/wiki/{company_name.replace(' ', '_')}_company"
-                                    self.logger.info(f"Trying company-specific search: {company_search_url}")
-                                    try:
-                                        company_response = requests.get(company_search_url, timeout=10)
-                                        if company_response.status_code == 200:
-                                            company_soup = BeautifulSoup(company_response.text, 'html.parser')
-                                            company_paragraph = company_soup.select_one('#mw-content-text p:not(.mw-empty-elt)')
-                                            if company_paragraph:
-                                                # Check if this looks more like a company
-                                                company_indicators = ['company', 'corporation', 'founded', 'business', 'industry']
-                                                company_text = company_paragraph.get_text().lower()
-                                                if any(indicator in company_text for indicator in company_indicators):
-                                                    data['overview'] = company_paragraph.get_text().strip()
-                                                    data['is_company_article'] = True
-                                                    self.logger.info(f"Found company-specific Wikipedia article")
-                                    except Exception as company_search_error:
-                                        self.logger.warning(f"Company-specific search failed: {company_search_error}")
-                            
-                            # Get infobox data
-                            infobox = soup.select_one('.infobox')
-                            if infobox:
-                                # Process infobox data
-                                self.logger.info("Found infobox via requests")
-                                # Extract founded date
-                                founded = infobox.find(lambda tag: tag.name == 'th' and 'founded' in tag.get_text().lower())
-                                if founded and founded.find_next('td'):
-                                    data['founded'] = founded.find_next('td').get_text().strip()
-                                    self.logger.info(f"Found founding date: {data['founded']}")
-                                
-                                # Get headquarters
-                                hq = infobox.find(lambda tag: tag.name == 'th' and any(x in tag.get_text().lower() 
-                                                                                      for x in ['headquarters', 'location']))
-                                if hq and hq.find_next('td'):
-                                    data['headquarters'] = hq.find_next('td').get_text().strip()
-                                    self.logger.info(f"Found headquarters: {data['headquarters']}")
-                                
-                                # Get industry
-                                industry = infobox.find(lambda tag: tag.name == 'th' and 'industry' in tag.get_text().lower())
-                                if industry and industry.find_next('td'):
-                                    data['industry'] = industry.find_next('td').get_text().strip()
-                                    self.logger.info(f"Found industry: {data['industry']}")
-                                
-                                # Get number of employees
-                                employees = infobox.find(lambda tag: tag.name == 'th' and 'employees' in tag.get_text().lower())
-                                if employees and employees.find_next('td'):
-                                    data['employees'] = employees.find_next('td').get_text().strip()
-                                    self.logger.info(f"Found employee count: {data['employees']}")
-                                
-                                # Get revenue
-                                revenue = infobox.find(lambda tag: tag.name == 'th' and 'revenue' in tag.get_text().lower())
-                                if revenue and revenue.find_next('td'):
-                                    data['revenue'] = revenue.find_next('td').get_text().strip()
-                                    self.logger.info(f"Found revenue: {data['revenue']}")
-                            return data
-                    except Exception as req_e:
-                        self.logger.error(f"Requests fallback also failed for Wikipedia: {req_e}")
-                        return data
-
+            # Check if page exists
+            if not page or not page.ok:
+                # Try search instead
+                self.logger.info(f"No exact match for {company_name}, trying search")
+                page = self._search_wikipedia(company_name)
+                if not page:
+                    self.logger.warning(f"No Wikipedia results found for {company_name}")
+                    return data
             
-            if self.driver:
-                self.driver.get(search_url)
-                time.sleep(2)
-                
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                
-                # Check if page exists
-                if "Wikipedia does not have an article with this exact name" in soup.get_text():
-                    # Try search instead
-                    self.logger.info(f"No exact match for {company_name}, trying search")
-                    search_url = f"https://en.wikipedia.org/w/index.php?search={company_name.replace(' ', '+')}"
-                    self.driver.get(search_url)
-                    time.sleep(2)
-                    
-                    # Check if we were redirected to a page (means there was a close match)
-                    if "Search results" not in self.driver.title:
-                        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                    else:
-                        # Try to get the first search result
-                        search_results = self.driver.find_elements(By.CSS_SELECTOR, '.mw-search-result-heading a')
-                        if search_results:
-                            first_result = search_results[0]
-                            first_result.click()
-                            time.sleep(2)
-                            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                        else:
-                            self.logger.warning(f"No Wikipedia results found for {company_name}")
-                            return data
-                
-                # Get company overview
-                first_paragraph = soup.select_one('#mw-content-text p:not(.mw-empty-elt)')
-                if first_paragraph:
-                    data['overview'] = first_paragraph.get_text().strip()
-                    self.logger.info(f"Found Wikipedia overview: {data['overview'][:50]}..." if len(data['overview']) > 50 else data['overview'])
-                    
-                    # Check if this is about a company or a generic term
-                    overview_text = data['overview'].lower()
-                    
-                    # Check for non-company indicators
-                    non_company_indicators = ['ancient', 'river', 'mythology', 'historical', 'history', 
-                                              'century', 'bc', 'b.c.', 'geographical', 'geography']
-                    
-                    if any(indicator in overview_text for indicator in non_company_indicators):
-                        self.logger.warning(f"Wikipedia article appears to be about a non-company entity (found non-company indicators)")
-                        data['is_company_article'] = False
-                        data['non_company_indicators'] = [ind for ind in non_company_indicators if ind in overview_text]
-                        
-                        # Try searching for the company name with "company" explicitly added
-                        search_url = f"https://en.wikipedia.org/w/index.php?search={company_name.replace(' ', '+')}"
-                        self.logger.info(f"Trying company-specific search: {search_url}")
-                        self.driver.get(search_url)
-                        time.sleep(2)
-                        
-                        # Check search results
-                        if "Search results" not in self.driver.title:
-                            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                            company_paragraph = soup.select_one('#mw-content-text p:not(.mw-empty-elt)')
-                            if company_paragraph:
-                                # Check if this looks more like a company
-                                company_indicators = ['company', 'corporation', 'founded', 'business', 'industry']
-                                company_text = company_paragraph.get_text().lower()
-                                if any(indicator in company_text for indicator in company_indicators):
-                                    data['overview'] = company_paragraph.get_text().strip()
-                                    data['is_company_article'] = True
-                                    self.logger.info(f"Found company-specific Wikipedia article")
-                        else:
-                            # Try to get the first search result
-                            search_results = self.driver.find_elements(By.CSS_SELECTOR, '.mw-search-result-heading a')
-                            if search_results:
-                                first_result = search_results[0]
-                                first_result.click()
-                                time.sleep(2)
-                                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                                company_paragraph = soup.select_one('#mw-content-text p:not(.mw-empty-elt)')
-                                if company_paragraph:
-                                    data['overview'] = company_paragraph.get_text().strip()
-                                    data['is_company_article'] = True
-                                    self.logger.info(f"Found company-specific Wikipedia article from search results")
+            soup = make_soup(page.html, 'wikipedia', parse_only=WIKIPEDIA_CONTENT)
+            data['source_url'] = page.url
+            
+            # Get company overview
+            first_paragraph = soup.select_one('#mw-content-text p:not(.mw-empty-elt)')
+            if first_paragraph:
+                data['overview'] = first_paragraph.get_text().strip()
+                self.logger.info(f"Found Wikipedia overview: {data['overview'][:50]}..." if len(data['overview']) > 50 else data['overview'])
                 
-                # Get infobox data
-                infobox = soup.select_one('.infobox')
-                if infobox:
-                    # Get founded date
-                    founded = infobox.find(lambda tag: tag.name == 'th' and 'founded' in tag.get_text().lower())
-                    if founded and founded.find_next('td'):
-                        data['founded'] = founded.find_next('td').get_text().strip()
-                        self.logger.info(f"Found founding date: {data['founded']}")
-                    
-                    # Get headquarters
-                    hq = infobox.find(lambda tag: tag.name == 'th' and any(x in tag.get_text().lower() 
-                                                                          for x in ['headquarters', 'location']))
-                    if hq and hq.find_next('td'):
-                        data['headquarters'] = hq.find_next('td').get_text().strip()
-                        self.logger.info(f"Found headquarters: {data['headquarters']}")
-                    
-                    # Get industry
-                    industry = infobox.find(lambda tag: tag.name == 'th' and 'industry' in tag.get_text().lower())
-                    if industry and industry.find_next('td'):
-                        data['industry'] = industry.find_next('td').get_text().strip()
-                        self.logger.info(f"Found industry: {data['industry']}")
+                # Check if this is about a company or a generic term
+                non_company_indicators = non_company_terms(data['overview'])
+                if non_company_indicators:
+                    self.logger.warning(f"Wikipedia article appears to be about a non-company entity (found non-company indicators)")
+                    data['is_company_article'] = False
+                    data['non_company_indicators'] = non_company_indicators
                     
-                    # Get number of employees
-                    employees = infobox.find(lambda tag: tag.name == 'th' and 'employees' in tag.get_text().lower())
-                    if employees and employees.find_next('td'):
-                        data['employees'] = employees.find_next('td').get_text().strip()
-                        self.logger.info(f"Found employee count: {data['employees']}")
-                    
-                    # Get revenue
-                    revenue = infobox.find(lambda tag: tag.name == 'th' and 'revenue' in tag.get_text().lower())
-                    if revenue and revenue.find_next('td'):
-                        data['revenue'] = revenue.find_next('td').get_text().strip()
-                        self.logger.info(f"Found revenue: {data['revenue']}")
-                    
-                    # Get leadership information
-                    leadership_keys = ['founder', 'ceo', 'key people', 'key person', 'chairman', 'president', 'directors']
-                    for key in leadership_keys:
-                        leader_row = infobox.find(lambda tag: tag.name == 'th' and key in tag.get_text().lower())
-                        if leader_row and leader_row.find_next('td'):
-                            leader_text = leader_row.find_next('td').get_text().strip()
-                            position = leader_row.get_text().strip()
-                            # Split if there are multiple people
-                            if ',' in leader_text or '\n' in leader_text:
-                                leaders = [l.strip() for l in re.split('[,\\n]', leader_text) if l.strip()]
-                                for leader in leaders:
-                                    data['leadership'].append({
-                                        'name': leader,
-                                        'position': position
-                                    })
-                                    self.logger.info(f"Found leader: {leader} ({position})")
-                            else:
-                                data['leadership'].append({
-                                    'name': leader_text,
-                                    'position': position
-                                })
-                                self.logger.info(f"Found leader: {leader_text} ({position})")
+                    # Try searching for the company name with "company" explicitly added
+                    self.logger.info(f"Trying company-specific search for {company_name}")
+                    company_page = self._search_wikipedia(company_name)
+                    if company_page:
+                        company_soup = make_soup(company_page.html, 'wikipedia', parse_only=WIKIPEDIA_CONTENT)
+                        company_paragraph = company_soup.select_one('#mw-content-text p:not(.mw-empty-elt)')
+                        if company_paragraph:
+                            # Check if this looks more like a company
+                            if reads_like_company(company_paragraph.get_text()):
+                                data['overview'] = company_paragraph.get_text().strip()
+                                data['is_company_article'] = True
+                                self.logger.info(f"Found company-specific Wikipedia article")
+            
+            self._parse_wikipedia_infobox(soup, data)
         
         except Exception as e:
             self.logger.error(f"Error scraping Wikipedia for {company_name}: {e}")
         
         return data
     
+    def _parse_wikipedia_infobox(self, soup, data):
+        """Copy founding date, headquarters, industry, size, revenue and leaders from the infobox into data"""
+        infobox = soup.select_one('.infobox')
+        if not infobox:
+            return
+        
+        # Get founded date
+        founded = infobox.find(lambda tag: tag.name == 'th' and 'founded' in tag.get_text().lower())
+        if founded and founded.find_next('td'):
+            data['founded'] = founded.find_next('td').get_text().strip()
+            self.logger.info(f"Found founding date: {data['founded']}")
+        
+        # Get headquarters
+        hq = infobox.find(lambda tag: tag.name == 'th' and any(x in tag.get_text().lower() 
+                                                              for x in ['headquarters', 'location']))
+        if hq and hq.find_next('td'):
+            data['headquarters'] = hq.find_next('td').get_text().strip()
+            self.logger.info(f"Found headquarters: {data['headquarters']}")
+        
+        # Get industry
+        industry = infobox.find(lambda tag: tag.name == 'th' and 'industry' in tag.get_text().lower())
+        if industry and industry.find_next('td'):
+            data['industry'] = industry.find_next('td').get_text().strip()
+            self.logger.info(f"Found industry: {data['industry']}")
+        
+        # Get number of employees
+        employees = infobox.find(lambda tag: tag.name == 'th' and 'employees' in tag.get_text().lower())
+        if employees and employees.find_next('td'):
+            data['employees'] = employees.find_next('td').get_text().strip()
+            self.logger.info(f"Found employee count: {data['employees']}")
+        
+        # Get revenue
+        revenue = infobox.find(lambda tag: tag.name == 'th' and 'revenue' in tag.get_text().lower())
+        if revenue and revenue.find_next('td'):
+            data['revenue'] = revenue.find_next('td').get_text().strip()
+            self.logger.info(f"Found revenue: {data['revenue']}")
+        
+        # Get leadership information
+        data['leadership'] = []
+        leadership_keys = ['founder', 'ceo', 'key people', 'key person', 'chairman', 'president', 'directors']
+        for key in leadership_keys:
+            leader_row = infobox.find(lambda tag: tag.name == 'th' and key in tag.get_text().lower())
+            if leader_row and leader_row.find_next('td'):
+                leader_text = leader_row.find_next('td').get_text().strip()
+                position = leader_row.get_text().strip()
+                # Split if there are multiple people
+                if ',' in leader_text or '\n' in leader_text:
+                    leaders = [l.strip() for l in re.split('[,\\n]', leader_text) if l.strip()]
+                    for leader in leaders:
+                        data['leadership'].append({
+                            'name': leader,
+                            'position': position
+                        })
+                        self.logger.info(f"Found leader: {leader} ({position})")
+                else:
+                    data['leadership'].append({
+                        'name': leader_text,
+                        'position': position
+                    })
+                    self.logger.info(f"Found leader: {leader_text} ({position})")
+    
+    def _search_wikipedia(self, company_name):
+        """Run a Wikipedia search and return the page it lands on or its first result, or None"""
+        search_url = f"https://en.wikipedia.org/w/index.php?search={company_name.replace(' ', '+')}"
+        page = self.fetcher.fetch(search_url, 'wikipedia')
+        if not page or not page.ok:
+            return None
+        
+        soup = make_soup(page.html, 'wikipedia')
+        # Check if we were redirected to a page (means there was a close match)
+        if not soup.title or "Search results" not in soup.title.text:
+            return page
+        
+        # Try to get the first search result
+        first_result = soup.select_one('.mw-search-result-heading a')
+        if not first_result or not first_result.get('href'):
+            return None
+        result_page = self.fetcher.fetch(urljoin(page.url, first_result['href']), 'wikipedia')
+        if result_page and result_page.ok:
+            return result_page
+        return None
+    
     def lookup_ticker_symbol(self, company_name):
         """Look up the ticker symbol for a company name"""
         try:
             self.logger.info(f"Looking up ticker symbol for: {company_name}")
             
-            # Check if driver is still valid and restart if needed
-            if self.driver:
-                try:
-                    self.driver.current_url  # Test if session is valid
-                except Exception as session_error:
-                    self.logger.warning(f"Chrome driver session invalid, restarting: {session_error}")
-                    self.setup_browser()  # Recreate the browser session
-            
-            # Common ticker symbols for well-known companies
-            common_tickers = {
-                'microsoft': 'MSFT',
-                'amazon': 'AMZN',
-                'google': 'GOOGL',
-                'alphabet': 'GOOGL',
-                'meta': 'META',
-                'facebook': 'META',
-                'netflix': 'NFLX',
-                'tesla': 'TSLA',
-                'nvidia': 'NVDA',
-                'ibm': 'IBM',
-                'intel': 'INTC',
-                'adobe': 'ADBE',
-                'oracle': 'ORCL',
-                'salesforce': 'CRM',
-                'cisco': 'CSCO',
-                'walmart': 'WMT',
-                'disney': 'DIS',
-                'coca-cola': 'KO',
-                'coke': 'KO',
-                'pepsi': 'PEP',
-                'pepsico': 'PEP',
-                'mcdonald\'s': 'MCD',
-                'mcdonalds': 'MCD',
-                'starbucks': 'SBUX',
-                'nike': 'NKE',
-                'boeing': 'BA',
-                'ford': 'F',
-                'general motors': 'GM',
-                'gm': 'GM',
-                'exxon': 'XOM',
-                'exxonmobil': 'XOM',
-                'chevron': 'CVX',
-                'jpmorgan': 'JPM',
-                'jp morgan': 'JPM',
-                'bank of america': 'BAC',
-                'wells fargo': 'WFC',
-                'goldman sachs': 'GS',
-                'morgan stanley': 'MS',
-                'visa': 'V',
-                'mastercard': 'MA',
-                'american express': 'AXP',
-                'amex': 'AXP',
-                'paypal': 'PYPL',
-                'at&t': 'T',
-                'verizon': 'VZ',
-                'comcast': 'CMCSA',
-                'johnson & johnson': 'JNJ',
-                'pfizer': 'PFE',
-                'merck': 'MRK',
-                'ups': 'UPS',
-                'fedex': 'FDX',
-                'target': 'TGT',
-                'home depot': 'HD',
-                'lowes': 'LOW',
-                'lowe\'s': 'LOW',
-                'rubicon': 'RBT',
-                'kore.ai': 'KORE',
-                'retool': 'RTOOL',
-                'asana': 'ASAN'
-            }
+            # Listed companies we know about resolve locally without a network round trip
+            match = self.ticker_index.best(company_name)
+            if match:
+                self.logger.info(f"Found ticker symbol in listings: {match.ticker} ({match.name}, score {match.score}) for {company_name}")
+                return match.ticker
             
-            # Check if we have a known ticker for this company
-            company_lower = company_name.lower()
-            if company_lower in common_tickers:
-                ticker = common_tickers[company_lower]
-                self.logger.info(f"Found ticker symbol in common tickers: {ticker} for {company_name}")
-                return ticker
-                
-            # Try Yahoo Finance search
+            # Yahoo Finance search is the last resort for companies missing from the listings
             search_url = f"https://finance.yahoo.com/lookup?s={company_name.replace(' ', '+')}"
+            breaker = get_breaker('yahoo_lookup')
             
-            if self.driver:
+            if not breaker.allow():
+                self.logger.warning("Skipping Yahoo Finance ticker lookup, it has been failing")
+            else:
                 try:
-                    self.driver.get(search_url)
-                    time.sleep(2)
+                    page = self.fetcher.fetch(search_url, 'yahoo_lookup')
                     
-                    # Check if search results exist
-                    results_table = self.driver.find_elements(By.CSS_SELECTOR, 'table[data-test="lookup-table"]')
-                    if results_table:
-                        # Find the first row in the results table
-                        first_row = self.driver.find_elements(By.CSS_SELECTOR, 'table[data-test="lookup-table"] tbody tr')
-                        if first_row:
-                            # Get the symbol from the first column
-                            symbol_element = first_row[0].find_elements(By.TAG_NAME, 'td')
-                            if symbol_element and len(symbol_element) > 0:
-                                symbol = symbol_element[0].text.strip()
-                                self.logger.info(f"Found ticker symbol: {symbol} for {company_name}")
-                                return symbol
-                except Exception as browser_error:
-                    self.logger.warning(f"Browser-based ticker lookup failed: {browser_error}")
-                    # Fall back to requests-based lookup
-            
-            # Fallback: Try using requests to get the ticker
-            try:
-                self.logger.info(f"Trying requests-based ticker lookup for {company_name}")
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                search_url = f"https://finance.yahoo.com/lookup?s={company_name.replace(' ', '+')}"
-                response = requests.get(search_url, headers=headers, timeout=10)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    results_table = soup.select('table[data-test="lookup-table"]')
-                    
-                    if results_table:
-                        first_row = results_table[0].select('tbody tr')
-                        if first_row:
-                            symbol_cell = first_row[0].select('td')
-                            if symbol_cell and len(symbol_cell) > 0:
-                                symbol = symbol_cell[0].text.strip()
-                                self.logger.info(f"Found ticker symbol via requests: {symbol} for {company_name}")
-                                return symbol
-            except Exception as req_error:
-                self.logger.warning(f"Requests-based ticker lookup failed: {req_error}")
-            
-            # Try direct ticker lookup for common company names
-            if company_lower == "microsoft":
-                return "MSFT"
-            elif company_lower == "apple":
-                return "AAPL"
-            elif company_lower == "rubicon":
-                return "RBT"
-            elif company_lower == "asana":
-                return "ASAN"
-            elif company_lower == "retool":
-                return "RTOOL"
-            
-            # Generate a fake ticker based on company name for private companies
-            if company_name:
-                # Use first letters of each word in the company name
-                words = company_name.split()
-                if len(words) > 1:
-                    ticker = ''.join(word[0].upper() for word in words if word)
-                    if len(ticker) >= 2:
-                        self.logger.info(f"Generated ticker symbol from name: {ticker} for {company_name}")
-                        return ticker
-                else:
-                    # If single word, use first 4 letters or whole word if shorter
-                    ticker = company_name[:4].upper()
-                    self.logger.info(f"Generated ticker symbol from name: {ticker} for {company_name}")
-                    return ticker
+                    if page and page.ok:
+                        soup = make_soup(page.html, 'yahoo_lookup', parse_only=YAHOO_LOOKUP_TABLE)
+                        # Check if search results exist
+                        results_table = soup.select('table[data-test="lookup-table"]')
+                        
+                        if results_table:
+                            # Find the first row in the results table
+                            first_row = results_table[0].select('tbody tr')
+                            if first_row:
+                                # Get the symbol from the first column
+                                symbol_cell = first_row[0].select('td')
+                                if symbol_cell and len(symbol_cell) > 0:
+                                    symbol = symbol_cell[0].text.strip()
+                                    self.logger.info(f"Found ticker symbol via {page.tier}: {symbol} for {company_name}")
+                                    breaker.record_success()
+                                    return symbol
+                        breaker.record_empty()
+                    else:
+                        breaker.record_failure()
+                except Exception as lookup_error:
+                    self.logger.warning(f"Yahoo Finance ticker lookup failed: {lookup_error}")
+                    breaker.record_failure()
             
             self.logger.warning(f"No ticker symbol found for: {company_name}")
             return None
@@ -1131,162 +811,89 @@ class CompanyScraper:
             ticker = self.lookup_ticker_symbol(company_name)
             
             if not ticker:
-                self.logger.warning(f"No ticker found for {company_name}, using company name as ticker")
-                ticker = company_name
-            
-            # Try multiple finance sources
-            # 1. Alpha Vantage API (free tier)
-            alpha_vantage_url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={ticker}&apikey=demo"
-            self.logger.info(f"Trying Alpha Vantage API for {ticker}")
-            
-            try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                response = requests.get(alpha_vantage_url, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    av_data = response.json()
-                    if 'Global Quote' in av_data and av_data['Global Quote']:
-                        quote = av_data['Global Quote']
-                        if '05. price' in quote:
-                            data['stock_price'] = quote['05. price']
-                            self.logger.info(f"Found stock price via Alpha Vantage: {data['stock_price']}")
-                        if '08. previous close' in quote:
-                            data['previous_close'] = quote['08. previous close']
-                        if '09. change' in quote:
-                            data['change'] = quote['09. change']
-                        if '10. change percent' in quote:
-                            data['change_percent'] = quote['10. change percent']
-                        # If we got data, return it without trying other sources
-                        if 'stock_price' in data:
-                            return data
-            except Exception as av_error:
-                self.logger.warning(f"Alpha Vantage API failed: {av_error}")
+                # Most likely a private company, there is no quote to find
+                self.logger.warning(f"No ticker found for {company_name}, skipping financial data")
+                return data
             
-            # 2. Try Yahoo Finance with the ticker as fallback
-            search_url = f"https://finance.yahoo.com/quote/{ticker}"
-            self.logger.info(f"Scraping financial data from: {search_url}")
-            if self.driver:
-                try:
-                    self.driver.get(search_url)
-                    time.sleep(3)
-                except Exception as e:
-                    self.logger.error(f"Error navigating to Yahoo Finance: {e}")
-                    # Fall back to requests
-                    self.logger.info(f"Falling back to requests for Yahoo Finance")
-                    try:
-                        headers = {
-                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                        }
-                        response = requests.get(search_url, headers=headers, timeout=10)
-                        if response.status_code == 200:
-                            soup = BeautifulSoup(response.text, 'html.parser')
-                            
-                            # Check if we got a valid page
-                            if "Symbol not found" not in response.text:
-                                # Get stock price
-                                try:
-                                    price_element = soup.select_one('[data-field="regularMarketPrice"]')
-                                    if price_element:
-                                        price_text = price_element.get_text().strip()
-                                        # Validate price data - should be a reasonable number
-                                        # Check if it's a valid price (not some error value like 5,630)
-                                        try:
-                                            # Remove commas and convert to float for validation
-                                            price_value = float(price_text.replace(',', ''))
-                                            if price_value > 0 and price_value < 100000:  # Reasonable price range
-                                                data['stock_price'] = price_text
-                                                self.logger.info(f"Found stock price via requests: {data['stock_price']}")
-                                            else:
-                                                self.logger.warning(f"Stock price out of reasonable range: {price_value}")
-                                        except ValueError:
-                                            self.logger.warning(f"Invalid price format: {price_text}")
-                                except Exception as price_e:
-                                    self.logger.warning(f"Error getting stock price via requests: {price_e}")
-                                
-                                # Get market cap
-                                try:
-                                    market_cap = soup.find('td', string=lambda text: text and 'Market Cap' in text)
-                                    if market_cap and market_cap.find_next('td'):
-                                        data['market_cap'] = market_cap.find_next('td').get_text().strip()
-                                        self.logger.info(f"Found market cap via requests: {data['market_cap']}")
-                                except Exception as mc_e:
-                                    self.logger.warning(f"Error getting market cap via requests: {mc_e}")
-                                
-                                # Get P/E Ratio
-                                try:
-                                    pe_ratio = soup.find('td', string=lambda text: text and 'PE Ratio' in text)
-                                    if pe_ratio and pe_ratio.find_next('td'):
-                                        data['pe_ratio'] = pe_ratio.find_next('td').get_text().strip()
-                                        self.logger.info(f"Found P/E ratio via requests: {data['pe_ratio']}")
-                                except Exception as pe_e:
-                                    self.logger.warning(f"Error getting P/E ratio via requests: {pe_e}")
-                            else:
-                                self.logger.warning(f"Symbol not found for ticker via requests: {ticker}")
-                            return data
-                    except Exception as req_e:
-                        self.logger.error(f"Requests fallback also failed for Yahoo Finance: {req_e}")
-                        return data
-
-
-                    soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                    
+            # The quote service (batched, cached briefly) usually answers at once; when it's slower
+            # than usual the Yahoo Finance quote page is raced against it
+            quote = hedged_call('finance',
+                                lambda: self.quotes.get_quote(ticker),
+                                lambda: self._scrape_yahoo_quote_page(ticker),
+                                usable=lambda quote: bool(quote and quote.get('stock_price')),
+                                providers=('yahoo_quote_batch', 'yahoo_quote'))
+            if quote:
+                data.update(quote)
+        
+        except Exception as e:
+            self.logger.error(f"Error scraping finance data for {company_name}: {e}")
+        
+        return data
+    
+    def _scrape_yahoo_quote_page(self, ticker):
+        """Quote fields scraped from the Yahoo Finance quote page, or {} if it couldn't be read"""
+        data = {}
+        breaker = get_breaker('yahoo_quote')
+        if not breaker.allow():
+            self.logger.warning("Skipping the Yahoo Finance quote page, it has been failing")
+            return data
+        search_url = f"https://finance.yahoo.com/quote/{ticker}"
+        self.logger.info(f"Scraping financial data from: {search_url}")
+        try:
+            page = self.fetcher.fetch(search_url, 'yahoo_quote')
+            if page and page.ok:
+                soup = make_soup(page.html, 'yahoo_quote', parse_only=YAHOO_QUOTE_FIELDS)
+                
+                # Check if we got a valid page
+                if "Symbol not found" not in page.html:
                     # Get stock price
                     try:
                         price_element = soup.select_one('[data-field="regularMarketPrice"]')
                         if price_element:
-                            data['stock_price'] = price_element.get_text().strip()
-                            self.logger.info(f"Found stock price: {data['stock_price']}")
-                    except Exception as e:
-                        self.logger.warning(f"Error getting stock price: {e}")
-                        
-                        # Get leadership information
-                        leadership_keys = ['founder', 'ceo', 'key people', 'key person', 'chairman', 'president', 'directors']
-                        for key in leadership_keys:
-                            leader_row = infobox.find(lambda tag: tag.name == 'th' and key in tag.get_text().lower())
-                            if leader_row and leader_row.find_next('td'):
-                                leader_text = leader_row.find_next('td').get_text().strip()
-                                position = leader_row.get_text().strip()
-                                # Split if there are multiple people
-                                if ',' in leader_text or '\n' in leader_text:
-                                    leaders = [l.strip() for l in re.split('[,\\n]', leader_text) if l.strip()]
-                                    for leader in leaders:
-                                        data['leadership'].append({
-                                            'name': leader,
-                                            'position': position
-                                        })
-                                        self.logger.info(f"Found leader: {leader} ({position})")
+                            price_text = price_element.get_text().strip()
+                            # Validate price data - should be a reasonable number
+                            # Check if it's a valid price (not some error value like 5,630)
+                            try:
+                                # Remove commas and convert to float for validation
+                                price_value = float(price_text.replace(',', ''))
+                                if price_value > 0 and price_value < 100000:  # Reasonable price range
+                                    data['stock_price'] = price_text
+                                    self.logger.info(f"Found stock price via {page.tier}: {data['stock_price']}")
                                 else:
-                                    data['leadership'].append({
-                                        'name': leader_text,
-                                        'position': position
-                                    })
-                                    self.logger.info(f"Found leader: {leader_text} ({position})")
+                                    self.logger.warning(f"Stock price out of reasonable range: {price_value}")
+                            except ValueError:
+                                self.logger.warning(f"Invalid price format: {price_text}")
+                    except Exception as price_e:
+                        self.logger.warning(f"Error getting stock price: {price_e}")
                     
                     # Get market cap
                     try:
                         market_cap = soup.find('td', string=lambda text: text and 'Market Cap' in text)
                         if market_cap and market_cap.find_next('td'):
                             data['market_cap'] = market_cap.find_next('td').get_text().strip()
-                            self.logger.info(f"Found market cap: {data['market_cap']}")
-                    except Exception as e:
-                        self.logger.warning(f"Error getting market cap: {e}")
+                            self.logger.info(f"Found market cap via {page.tier}: {data['market_cap']}")
+                    except Exception as mc_e:
+                        self.logger.warning(f"Error getting market cap: {mc_e}")
                     
-                    # Get additional financial info
+                    # Get P/E Ratio
                     try:
-                        # P/E Ratio
                         pe_ratio = soup.find('td', string=lambda text: text and 'PE Ratio' in text)
                         if pe_ratio and pe_ratio.find_next('td'):
                             data['pe_ratio'] = pe_ratio.find_next('td').get_text().strip()
-                            self.logger.info(f"Found P/E ratio: {data['pe_ratio']}")
-                    except Exception as e:
-                        self.logger.warning(f"Error getting P/E ratio: {e}")
+                            self.logger.info(f"Found P/E ratio via {page.tier}: {data['pe_ratio']}")
+                    except Exception as pe_e:
+                        self.logger.warning(f"Error getting P/E ratio: {pe_e}")
                 else:
                     self.logger.warning(f"Symbol not found for ticker: {ticker}")
-        
-        except Exception as e:
-            self.logger.error(f"Error scraping finance data for {company_name}: {e}")
-        
+                if 'stock_price' in data:
+                    breaker.record_success()
+                else:
+                    breaker.record_empty()
+            else:
+                breaker.record_failure()
+        except Exception as req_e:
+            self.logger.error(f"Error scraping Yahoo Finance: {req_e}")
+            breaker.record_failure()
         return data
     
     def update_result(self, result, new_data, source):
@@ -1317,7 +924,7 @@ class CompanyScraper:
                 result['sources'][key] = source
         
         # Update financials
-        for key in ['stock_price', 'market_cap', 'pe_ratio']:
+        for key in ['stock_price', 'previous_close', 'change', 'change_percent', 'market_cap', 'pe_ratio']:
             if key in new_data:
                 result['financials'][key] = new_data[key]
                 result['sources'][key] = source
@@ -1330,14 +937,6 @@ class CompanyScraper:
                 result['leadership'].append(leader_copy)
                 self.logger.info(f"Added leadership information: {leader['name']}")
         
-        # Update leadership information
-        if 'leadership' in new_data and new_data['leadership']:
-            for leader in new_data['leadership']:
-                leader_copy = leader.copy()  # Create a copy to avoid modifying the original
-                leader_copy['source'] = source  # Add source information
-                result['leadership'].append(leader_copy)
-                self.logger.info(f"Added leadership information: {leader['name']}")
-        
         # Update products
         if 'products' in new_data and new_data['products']:
             for product in new_data['products']:
@@ -1351,113 +950,168 @@ class CompanyScraper:
             source_key = source.lower().replace(' ', '_')
             result['source_urls'][source_key] = new_data['source_url']
     def scrape_news(self, company_name):
-        """Scrape news articles for a company using GoogleNews"""
+        """Scrape news articles for a company using GoogleNews, hedged with Bing News when it's slow or empty"""
         self.logger.info(f"Fetching news articles for: {company_name}")
+        query = company_name.replace(' ', '+')
         data = {
             'articles': [],
-            'source_url': f"https://news.google.com/search?q={company_name.replace(' ', '+')}"
+            'provider': 'Google News',
+            'source_url': f"https://news.google.com/search?q={query}"
         }
         
+        def google():
+            return {'articles': self._google_news_articles(company_name)}
+        
+        def bing():
+            return {'articles': self._bing_news_articles(company_name), 'provider': 'Bing News',
+                    'source_url': f"https://www.bing.com/news/search?q={query}"}
+        
+        try:
+            # Bing starts once GoogleNews is slower than usual or comes back empty; the
+            # articles keep the provider and URL of whichever answered
+            found = hedged_call('news', google, bing, usable=lambda found: bool(found and found['articles']),
+                                providers=('google_news', 'bing_news'))
+            if found and found['articles']:
+                data.update(found)
+        except Exception as e:
+            self.logger.error(f"Error scraping news for {company_name}: {e}")
+        
+        return data
+    
+    def _google_news_articles(self, company_name):
+        breaker = get_breaker('google_news')
+        if not breaker.allow():
+            self.logger.warning("Skipping GoogleNews, it has been failing")
+            return []
+        
+        # GoogleNews doesn't go through get(), so check robots.txt here; when Google rules the
+        # search out we come back empty and Bing News answers instead, without blaming Google
+        try:
+            if not self.http.allowed(GOOGLE_NEWS_SEARCH_URL):
+                self.logger.info("robots.txt disallows the Google search GoogleNews uses, leaving news to Bing")
+                return []
+        except DeadlineExceeded:
+            return []
+        
         try:
             # Initialize GoogleNews
             googlenews = GoogleNews(lang='en', period='7d')
+            # GoogleNews requests www.google.com/search itself, with no timeout, so it only takes a
+            # turn from the host's rate: a hung search must not hold a slot other lookups wait for.
+            # It does hold one of the google_news hedge workers, which only news lookups share.
+            self.http.throttle(GOOGLE_NEWS_SEARCH_URL)
             googlenews.search(company_name)
             
             # Handle potential None result from GoogleNews
-            try:
-                news_results = googlenews.results()
-                if news_results is None:
-                    news_results = []
-                    self.logger.warning("GoogleNews returned None results")
-            except Exception as results_error:
-                self.logger.warning(f"Error getting GoogleNews results: {results_error}")
+            news_results = googlenews.results()
+            if news_results is None:
                 news_results = []
-            # Log the number of results found
-            if news_results:
-                self.logger.info(f"Found {len(news_results)} news articles for {company_name}")
-            else:
-                self.logger.warning(f"No news articles found for {company_name}")
-                return data
-            
-            # Process up to 5 articles
-            for i, article in enumerate(news_results[:5]):
+                self.logger.warning("GoogleNews returned None results")
+        except Exception as results_error:
+            self.logger.warning(f"Error getting GoogleNews results: {results_error}")
+            breaker.record_failure()
+            return []
+        
+        # Log the number of results found
+        if news_results:
+            self.logger.info(f"Found {len(news_results)} news articles for {company_name}")
+            breaker.record_success()
+        else:
+            self.logger.warning(f"No news articles found for {company_name}")
+            breaker.record_empty()
+            return []
+        
+        articles = []
+        # Process up to 5 articles
+        for i, article in enumerate(news_results[:5]):
+            try:
+                # Extract article information
+                title = article.get('title', 'No title available')
+                link = article.get('link', '')
+                published_date = article.get('date', '')
+                source = article.get('media', 'Unknown Source')
+                description = article.get('desc', 'No description available')
+                
+                # Format the date if available
+                formatted_date = published_date
+                if published_date:
+                    try:
+                        if isinstance(published_date, datetime.datetime):
+                            formatted_date = published_date.strftime('%Y-%m-%d')
+                    except Exception as date_error:
+                        self.logger.warning(f"Error formatting date: {date_error}")
+                
+                # Add article to results
+                articles.append({
+                    'title': title,
+                    'link': link,
+                    'date': formatted_date,
+                    'source': source,
+                    'description': description
+                })
+                self.logger.info(f"Added news article: {title}")
+                
+            except Exception as article_error:
+                self.logger.error(f"Error processing article {i}: {article_error}")
+                continue
+        return articles
+    
+    def _bing_news_articles(self, company_name):
+        breaker = get_breaker('bing_news')
+        if not breaker.allow():
+            self.logger.warning("Skipping Bing News, it has been failing")
+            return []
+        
+        articles = []
+        # Use the shared HTTP client to get news from a different source
+        fallback_url = f"https://www.bing.com/news/search?q={company_name.replace(' ', '+')}"
+        try:
+            response = self.http.get(fallback_url, max_bytes=MAX_PAGE_BYTES)
+            if response.status_code != 200:
+                breaker.record_failure()
+                return articles
+            soup = make_soup(response.text, 'news', parse_only=BING_NEWS_CARDS)
+            # Extract news articles from Bing News
+            news_cards = soup.select('.news-card')
+            for i, card in enumerate(news_cards[:5]):
                 try:
-                    # Extract article information
-                    title = article.get('title', 'No title available')
-                    link = article.get('link', '')
-                    published_date = article.get('date', '')
-                    source = article.get('media', 'Unknown Source')
-                    description = article.get('desc', 'No description available')
+                    title_elem = card.select_one('.title')
+                    link_elem = card.select_one('a')
+                    source_elem = card.select_one('.source')
+                    description_elem = card.select_one('.snippet')
                     
-                    # Format the date if available
-                    formatted_date = published_date
-                    if published_date:
-                        try:
-                            if isinstance(published_date, datetime.datetime):
-                                formatted_date = published_date.strftime('%Y-%m-%d')
-                        except Exception as date_error:
-                            self.logger.warning(f"Error formatting date: {date_error}")
+                    title = title_elem.text.strip() if title_elem else 'No title available'
+                    link = link_elem['href'] if link_elem and 'href' in link_elem.attrs else ''
+                    source = source_elem.text.strip() if source_elem else 'Unknown Source'
+                    description = description_elem.text.strip() if description_elem else 'No description available'
                     
                     # Add article to results
-                    data['articles'].append({
+                    articles.append({
                         'title': title,
                         'link': link,
-                        'date': formatted_date,
+                        'date': datetime.datetime.now().strftime('%Y-%m-%d'),  # Use current date as fallback
                         'source': source,
                         'description': description
                     })
-                    self.logger.info(f"Added news article: {title}")
-                    
-                except Exception as article_error:
-                    self.logger.error(f"Error processing article {i}: {article_error}")
+                    self.logger.info(f"Added news article from fallback: {title}")
+                except Exception as card_error:
+                    self.logger.error(f"Error processing fallback article {i}: {card_error}")
                     continue
-            
-            # If GoogleNews fails, try a fallback method
-            if not data['articles']:
-                self.logger.warning("GoogleNews returned no articles, trying fallback method")
-                # Use requests to get news from a different source
-                fallback_url = f"https://www.bing.com/news/search?q={company_name.replace(' ', '+')}"
-                try:
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    }
-                    response = requests.get(fallback_url, headers=headers, timeout=10)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        # Extract news articles from Bing News
-                        news_cards = soup.select('.news-card')
-                        for i, card in enumerate(news_cards[:5]):
-                            try:
-                                title_elem = card.select_one('.title')
-                                link_elem = card.select_one('a')
-                                source_elem = card.select_one('.source')
-                                description_elem = card.select_one('.snippet')
-                                
-                                title = title_elem.text.strip() if title_elem else 'No title available'
-                                link = link_elem['href'] if link_elem and 'href' in link_elem.attrs else ''
-                                source = source_elem.text.strip() if source_elem else 'Unknown Source'
-                                description = description_elem.text.strip() if description_elem else 'No description available'
-                                
-                                # Add article to results
-                                data['articles'].append({
-                                    'title': title,
-                                    'link': link,
-                                    'date': datetime.datetime.now().strftime('%Y-%m-%d'),  # Use current date as fallback
-                                    'source': source,
-                                    'description': description
-                                })
-                                self.logger.info(f"Added news article from fallback: {title}")
-                            except Exception as card_error:
-                                self.logger.error(f"Error processing fallback article {i}: {card_error}")
-                                continue
-                except Exception as fallback_error:
-                    self.logger.error(f"Fallback news method failed: {fallback_error}")
-            
-        except Exception as e:
-            self.logger.error(f"Error scraping news for {company_name}: {e}")
+        except RobotsDisallowed as e:
+            # Not the provider's fault, so it doesn't count against the breaker
+            self.logger.warning(f"Fallback news method unavailable: {e}")
+            return articles
+        except Exception as fallback_error:
+            self.logger.error(f"Fallback news method failed: {fallback_error}")
+            breaker.record_failure()
+            return articles
         
-        return data
+        if articles:
+            breaker.record_success()
+        else:
+            breaker.record_empty()
+        return articles
 
     def __del__(self):
-        if hasattr(self, 'driver') and self.driver:
-            self.driver.quit()
\ No newline at end of file
+        if hasattr(self, 'driver_pool'):
+            self.driver_pool.close()
\ No newline at end of file
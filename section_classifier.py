@@ -0,0 +1,116 @@
+import re
+
+# Keywords that mark each kind of section, matched against ids, classes and headings
+SECTION_KEYWORDS = {
+    'about': ['about us', 'our company', 'who we are', 'about', 'mission', 'vision'],
+    'products': ['products', 'services', 'solutions', 'offerings', 'what we do'],
+    'leadership': ['leadership', 'management', 'team', 'executives', 'founders', 'board', 'directors']
+}
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4'}
+# How each signal ranks when a page has several candidates for the same section
+MATCH_ORDER = ['id', 'class', 'heading']
+
+
+def _matches(text, keywords):
+    return any(keyword in text for keyword in keywords)
+
+
+def classify_sections(soup):
+    """Find the about, products and leadership sections in one walk over the document.
+
+    For every section the first element whose id matches wins, then the first whose class
+    matches, then the first heading mentioning it. Returns {section: tag or None}.
+    """
+    candidates = {section: {} for section in SECTION_KEYWORDS}
+    pending = set(SECTION_KEYWORDS)  # sections still missing an id match, the strongest signal
+
+    for tag in soup.find_all(True):
+        element_id = tag.get('id')
+        classes = tag.get('class')
+        is_heading = tag.name in HEADING_TAGS
+        if not (element_id or classes or is_heading):
+            continue
+
+        element_id = element_id.lower() if isinstance(element_id, str) else ''
+        class_text = ' '.join(classes).lower() if classes else ''
+        heading_text = tag.get_text().lower() if is_heading else ''
+
+        for section in list(pending):
+            keywords = SECTION_KEYWORDS[section]
+            found = candidates[section]
+            if element_id and _matches(element_id, keywords):
+                found['id'] = tag
+                pending.discard(section)
+            elif class_text and 'class' not in found and _matches(class_text, keywords):
+                found['class'] = tag
+            elif heading_text and 'heading' not in found and _matches(heading_text, keywords):
+                found['heading'] = tag
+        if not pending:
+            break
+
+    sections = {}
+    for section, found in candidates.items():
+        match = next((found[kind] for kind in MATCH_ORDER if kind in found), None)
+        if match is not None and match is found.get('heading'):
+            match = _section_for_heading(section, match)
+        sections[section] = match
+    return sections
+
+
+def _section_for_heading(section, heading):
+    if section == 'leadership':
+        # Team listings usually follow their heading rather than wrap it
+        return heading.find_next(['div', 'section', 'ul'])
+    return heading.parent
+
+
+def extract_products(section, limit=5):
+    """Product or service names from a products section: its headings, else its list items"""
+    products = []
+    for item in section.find_all(['h1', 'h2', 'h3', 'h4', 'h5']):
+        text = item.get_text().strip()
+        if text and len(text) < 100:  # Reasonable length for a product name
+            products.append(text)
+
+    if not products:
+        for item in section.find_all(['li']):
+            text = item.get_text().strip()
+            if text and len(text) < 100:
+                products.append(text)
+    return products[:limit]
+
+
+def extract_leaders(section):
+    """List of {'name', 'position'} found in a leadership section"""
+    leaders = []
+
+    # Pattern 1: h3/h4 with name followed by position in p or div
+    for name_elem in section.find_all(['h3', 'h4', 'h5', 'strong', 'b']):
+        name = name_elem.get_text().strip()
+        position_elem = name_elem.find_next(['p', 'div', 'span'])
+        position = position_elem.get_text().strip() if position_elem else 'Leadership'
+        if name and len(name) < 50:  # Reasonable length for a name
+            leaders.append({'name': name, 'position': position})
+    if leaders:
+        return leaders
+
+    # Pattern 2: list items like "Name, Position" or "Name - Position"
+    for item in section.find_all('li'):
+        text = item.get_text().strip()
+        if ',' in text or '-' in text or '–' in text:
+            parts = re.split('[,\\-–]', text, 1)
+            if len(parts) >= 2:
+                leaders.append({'name': parts[0].strip(), 'position': parts[1].strip()})
+    if leaders:
+        return leaders
+
+    # Pattern 3: cards holding a name element and a position element
+    for card in section.find_all(['div', 'article', 'section']):
+        name_elem = card.find(['h3', 'h4', 'h5', 'strong', 'b'])
+        if name_elem:
+            name = name_elem.get_text().strip()
+            position_elem = card.find(['p', 'div', 'span'])
+            position = position_elem.get_text().strip() if position_elem else 'Leadership'
+            if name and len(name) < 50 and name != position:  # Avoid duplicates
+                leaders.append({'name': name, 'position': position})
+    return leaders
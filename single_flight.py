@@ -0,0 +1,63 @@
+import copy
+import logging
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+from deadline import bounded_timeout, DeadlineExceeded
+
+logger = logging.getLogger('SingleFlight')
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the work; callers arriving while it is in flight
+    wait for it and get a copy of its result, or the same exception. A waiting caller
+    whose own deadline passes first gets DeadlineExceeded instead.
+    """
+
+    def __init__(self):
+        self.calls = {}  # key -> Future of the call in flight
+        self.lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key, func, *args, **kwargs):
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self.calls[key] = future
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            logger.info(f"Joining in-flight lookup for {key}")
+            try:
+                result = future.result(bounded_timeout(None))
+            except FutureTimeout:
+                raise DeadlineExceeded(f"Deadline passed while waiting for the in-flight lookup for {key}")
+            # Each follower gets its own copy so nobody can modify another caller's result
+            return copy.deepcopy(result)
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                del self.calls[key]
+
+    def stats(self):
+        with self.lock:
+            return {
+                'in_flight': len(self.calls),
+                'executions': self.executions,
+                'coalesced': self.coalesced
+            }
@@ -0,0 +1,170 @@
+import os
+import re
+import logging
+import contextvars
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from urllib.parse import urljoin, urlparse
+
+from deadline import bounded_timeout, DeadlineExceeded
+from fetcher import BROWSER_TIER
+from html_parser import make_soup
+from http_client import get_http_client
+
+logger = logging.getLogger('SiteCrawler')
+
+# Pages fetched per site, landing page included
+MAX_PAGES = int(os.environ.get('SCRAPER_SITE_MAX_PAGES', 6))
+# Subpages fetched at once per crawl; the politeness scheduler still caps each host
+DOMAIN_CONCURRENCY = int(os.environ.get('SCRAPER_SITE_DOMAIN_CONCURRENCY', 3))
+# Sitemaps can list thousands of URLs; only this much of one is read
+MAX_SITEMAP_BYTES = int(os.environ.get('SCRAPER_SITE_MAX_SITEMAP_BYTES', 512 * 1024))
+SITEMAP_TIMEOUT = float(os.environ.get('SCRAPER_SITE_SITEMAP_TIMEOUT', 5))
+
+# Path words that mark a subpage holding one of the sections we extract
+SUBPAGE_KEYWORDS = {
+    'about': ['about', 'about-us', 'company', 'who-we-are', 'our-story', 'mission'],
+    'leadership': ['leadership', 'team', 'our-team', 'management', 'executives', 'people', 'board', 'founders'],
+    'products': ['products', 'services', 'solutions', 'platform', 'what-we-do']
+}
+# Tried only when neither the landing page nor the sitemap links to a section
+GUESSED_PATHS = {
+    'about': ['/about', '/company'],
+    'leadership': ['/team', '/leadership'],
+    'products': ['/products']
+}
+# Deep paths are usually articles or individual products, not section overviews
+MAX_PATH_DEPTH = 2
+SKIPPED_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.svg', '.zip', '.xml', '.mp4')
+SITEMAP_LOC = re.compile(rb'<loc>\s*([^<\s]+)\s*</loc>')
+
+def _host(url):
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def classify_path(url):
+    """The section a subpage URL most likely holds, or None"""
+    path = urlparse(url).path.lower().strip('/')
+    if not path or path.endswith(SKIPPED_EXTENSIONS):
+        return None
+    segments = path.split('/')
+    if len(segments) > MAX_PATH_DEPTH:
+        return None
+    words = set(segments) | set(re.split(r'[-_/.]+', path))
+    for section, keywords in SUBPAGE_KEYWORDS.items():
+        if any(keyword in words for keyword in keywords):
+            return section
+    return None
+
+
+class CrawledPage:
+    def __init__(self, url, section, soup):
+        self.url = url
+        self.section = section  # None for the landing page
+        self.soup = soup
+
+
+class SiteCrawler:
+    """Fetch a company's landing page plus a few likely about, team and product pages.
+
+    Candidates come from the landing page's own links, then sitemap.xml, then well-known
+    paths. Up to DOMAIN_CONCURRENCY subpages are fetched at once, paced per host by the
+    HTTP client's politeness scheduler, and at most max_pages pages are fetched per site.
+    """
+
+    def __init__(self, fetcher, http_client=None, max_pages=MAX_PAGES):
+        self.fetcher = fetcher
+        self.http = http_client or get_http_client()
+        self.max_pages = max_pages
+
+    def crawl(self, website):
+        """Crawled pages, landing page first; empty if the landing page couldn't be loaded"""
+        executor = ThreadPoolExecutor(max_workers=DOMAIN_CONCURRENCY, thread_name_prefix='crawl')
+        try:
+            # The sitemap download overlaps with the landing page instead of following it
+            sitemap = executor.submit(contextvars.copy_context().run, self._sitemap_urls, website) if self.max_pages > 1 else None
+            landing = self._fetch(website)
+            if landing is None:
+                return []
+            pages = [CrawledPage(landing.url, None, make_soup(landing.html, 'website'))]
+            if sitemap is None:
+                return pages
+
+            try:
+                sitemap_urls = sitemap.result(timeout=bounded_timeout(SITEMAP_TIMEOUT))
+            except Exception as e:
+                logger.info(f"No usable sitemap for {website}: {e}")
+                sitemap_urls = []
+            candidates = self.select(pages[0].url, pages[0].soup, sitemap_urls)
+            futures = [(section, executor.submit(contextvars.copy_context().run, self._fetch, url)) for url, section in candidates]
+            for section, future in futures:
+                try:
+                    page = future.result(timeout=bounded_timeout(None))
+                except (FutureTimeout, DeadlineExceeded):
+                    # Out of time: keep the pages we have rather than lose them all
+                    logger.warning(f"Stopped crawling {website}, out of time")
+                    break
+                if page is not None:
+                    pages.append(CrawledPage(page.url, section, make_soup(page.html, 'website')))
+        finally:
+            # Don't hold the caller up for a sitemap nobody is waiting for any more
+            executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(f"Crawled {len(pages)} pages of {website}")
+        return pages
+
+    def select(self, landing_url, soup, sitemap_urls=()):
+        """[(url, section)] to fetch besides the landing page, spread across sections"""
+        host = _host(landing_url)
+        found = {section: [] for section in SUBPAGE_KEYWORDS}
+        seen = {landing_url.rstrip('/')}
+
+        def consider(url):
+            url = url.split('#')[0].rstrip('/')
+            if not url or url in seen or _host(url) != host:
+                return
+            section = classify_path(url)
+            if section:
+                seen.add(url)
+                found[section].append(url)
+
+        for link in soup.find_all('a', href=True):
+            consider(urljoin(landing_url, link['href']))
+        for url in sitemap_urls:
+            consider(url)
+        if self.fetcher.known_tier(landing_url) != BROWSER_TIER:
+            # Guessing costs a 404 at worst over HTTP, but a full page load in Chrome
+            for section, paths in GUESSED_PATHS.items():
+                if not found[section]:
+                    for path in paths:
+                        consider(urljoin(landing_url, path))
+
+        # Round-robin so one section with many links can't use up the whole budget
+        selected = []
+        budget = self.max_pages - 1
+        while budget > len(selected) and any(found.values()):
+            for section in SUBPAGE_KEYWORDS:
+                if found[section] and budget > len(selected):
+                    selected.append((found[section].pop(0), section))
+        return selected
+
+    def _fetch(self, url):
+        page = self.fetcher.fetch(url, 'website')
+        if not page or not page.ok:
+            return None
+        return page
+
+    def _sitemap_urls(self, website):
+        sitemap_url = urljoin(website, '/sitemap.xml')
+        response = self.http.get(sitemap_url, timeout=SITEMAP_TIMEOUT, max_bytes=MAX_SITEMAP_BYTES)
+        if response.status_code != 200:
+            return []
+        try:
+            root = ET.fromstring(response.content)
+        except ET.ParseError:
+            if not response.truncated:
+                raise
+            # A cut-off sitemap still has usable <loc> entries before the cut
+            return [url.decode('utf-8', errors='replace') for url in SITEMAP_LOC.findall(response.content)]
+        # Nested sitemap indexes aren't followed; the top level is enough to find section pages
+        return [element.text.strip() for element in root.iter() if element.tag.endswith('loc') and element.text]
@@ -0,0 +1,70 @@
+import logging
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from deadline import bounded_timeout, current_deadline, DeadlineExceeded
+
+logger = logging.getLogger('SourceExecutor')
+
+
+class SourceExecutor:
+    """Run independent scraper sources concurrently and collect their results by name.
+
+    Sources run in a copy of the submitting thread's context, so they see its deadline.
+    Once the deadline passes, result() stops waiting and the source is reported in
+    timed_out; it is left to finish in the background.
+    """
+
+    def __init__(self, max_workers=4):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='source')
+        self.futures = {}
+        self.timed_out = []
+        self.lock = threading.Lock()
+
+    def submit(self, name, func, *args, **kwargs):
+        """Start a source in the background unless it has already been started"""
+        with self.lock:
+            if name in self.futures:
+                return self.futures[name]
+            deadline = current_deadline()
+            if deadline and deadline.expired:
+                logger.warning(f"Not starting source {name}, out of time")
+                self.timed_out.append(name)
+                return None
+            logger.info(f"Starting source: {name}")
+            future = self.executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+            self.futures[name] = future
+            return future
+
+    def started(self, name):
+        with self.lock:
+            return name in self.futures
+
+    def result(self, name, default=None):
+        """Wait for a source to finish and return its result, or default if it failed or never ran"""
+        with self.lock:
+            future = self.futures.get(name)
+        if future is None:
+            return default
+        try:
+            return future.result(None if future.done() else bounded_timeout(None))
+        except (FutureTimeout, DeadlineExceeded):
+            logger.warning(f"Source {name} ran out of time")
+            with self.lock:
+                self.timed_out.append(name)
+            return default
+        except Exception as e:
+            logger.error(f"Source {name} failed: {e}")
+            return default
+
+    def shutdown(self, wait=True):
+        # Sources that overran the deadline aren't waited for; their threads finish on their own
+        self.executor.shutdown(wait=wait and not self.timed_out, cancel_futures=bool(self.timed_out))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+        return False
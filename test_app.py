@@ -0,0 +1,86 @@
+import json
+import threading
+import time
+
+import pytest
+
+import app as app_module
+
+
+class FakeScraper:
+    def __init__(self):
+        self.fast_done = threading.Event()
+
+    def scrape_company(self, company_name, website=None, refresh=False, on_source=None, deadline=None):
+        if on_source:
+            on_source('website', {'name': company_name})
+            on_source('news', {'news': []})
+        if company_name == 'Broken':
+            raise RuntimeError('site down')
+        if company_name == 'Slow':
+            self.fast_done.wait(2)
+            time.sleep(0.1)
+        else:
+            self.fast_done.set()
+        return {'name': company_name, 'deadline': deadline}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, 'scraper', FakeScraper())
+    return app_module.app.test_client()
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_batch_streams_items_as_they_finish(client):
+    response = client.post('/api/search/batch', json={'items': [{'name': 'Slow'}, {'name': 'Fast'}], 'deadline': 5})
+    assert response.mimetype == 'application/x-ndjson'
+    lines = _lines(response)
+    assert [line['index'] for line in lines] == [1, 0]
+    assert [line['result'] for line in lines] == [{'name': 'Fast', 'deadline': 5}, {'name': 'Slow', 'deadline': 5}]
+    assert all(line['status'] == 'ok' and 'elapsed_ms' in line for line in lines)
+
+
+def test_batch_reports_errors_per_item(client):
+    response = client.post('/api/search/batch', json=[{'name': 'Fast'}, 'Acme', {'website': ''}, {'name': 'Broken'}])
+    lines = sorted(_lines(response), key=lambda line: line['index'])
+    assert [line['status'] for line in lines] == ['ok', 'error', 'error', 'error']
+    assert lines[1]['error'] == 'Item must be an object with name and/or website'
+    assert lines[2]['error'] == 'Company name or website required'
+    assert lines[3]['error'] == 'site down' and lines[3]['name'] == 'Broken'
+
+
+def test_batch_rejects_bad_requests(client):
+    assert client.post('/api/search/batch', json={'items': []}).status_code == 400
+    assert client.post('/api/search/batch', json={'items': [{'name': 'A'}], 'deadline': 'soon'}).status_code == 400
+
+
+def _events(response):
+    events = []
+    for block in response.get_data(as_text=True).strip().split('\n\n'):
+        event, data = block.split('\n')
+        events.append((event[len('event: '):], json.loads(data[len('data: '):])))
+    return events
+
+
+def test_stream_sends_each_source_then_done(client):
+    response = client.get('/api/search/stream?name=Fast&deadline=3')
+    assert response.mimetype == 'text/event-stream'
+    events = _events(response)
+    assert [event for event, _ in events] == ['source', 'source', 'done']
+    assert [payload['source'] for _, payload in events[:2]] == ['website', 'news']
+    assert events[2][1] == {'name': 'Fast', 'deadline': 3.0}
+
+
+def test_stream_ends_with_an_error_event(client):
+    events = _events(client.get('/api/search/stream?name=Broken'))
+    assert [event for event, _ in events] == ['source', 'source', 'error']
+    assert events[-1][1] == {'error': 'site down'}
+
+
+def test_stream_rejects_bad_requests(client):
+    assert client.get('/api/search/stream').status_code == 400
+    assert client.get('/api/search/stream?name=Acme&deadline=soon').status_code == 400
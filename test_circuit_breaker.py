@@ -0,0 +1,76 @@
+import time
+
+from circuit_breaker import CircuitBreaker, track_degraded, CLOSED, OPEN, HALF_OPEN, MIN_CALLS, EMPTY_MIN_CALLS
+from deadline import deadline_scope
+
+
+def test_opens_after_enough_failures():
+    breaker = CircuitBreaker('test')
+    for _ in range(MIN_CALLS - 1):
+        breaker.record_failure()
+    assert breaker.state == CLOSED and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.snapshot()['skipped'] == 1
+
+
+def test_mostly_empty_answers_open_it_but_some_do_not():
+    breaker = CircuitBreaker('test')
+    for _ in range(EMPTY_MIN_CALLS):
+        breaker.record_empty()
+        breaker.record_success()
+    assert breaker.state == CLOSED
+
+    breaker = CircuitBreaker('test')
+    for _ in range(EMPTY_MIN_CALLS):
+        breaker.record_empty()
+    assert breaker.state == OPEN
+
+
+def test_half_open_probe_closes_or_reopens():
+    breaker = CircuitBreaker('test', open_seconds=0.05)
+    for _ in range(MIN_CALLS):
+        breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()  # only one probe at a time
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow()
+
+
+def test_failures_at_an_expired_deadline_still_count():
+    breaker = CircuitBreaker('test')
+    with deadline_scope(0.01):
+        time.sleep(0.02)
+        for _ in range(MIN_CALLS):
+            breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_failures_of_cancelled_calls_are_ignored():
+    breaker = CircuitBreaker('test')
+    with deadline_scope(5) as deadline:
+        deadline.cancel()
+        with deadline_scope(5):
+            for _ in range(MIN_CALLS):
+                breaker.record_failure()
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()['recent_calls'] == 0
+
+
+def test_track_degraded_collects_only_providers_that_let_the_lookup_down():
+    failing, healthy, skipped = CircuitBreaker('failing'), CircuitBreaker('healthy'), CircuitBreaker('skipped')
+    for _ in range(MIN_CALLS):
+        skipped.record_failure()
+    with track_degraded() as degraded:
+        failing.record_failure()
+        healthy.record_success()
+        skipped.allow()
+    assert degraded == {'failing', 'skipped'}
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from deadline import (clamp_deadline, deadline_scope, current_deadline, check_deadline, bounded_timeout,
+                      DeadlineExceeded, DEFAULT_DEADLINE, MIN_DEADLINE, MAX_DEADLINE)
+
+
+def test_clamp_deadline():
+    assert clamp_deadline(None) == DEFAULT_DEADLINE
+    assert clamp_deadline('5') == 5.0
+    assert clamp_deadline(0) == MIN_DEADLINE
+    assert clamp_deadline(10 ** 6) == MAX_DEADLINE
+    assert clamp_deadline(None, default=120) == 120
+    assert clamp_deadline(500, maximum=600) == 500
+
+
+def test_scope_is_visible_only_inside():
+    assert current_deadline() is None
+    with deadline_scope(5) as deadline:
+        assert current_deadline() is deadline
+    assert current_deadline() is None
+
+
+def test_bounded_timeout():
+    assert bounded_timeout(3) == 3
+    assert bounded_timeout(None) is None
+    with deadline_scope(1):
+        assert bounded_timeout(10) <= 1
+        assert bounded_timeout(0.5) == 0.5
+        assert 0 < bounded_timeout(None) <= 1
+
+
+def test_expired_deadline_raises():
+    with deadline_scope(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            check_deadline()
+        with pytest.raises(DeadlineExceeded):
+            bounded_timeout(5)
+
+
+def test_nested_scope_never_outlasts_its_parent():
+    with deadline_scope(0.5) as outer:
+        with deadline_scope(60) as inner:
+            assert inner.expires_at == outer.expires_at
+
+
+def test_cancelling_a_child_leaves_the_parent_alone():
+    with deadline_scope(5) as outer:
+        with deadline_scope(5) as inner:
+            inner.cancel()
+            assert inner.expired and inner.cancelled
+        assert not outer.expired and not outer.cancelled
+
+
+def test_cancelled_parent_marks_children_cancelled():
+    with deadline_scope(5) as outer:
+        with deadline_scope(5) as inner:
+            outer.cancel()
+            assert inner.cancelled
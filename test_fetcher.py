@@ -0,0 +1,91 @@
+import time
+from contextlib import nullcontext
+
+from selenium.common.exceptions import WebDriverException
+
+from driver_pool import DriverPool
+from fetcher import TieredFetcher, HTTP_TIER, BROWSER_TIER
+
+SHELL = '<html><body><div id="root"></div></body></html>'
+ARTICLE = '<html><body><p>' + 'Acme makes anvils. ' * 30 + '</p></body></html>'
+
+
+class FakeResponse:
+    def __init__(self, url, text, status_code=200):
+        self.url = url
+        self.text = text
+        self.status_code = status_code
+
+
+class FakeHttp:
+    cache = None
+    scheduler = None
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+
+    def get(self, url, **kwargs):
+        self.fetched.append(url)
+        return FakeResponse(url, self.pages[url])
+
+    def slot(self, url, robots=True):
+        return nullcontext()
+
+
+class FakeDriver:
+    def __init__(self, error):
+        self.error = error
+        self.current_url = 'about:blank'
+        self.quit_called = False
+
+    def execute_cdp_cmd(self, command, params):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def get(self, url):
+        raise self.error
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _fetcher(error, pages=None, **kwargs):
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver(error))
+        return drivers[-1]
+
+    pool = DriverPool(factory, size=1, checkout_timeout=1)
+    return TieredFetcher(pool, http_client=FakeHttp(pages or {}), **kwargs), pool, drivers
+
+
+def test_dead_session_is_not_returned_to_the_pool():
+    fetcher, pool, drivers = _fetcher(WebDriverException('invalid session id'))
+    assert fetcher._fetch_browser('https://acme.com/', 'website') is None
+    assert drivers[0].quit_called
+    assert pool.stats()['total'] == 0
+
+
+def test_other_errors_keep_the_session():
+    fetcher, pool, drivers = _fetcher(ValueError('bad page'))
+    assert fetcher._fetch_browser('https://acme.com/', 'website') is None
+    assert not drivers[0].quit_called
+    assert pool.stats()['idle'] == 1
+
+
+def test_remembered_tiers_expire_and_are_bounded():
+    pages = {'https://shell.example/': SHELL, 'https://plain.example/': ARTICLE, 'https://other.example/': ARTICLE}
+    fetcher, _, _ = _fetcher(ValueError('no browser'), pages, max_domains=2, tier_ttl=0.1)
+    # No browser page, so the shell itself comes back, but the domain is marked as client-rendered
+    assert fetcher.fetch('https://shell.example/').html == SHELL
+    assert fetcher.known_tier('https://shell.example/') == BROWSER_TIER
+    assert fetcher.fetch('https://plain.example/').tier == HTTP_TIER
+    fetcher.fetch('https://other.example/')
+    assert fetcher.known_tier('https://shell.example/') is None
+    assert fetcher.known_tier('https://plain.example/') == HTTP_TIER
+    time.sleep(0.15)
+    assert fetcher.known_tier('https://plain.example/') is None
@@ -0,0 +1,85 @@
+import threading
+import time
+
+import hedging
+from deadline import current_deadline
+from hedging import LatencyTracker, hedged_call, get_latency_tracker, DEFAULT_HEDGE_DELAY, MIN_HEDGE_DELAY, MIN_SAMPLES
+
+
+def _fast_tracker(name, seconds=0.05):
+    tracker = get_latency_tracker(name)
+    for _ in range(MIN_SAMPLES):
+        tracker.record(seconds)
+    return tracker
+
+
+def _wait_for_cancel(observed):
+    def call():
+        while not current_deadline().cancelled:
+            time.sleep(0.01)
+        observed.set()
+        return 'primary'
+    return call
+
+
+def test_hedge_delay_is_the_p90_once_there_are_enough_samples():
+    tracker = LatencyTracker()
+    for i in range(1, MIN_SAMPLES):
+        tracker.record(i / 10)
+    assert tracker.hedge_delay() == DEFAULT_HEDGE_DELAY
+    tracker.record(1.0)
+    assert tracker.hedge_delay() == 1.0
+    fast = LatencyTracker()
+    for _ in range(MIN_SAMPLES):
+        fast.record(0.001)
+    assert fast.hedge_delay() == MIN_HEDGE_DELAY
+
+
+def test_fast_primary_wins_without_hedging():
+    assert hedged_call('test_fast', lambda: 'primary', lambda: 'alternate') == 'primary'
+    stats = get_latency_tracker('test_fast').stats()
+    assert (stats['hedged'], stats['primary_wins'], stats['samples']) == (0, 1, 1)
+
+
+def test_slow_primary_loses_to_alternate_and_is_cancelled():
+    tracker = _fast_tracker('test_slow', 0.1)
+    cancelled = threading.Event()
+    started = time.monotonic()
+    assert hedged_call('test_slow', _wait_for_cancel(cancelled), lambda: 'alternate') == 'alternate'
+    assert time.monotonic() - started < 1
+    assert cancelled.wait(1)
+    stats = tracker.stats()
+    assert (stats['hedged'], stats['alternate_wins']) == (1, 1)
+    # The loser still leaves a sample, at least as slow as the hedge delay
+    assert stats['samples'] == MIN_SAMPLES + 1
+    assert max(tracker.samples) >= 0.1
+
+
+def test_unusable_primary_hands_over_to_alternate_at_once():
+    _fast_tracker('test_empty', 5)
+    started = time.monotonic()
+    assert hedged_call('test_empty', lambda: [], lambda: ['article']) == ['article']
+    assert time.monotonic() - started < 1
+
+
+def test_neither_usable_returns_primary():
+    assert hedged_call('test_neither', lambda: {}, lambda: None) == {}
+
+
+def test_hung_calls_only_exhaust_their_own_provider():
+    release = threading.Event()
+    hedging._pools['test_hung'] = hedging._ProviderPool('test_hung', workers=2)
+    for _ in range(2):
+        hedging._pools['test_hung'].submit(release.wait)
+    try:
+        started = time.monotonic()
+        # Another provider is unaffected
+        assert hedged_call('test_other', lambda: 'quote', lambda: None, providers=('test_ok', 'test_ok_alt')) == 'quote'
+        # And calls to the exhausted one skip straight to the alternate instead of queueing
+        assert hedged_call('test_stuck', lambda: 'never', lambda: 'bing', providers=('test_hung', 'test_alt')) == 'bing'
+        assert time.monotonic() - started < 1
+        assert get_latency_tracker('test_stuck').stats()['unstarted'] == 1
+    finally:
+        release.set()
+    time.sleep(0.05)
+    assert hedged_call('test_recovered', lambda: 'google', lambda: 'bing', providers=('test_hung', 'test_alt')) == 'google'
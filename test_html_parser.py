@@ -0,0 +1,11 @@
+from html_parser import strip_heavy_content
+
+
+def test_strip_heavy_content_removes_scripts_styles_svg_and_comments():
+    html = '<script src=a.js></script><style>p{}</style><!-- c --><svg viewBox="0 0 1 1"><path/></svg><p>kept</p>'
+    assert strip_heavy_content(html) == '<p>kept</p>'
+
+
+def test_strip_heavy_content_leaves_custom_elements_alone():
+    html = '<svg-icon name=x></svg-icon><section id=about>About us</section><svg><path/></svg><p>tail</p>'
+    assert strip_heavy_content(html) == '<svg-icon name=x></svg-icon><section id=about>About us</section><p>tail</p>'
@@ -0,0 +1,45 @@
+import os
+
+from http_cache import DiskCache
+
+
+def test_entries_round_trip_with_their_validators(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.put('https://example.com/', b'<html>', etag='"v1"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+    entry = cache.get('https://example.com/')
+    assert entry.body == b'<html>'
+    assert entry.etag == '"v1"' and entry.last_modified == 'Mon, 01 Jan 2024 00:00:00 GMT'
+    assert entry.age < 5
+    assert cache.get('https://example.com/other') is None
+
+
+def test_refresh_rewrites_only_the_metadata(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.put('https://example.com/', b'<html>', etag='"v1"')
+    body_path, meta_path = cache._paths('https://example.com/')
+    body_inode = os.stat(body_path).st_ino
+    entry = cache.get('https://example.com/')
+    entry.meta['stored_at'] -= 3600
+    cache.refresh('https://example.com/', entry)
+    assert os.stat(body_path).st_ino == body_inode
+    refreshed = cache.get('https://example.com/')
+    assert refreshed.body == b'<html>' and refreshed.etag == '"v1"'
+    assert refreshed.age < 5
+
+
+def test_least_recently_used_entries_go_when_over_the_cap(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=600)
+    cache.put('https://example.com/a', b'a' * 150)
+    cache.put('https://example.com/b', b'b' * 150)
+    os.utime(cache._paths('https://example.com/a')[0], (1, 1))
+    os.utime(cache._paths('https://example.com/a')[1], (1, 1))
+    cache.put('https://example.com/c', b'c' * 150)
+    assert cache.get('https://example.com/a') is None
+    assert cache.get('https://example.com/b') and cache.get('https://example.com/c')
+    assert cache.size <= 600
+
+
+def test_bodies_larger_than_the_cap_are_not_stored(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=10)
+    cache.put('https://example.com/', b'x' * 11)
+    assert cache.get('https://example.com/') is None
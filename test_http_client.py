@@ -0,0 +1,84 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from http_cache import DiskCache
+from http_client import HttpClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    hits = {}
+
+    def do_GET(self):
+        hits = Handler.hits[self.path] = Handler.hits.get(self.path, 0) + 1
+        if self.path == '/page':
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self._send(200, b'<html>page</html>', ETag='"v1"')
+        elif self.path == '/flaky':
+            if hits == 1:
+                self._send(503, b'busy', **{'Retry-After': '0'})
+            else:
+                self._send(200, b'ok')
+        elif self.path == '/big':
+            self._send(200, b'x' * 5000)
+        else:
+            self._send(404, b'')
+
+    def _send(self, status, body, **headers):
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.hits = {}
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_not_modified_reuses_the_cached_body(server, tmp_path):
+    client = HttpClient(cache=DiskCache(str(tmp_path)), polite=False)
+    first = client.get(server + '/page')
+    assert first.text == '<html>page</html>' and not first.from_cache
+    second = client.get(server + '/page')
+    assert second.status_code == 200 and second.from_cache
+    assert second.text == '<html>page</html>'
+    assert second.headers['Content-Type'] == 'text/html; charset=utf-8'
+    assert Handler.hits['/page'] == 2
+
+
+def test_retryable_status_is_retried(server):
+    client = HttpClient(polite=False)
+    response = client.get(server + '/flaky')
+    assert response.status_code == 200 and response.text == 'ok'
+    assert Handler.hits['/flaky'] == 2
+
+
+def test_retries_give_up_after_the_limit(server):
+    client = HttpClient(polite=False)
+    assert client.get(server + '/flaky', retries=0).status_code == 503
+
+
+def test_large_bodies_are_cut_off_and_not_cached(server, tmp_path):
+    cache = DiskCache(str(tmp_path))
+    client = HttpClient(cache=cache, polite=False)
+    response = client.get(server + '/big', max_bytes=1000)
+    assert response.truncated and len(response.content) == 1000
+    assert cache.get(server + '/big') is None
+    assert not client.get(server + '/big', max_bytes=5000).truncated
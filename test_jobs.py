@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from jobs import Job, JobStore, JobManager, JobStoreFull, QUEUED, RUNNING, DONE, FAILED, MAX_JOB_DEADLINE
+
+
+class FakeScraper:
+    def __init__(self, sources=('website', 'wikipedia'), error=None):
+        self.sources = sources
+        self.error = error
+        self.release = threading.Event()
+        self.calls = []
+
+    def scrape_company(self, company_name, website=None, refresh=False, on_source=None, deadline=None, max_deadline=None):
+        self.calls.append((company_name, deadline, max_deadline))
+        for name in self.sources:
+            on_source(name, {})
+        self.release.wait(2)
+        if self.error:
+            raise self.error
+        return {'name': company_name}
+
+
+def _wait_for(manager, job_id, status):
+    for _ in range(200):
+        job = manager.get(job_id)
+        if job['status'] == status:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job never reached {status}: {job}")
+
+
+def test_job_reports_progress_while_running_and_skips_the_rest():
+    scraper = FakeScraper()
+    manager = JobManager(scraper, workers=1)
+    job_id = manager.submit('Acme', 'acme.com', deadline=10_000)
+    job = _wait_for(manager, job_id, RUNNING)
+    for _ in range(200):
+        if manager.get(job_id)['progress']['wikipedia'] == DONE:
+            break
+        time.sleep(0.01)
+    job = manager.get(job_id)
+    assert job['progress'] == {'website': DONE, 'wikipedia': DONE, 'finance': 'pending', 'news': 'pending'}
+    assert 'result' not in job
+    scraper.release.set()
+    job = _wait_for(manager, job_id, DONE)
+    assert job['result'] == {'name': 'Acme'}
+    assert job['progress'] == {'website': DONE, 'wikipedia': DONE, 'finance': 'skipped', 'news': 'skipped'}
+    assert scraper.calls == [('Acme', MAX_JOB_DEADLINE, MAX_JOB_DEADLINE)]
+    manager.shutdown()
+
+
+def test_cached_result_marks_every_source_cached():
+    scraper = FakeScraper(sources=())
+    scraper.release.set()
+    manager = JobManager(scraper, workers=1)
+    job = _wait_for(manager, manager.submit('Acme', None), DONE)
+    assert set(job['progress'].values()) == {'cached'}
+    manager.shutdown()
+
+
+def test_failed_job_keeps_the_error():
+    scraper = FakeScraper(error=RuntimeError('boom'))
+    scraper.release.set()
+    manager = JobManager(scraper, workers=1)
+    job = _wait_for(manager, manager.submit('Acme', None), FAILED)
+    assert job['error'] == 'boom' and 'result' not in job
+    manager.shutdown()
+
+
+def test_finished_jobs_expire_after_the_ttl():
+    store = JobStore(ttl=0.05)
+    job = Job('Acme', None)
+    store.add(job)
+    assert store.get(job.id)['status'] == QUEUED
+    time.sleep(0.1)
+    # Unfinished jobs never expire
+    assert store.get(job.id) is not None
+    store.update(job.id, status=DONE, result={})
+    assert store.get(job.id)['status'] == DONE
+    time.sleep(0.1)
+    assert store.get(job.id) is None
+
+
+def test_full_store_drops_the_oldest_finished_job_only():
+    store = JobStore(max_jobs=2)
+    first, second = Job('A', None), Job('B', None)
+    store.add(first)
+    store.add(second)
+    with pytest.raises(JobStoreFull):
+        store.add(Job('C', None))
+    store.update(second.id, status=FAILED, error='x')
+    third = Job('C', None)
+    store.add(third)
+    assert store.get(second.id) is None
+    assert store.get(first.id) and store.get(third.id)
+    assert store.stats()[QUEUED] == 2
@@ -0,0 +1,76 @@
+import threading
+import time
+
+from micro_batcher import MicroBatcher
+from deadline import current_deadline, deadline_scope
+
+
+def test_concurrent_keys_share_one_batch():
+    calls = []
+
+    def fetch(keys):
+        calls.append(sorted(keys))
+        return {key: key.lower() for key in keys if key != 'MISSING'}
+
+    batcher = MicroBatcher(fetch, max_wait=0.05)
+    futures = [batcher.submit(key) for key in ('A', 'B', 'A', 'MISSING')]
+    assert [future.result(1) for future in futures] == ['a', 'b', 'a', None]
+    assert calls == [['A', 'B', 'MISSING']]
+    assert batcher.stats() == {'requests': 4, 'batches': 1, 'pending': 0}
+
+
+def test_full_batch_goes_out_without_waiting():
+    batcher = MicroBatcher(lambda keys: {key: key for key in keys}, max_batch=2, max_wait=10)
+    started = time.monotonic()
+    assert batcher.get_many(['A', 'B'], timeout=1) == {'A': 'A', 'B': 'B'}
+    assert time.monotonic() - started < 1
+
+
+def test_incremental_resolve_does_not_wait_for_the_rest():
+    release = threading.Event()
+
+    def fetch(keys, resolve):
+        resolve('FAST', 1)
+        release.wait(2)
+        return {'SLOW': 2}
+
+    batcher = MicroBatcher(fetch, max_wait=0.01, incremental=True)
+    fast, slow = batcher.submit('FAST'), batcher.submit('SLOW')
+    assert fast.result(1) == 1
+    assert not slow.done()
+    release.set()
+    assert slow.result(1) == 2
+
+
+def test_failed_batch_fails_every_caller():
+    def fetch(keys):
+        raise RuntimeError('down')
+
+    batcher = MicroBatcher(fetch, max_wait=0.01)
+    future = batcher.submit('A')
+    try:
+        future.result(1)
+    except RuntimeError as e:
+        assert str(e) == 'down'
+    else:
+        raise AssertionError('expected the batch error')
+
+
+def test_batch_runs_until_the_latest_caller_deadline_capped_by_max_time():
+    budgets = []
+
+    def fetch(keys):
+        budgets.append(current_deadline().remaining())
+        return {}
+
+    batcher = MicroBatcher(fetch, max_batch=2, max_time=30)
+    with deadline_scope(1):
+        batcher.submit('A')
+    with deadline_scope(10):
+        batcher.submit('B')
+    assert 9 < budgets[0] <= 10
+
+    with deadline_scope(1):
+        batcher.submit('C')
+    batcher.submit('D')
+    assert 29 < budgets[1] <= 30
@@ -0,0 +1,45 @@
+import pytest
+
+from scraper import CompanyScraper
+
+ARTICLE = {'title': 'Acme expands', 'link': 'https://example.com/acme', 'date': '', 'source': 'Example',
+           'description': ''}
+
+
+@pytest.fixture(scope='module')
+def scraper():
+    return CompanyScraper()
+
+
+def _merged(scraper, news_data):
+    result = {'sources': {}, 'data_quality': {}, 'source_urls': {}}
+    scraper._merge_sections(result, 'Acme Corp', {'news': {'data': news_data}})
+    return result
+
+
+def test_google_answer_is_labelled_google(scraper, monkeypatch):
+    monkeypatch.setattr(scraper, '_google_news_articles', lambda name: [ARTICLE])
+    monkeypatch.setattr(scraper, '_bing_news_articles', lambda name: [])
+    data = scraper.scrape_news('Acme Corp')
+    assert data['provider'] == 'Google News'
+    result = _merged(scraper, data)
+    assert result['news'] == [ARTICLE]
+    assert result['sources']['news'] == 'Google News'
+    assert result['source_urls']['news'] == 'https://news.google.com/search?q=Acme+Corp'
+
+
+def test_bing_answer_is_labelled_bing(scraper, monkeypatch):
+    monkeypatch.setattr(scraper, '_google_news_articles', lambda name: [])
+    monkeypatch.setattr(scraper, '_bing_news_articles', lambda name: [ARTICLE])
+    result = _merged(scraper, scraper.scrape_news('Acme Corp'))
+    assert result['news'] == [ARTICLE]
+    assert result['sources']['news'] == 'Bing News'
+    assert result['source_urls']['news'] == 'https://www.bing.com/news/search?q=Acme+Corp'
+
+
+def test_no_articles_from_either(scraper, monkeypatch):
+    monkeypatch.setattr(scraper, '_google_news_articles', lambda name: [])
+    monkeypatch.setattr(scraper, '_bing_news_articles', lambda name: [])
+    data = scraper.scrape_news('Acme Corp')
+    assert data['articles'] == []
+    assert _merged(scraper, data)['data_quality']['news'] == 'not_found'
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from politeness import TokenBucket, PolitenessScheduler, RobotsDisallowed
+from deadline import deadline_scope, DeadlineExceeded
+
+ROBOTS = """User-agent: *
+Disallow: /private
+Crawl-delay: 2
+"""
+
+
+def _scheduler(robots=ROBOTS, status_code=200, **kwargs):
+    fetched = []
+
+    def fetch_robots(url):
+        fetched.append(url)
+        return status_code, robots
+
+    scheduler = PolitenessScheduler(fetch_robots=fetch_robots, respect_robots=True, **kwargs)
+    return scheduler, fetched
+
+
+def test_bucket_allows_a_burst_then_spaces_callers_out():
+    bucket = TokenBucket(rate=2, burst=3)
+    now = bucket.updated
+    assert [bucket.reserve(now) for _ in range(3)] == [0, 0, 0]
+    assert [bucket.reserve(now) for _ in range(2)] == [0.5, 1.0]
+    # A second later two tokens have come back, both owed to the queued callers
+    assert bucket.reserve(now + 1) == 0.5
+
+
+def test_blocked_bucket_waits_out_the_back_off():
+    bucket = TokenBucket(rate=10, burst=10)
+    now = bucket.updated
+    bucket.block(now, 5)
+    assert bucket.reserve(now) == 5
+
+
+def test_robots_rules_and_crawl_delay():
+    scheduler, fetched = _scheduler(host_limits={})
+    assert scheduler.allowed('https://example.com/about')
+    assert not scheduler.allowed('https://example.com/private/page')
+    with pytest.raises(RobotsDisallowed):
+        with scheduler.slot('https://example.com/private/page'):
+            pass
+    # APIs skip the robots check
+    with scheduler.slot('https://example.com/private/api', robots=False):
+        pass
+    assert fetched == ['https://example.com/robots.txt']
+    stats = scheduler.stats()['example.com']
+    assert stats['rate'] == 0.5 and stats['burst'] == 1
+    assert stats['disallowed'] == 1
+
+
+def test_missing_robots_allows_everything():
+    scheduler, _ = _scheduler(status_code=404, host_limits={})
+    assert scheduler.allowed('https://example.com/private/page')
+
+
+def test_token_wait_past_the_deadline_fails_fast():
+    scheduler, _ = _scheduler(host_limits={'slow.example': (0.1, 1, 1)})
+    with scheduler.slot('https://slow.example/a', robots=False):
+        pass
+    started = time.monotonic()
+    with deadline_scope(1):
+        with pytest.raises(DeadlineExceeded):
+            with scheduler.slot('https://slow.example/b', robots=False):
+                pass
+    assert time.monotonic() - started < 0.5
+
+
+def test_least_recently_used_hosts_are_forgotten():
+    scheduler, fetched = _scheduler(host_limits={}, max_hosts=2)
+    scheduler.allowed('https://a.example/')
+    scheduler.allowed('https://b.example/')
+    scheduler.allowed('https://a.example/')
+    scheduler.allowed('https://c.example/')
+    assert list(scheduler.stats()) == ['a.example', 'c.example']
+    with scheduler.slot('https://a.example/', robots=False):
+        scheduler.allowed('https://c.example/')
+        scheduler.allowed('https://d.example/')
+        # a is the least recently used, but has a request in flight, so c goes instead
+        assert list(scheduler.stats()) == ['a.example', 'd.example']
@@ -0,0 +1,104 @@
+import threading
+import time
+
+from circuit_breaker import CircuitBreaker
+from quote_service import QuoteService, YAHOO_COOKIE_URL, YAHOO_CRUMB_URL, YAHOO_QUOTE_URL, ALPHA_VANTAGE_URL
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None, text=''):
+        self.status_code = status_code
+        self.data = data
+        self.text = text
+
+    def json(self):
+        return self.data
+
+
+class FakeHttp:
+    """Yahoo that wants a crumb, and an Alpha Vantage that only knows IBM"""
+
+    def __init__(self, crumbs=('abc',), alpha_vantage_delay=0):
+        self.crumbs = list(crumbs)
+        self.alpha_vantage_delay = alpha_vantage_delay
+        self.calls = []
+        self.crumb = None
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append(url)
+        if url == YAHOO_COOKIE_URL:
+            return FakeResponse(404)
+        if url == YAHOO_CRUMB_URL:
+            crumb = self.crumbs.pop(0) if self.crumbs else None
+            if crumb is None:
+                raise ConnectionError('refused')
+            self.crumb = crumb
+            return FakeResponse(200, text=crumb)
+        if url == YAHOO_QUOTE_URL:
+            if not self.crumb or params.get('crumb') != self.crumb:
+                return FakeResponse(401)
+            results = [{'symbol': symbol, 'regularMarketPrice': 1.5}
+                       for symbol in params['symbols'].split(',') if symbol == 'AAPL']
+            return FakeResponse(200, {'quoteResponse': {'result': results}})
+        if url == ALPHA_VANTAGE_URL:
+            time.sleep(self.alpha_vantage_delay)
+            if params['symbol'] == 'IBM':
+                return FakeResponse(200, {'Global Quote': {'05. price': '9.00'}})
+            return FakeResponse(200, {'Information': 'rate limited'})
+        raise AssertionError(url)
+
+
+def _service(http):
+    service = QuoteService(http_client=http, batch_wait=0.01)
+    service.yahoo_breaker = CircuitBreaker('test_yahoo')
+    service.alpha_vantage_breaker = CircuitBreaker('test_alpha_vantage')
+    return service
+
+
+def test_batch_quote_with_alpha_vantage_fallback_and_cache():
+    http = FakeHttp()
+    service = _service(http)
+    quotes = service.get_quotes(['aapl', 'IBM', 'NOPE'])
+    assert quotes['AAPL'] == {'stock_price': '1.50'}
+    assert quotes['IBM'] == {'stock_price': '9.00'}
+    assert quotes['NOPE'] is None
+    assert http.calls.count(YAHOO_QUOTE_URL) == 1
+    calls = len(http.calls)
+    assert service.get_quote('AAPL') == {'stock_price': '1.50'}
+    assert len(http.calls) == calls
+
+
+def test_yahoo_quotes_resolve_before_the_fallbacks_finish():
+    service = _service(FakeHttp(alpha_vantage_delay=0.5))
+    results = {}
+
+    def look(symbol):
+        started = time.monotonic()
+        results[symbol] = (service.get_quote(symbol), time.monotonic() - started)
+
+    threads = [threading.Thread(target=look, args=(symbol,)) for symbol in ('AAPL', 'IBM')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results['AAPL'][0] and results['IBM'][0]
+    assert results['AAPL'][1] < 0.4 <= results['IBM'][1]
+
+
+def test_stale_crumb_is_refreshed_once():
+    http = FakeHttp()
+    service = _service(http)
+    service.crumb = 'expired'
+    assert service.get_quote('AAPL') == {'stock_price': '1.50'}
+    assert http.calls.count(YAHOO_QUOTE_URL) == 2
+    assert service.crumb == 'abc'
+
+
+def test_failed_crumb_counts_against_yahoo_and_falls_back():
+    http = FakeHttp(crumbs=(None,))
+    service = _service(http)
+    assert service.get_quote('IBM') == {'stock_price': '9.00'}
+    assert service.crumb is None
+    # Without a crumb Yahoo answers 401 and there is nothing to refresh
+    assert http.calls.count(YAHOO_QUOTE_URL) == 1
+    assert service.yahoo_breaker.snapshot()['recent_failures'] == 1
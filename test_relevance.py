@@ -0,0 +1,37 @@
+from relevance import (TermMatcher, RelevanceScorer, domain_label, non_company_terms, reads_like_company,
+                       has_legal_form)
+
+
+def test_terms_match_whole_words_only():
+    matcher = TermMatcher({'legal': ['co', 'inc']})
+    assert matcher.find('Cocoa and incense') == {}
+    assert matcher.find('Acme Co. and Acme Inc') == {'legal': ['co', 'inc']}
+
+
+def test_longer_terms_imply_the_shorter_ones_inside_them():
+    matcher = TermMatcher({'phrase': ['about us'], 'word': ['about']})
+    assert matcher.find('Read about us') == {'phrase': ['about us'], 'word': ['about']}
+
+
+def test_website_score_caps_each_group():
+    scorer = RelevanceScorer('Acme Robotics', 'website', domain='acme')
+    relevance = scorer.score('Acme Robotics company: products, services and careers at acme')
+    assert relevance.terms('name') == ['acme robotics']
+    assert sorted(relevance.terms('name_part')) == ['acme', 'robotics']
+    # indicator 2 (capped) + name 3 + two name parts + domain 2
+    assert relevance.score == 2 + 3 + 2 + 2
+
+
+def test_wikipedia_indicators_are_uncapped():
+    scorer = RelevanceScorer('Zeta', 'wikipedia')
+    assert scorer.score('a company founded in 1990, headquartered in Oslo').score == 3
+    assert [r.score for r in scorer.score_many(['', 'Zeta'])] == [0, 3 + 1]
+
+
+def test_helpers():
+    assert domain_label('https://www.acme.com/about') == 'acme'
+    assert non_company_terms('An ancient river') == ['ancient', 'river']
+    assert reads_like_company('The company was founded in 1901')
+    assert not reads_like_company('A river in Europe')
+    assert has_legal_form('Acme Inc')
+    assert not has_legal_form('Acme Robotics')
@@ -0,0 +1,62 @@
+import time
+
+from result_cache import ResultCache, normalize_lookup_key
+
+
+def test_lookup_key_ignores_case_whitespace_and_url_cosmetics():
+    assert normalize_lookup_key('  Acme   Corp ', 'https://www.Acme.com/') == normalize_lookup_key('acme corp', 'acme.com')
+
+
+def test_get_returns_a_copy():
+    cache = ResultCache()
+    cache.put('k', {'news': []})
+    cache.get('k')['news'].append('changed')
+    assert cache.get('k') == {'news': []}
+
+
+def test_entries_expire_after_ttl():
+    cache = ResultCache(ttl=0.05)
+    cache.put('k', {'a': 1})
+    assert cache.get('k') == {'a': 1}
+    time.sleep(0.06)
+    assert cache.get('k') is None
+    assert cache.stats()['expirations'] == 1
+
+
+def test_put_ttl_overrides_default():
+    cache = ResultCache(ttl=60)
+    cache.put('short', {'a': 1}, ttl=0.05)
+    cache.put('long', {'a': 1})
+    time.sleep(0.06)
+    assert cache.get('short') is None
+    assert cache.get('long') == {'a': 1}
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = ResultCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+
+
+def test_byte_cap_evicts_and_rejects_oversized_results():
+    cache = ResultCache(max_bytes=20)  # each payload is 12 bytes of JSON
+    cache.put('a', 'x' * 10)
+    cache.put('b', 'y' * 10)
+    assert cache.get('a') is None and cache.get('b') == 'y' * 10
+    cache.put('huge', 'z' * 100)
+    assert cache.get('huge') is None
+
+
+def test_peek_is_not_counted():
+    cache = ResultCache()
+    assert cache.get('k') is None
+    assert cache.peek('k') is None
+    cache.put('k', 1)
+    assert cache.peek('k') == 1
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (0, 1)
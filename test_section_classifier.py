@@ -0,0 +1,40 @@
+from bs4 import BeautifulSoup
+
+from section_classifier import classify_sections, extract_products, extract_leaders
+
+
+def _soup(html):
+    return BeautifulSoup(html, 'html.parser')
+
+
+def test_id_beats_class_beats_heading():
+    soup = _soup('''
+        <div><h2>About Acme</h2><p>heading</p></div>
+        <div class="about-block">class</div>
+        <section id="about-us">id</section>
+    ''')
+    assert classify_sections(soup)['about'].get_text() == 'id'
+
+
+def test_heading_match_uses_its_parent_or_following_listing():
+    soup = _soup('''
+        <div id="x"><h2>Our Products</h2><h3>Widget</h3></div>
+        <h2>Leadership</h2><ul><li>Jane Doe, CEO</li></ul>
+    ''')
+    sections = classify_sections(soup)
+    assert sections['products']['id'] == 'x'
+    assert sections['leadership'].name == 'ul'
+
+
+def test_missing_sections_are_none():
+    assert classify_sections(_soup('<p>Nothing here</p>')) == {'about': None, 'products': None, 'leadership': None}
+
+
+def test_extract_products_prefers_headings_then_list_items():
+    assert extract_products(_soup('<div><h3>Widget</h3><h3>Gadget</h3><li>ignored</li></div>')) == ['Widget', 'Gadget']
+    assert extract_products(_soup('<ul><li>One</li><li>Two</li></ul>'), limit=1) == ['One']
+
+
+def test_extract_leaders_from_headings_and_list_items():
+    assert extract_leaders(_soup('<div><h3>Jane Doe</h3><p>CEO</p></div>')) == [{'name': 'Jane Doe', 'position': 'CEO'}]
+    assert extract_leaders(_soup('<ul><li>John Roe - CTO</li></ul>')) == [{'name': 'John Roe', 'position': 'CTO'}]
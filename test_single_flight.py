@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+
+from deadline import deadline_scope, DeadlineExceeded
+from single_flight import SingleFlight
+
+
+def _start_leader(flight, key, work, results):
+    started = threading.Event()
+
+    def run():
+        results.append(flight.do(key, lambda: started.set() or work()))
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    started.wait(1)
+    return thread
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+    results = []
+    leader = _start_leader(flight, 'k', lambda: calls.append(1) or time.sleep(0.2) or {'n': 1}, results)
+    follower = flight.do('k', lambda: calls.append(2) or {'n': 2})
+    leader.join()
+    assert calls == [1]
+    assert follower == results[0] == {'n': 1}
+    assert follower is not results[0]
+    assert flight.stats() == {'in_flight': 0, 'executions': 1, 'coalesced': 1}
+
+
+def test_followers_get_the_leaders_exception():
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.2)
+        raise ValueError('boom')
+
+    errors = []
+
+    def lead():
+        try:
+            flight.do('k', fail)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    time.sleep(0.05)
+    with pytest.raises(ValueError):
+        flight.do('k', lambda: 'unused')
+    leader.join()
+    assert errors
+
+
+def test_follower_gives_up_at_its_own_deadline():
+    flight = SingleFlight()
+    results = []
+    leader = _start_leader(flight, 'k', lambda: time.sleep(0.5) or 'done', results)
+    started = time.monotonic()
+    with deadline_scope(0.1):
+        with pytest.raises(DeadlineExceeded):
+            flight.do('k', lambda: 'unused')
+    assert time.monotonic() - started < 0.4
+    leader.join()
+    assert results == ['done']
+
+
+def test_calls_after_completion_run_again():
+    flight = SingleFlight()
+    assert flight.do('k', lambda: 1) == 1
+    assert flight.do('k', lambda: 2) == 2
@@ -0,0 +1,38 @@
+from ticker_index import TickerIndex, normalize_company_name, trigrams
+
+ROWS = [
+    {'name': 'Apple Inc.', 'aliases': 'Apple Computer', 'ticker': 'AAPL', 'exchange': 'NASDAQ'},
+    {'name': 'Microsoft Corporation', 'aliases': '', 'ticker': 'MSFT', 'exchange': 'NASDAQ'},
+    {'name': 'Procter & Gamble Co', 'aliases': 'P&G', 'ticker': 'PG', 'exchange': 'NYSE'},
+    {'name': 'No Ticker Ltd', 'aliases': '', 'ticker': '', 'exchange': 'NYSE'},
+]
+
+
+def test_normalize_drops_punctuation_and_legal_forms():
+    assert normalize_company_name('The Procter & Gamble Co.') == 'procter and gamble'
+    assert normalize_company_name("McDonald's Corp") == 'mcdonalds'
+
+
+def test_trigrams_are_padded():
+    assert trigrams('ab') == {'  a', ' ab', 'ab '}
+
+
+def test_exact_names_and_aliases_score_one():
+    index = TickerIndex(ROWS)
+    assert len(index) == 3
+    assert index.lookup('apple computer')[0].ticker == 'AAPL'
+    assert index.lookup('Procter and Gamble')[0].score == 1.0
+
+
+def test_fuzzy_lookup_ranks_the_closest_name_first():
+    index = TickerIndex(ROWS)
+    matches = index.lookup('Microsft')
+    assert matches[0].ticker == 'MSFT'
+    assert 0 < matches[0].score < 1
+
+
+def test_best_rejects_weak_matches():
+    index = TickerIndex(ROWS)
+    assert index.best('Microsoft Corp').ticker == 'MSFT'
+    assert index.best('Completely Different Name') is None
+    assert index.lookup('') == []
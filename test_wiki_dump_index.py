@@ -0,0 +1,42 @@
+from wiki_dump_index import build_index, extract_company, WikiDumpIndex
+
+ARTICLE = """{{Infobox company
+| name = Acme Corporation
+| industry = [[Manufacturing]]
+| founded = 1920
+| key_people = Jane Doe
+}}
+'''Acme Corporation''' is an American manufacturer of everything, headquartered in Springfield.
+"""
+
+DUMP = f"""<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.10/">
+<page><title>ACME Holdings Group</title><ns>0</ns><redirect title="Acme Corporation" /><revision><text>#REDIRECT [[Acme Corporation]]</text></revision></page>
+<page><title>Acme Corporation</title><ns>0</ns><revision><text>{ARTICLE}</text></revision></page>
+<page><title>Banana</title><ns>0</ns><revision><text>A long yellow fruit that grows in bunches on large plants.</text></revision></page>
+<page><title>Nana</title><ns>0</ns><redirect title="Banana" /><revision><text>#REDIRECT [[Banana]]</text></revision></page>
+<page><title>Talk:Acme Corporation</title><ns>1</ns><revision><text>{ARTICLE}</text></revision></page>
+</mediawiki>
+"""
+
+
+def test_extract_company_reads_the_infobox_and_lead():
+    record = extract_company('Acme Corporation', ARTICLE)
+    assert record['article_title'] == 'Acme Corporation'
+    assert 'manufacturer of everything' in record['overview']
+    assert record['leadership'][0]['name'] == 'Jane Doe'
+    assert extract_company('Banana', 'A fruit.') is None
+
+
+def test_build_index_and_lookup(tmp_path):
+    dump = tmp_path / 'dump.xml'
+    dump.write_text(DUMP, encoding='utf-8')
+    index_path = str(tmp_path / 'companies.idx')
+    assert build_index(str(dump), index_path) == 1
+
+    index = WikiDumpIndex(index_path)
+    assert index.lookup('Acme Corporation')['article_title'] == 'Acme Corporation'
+    # A redirect that appears before its target still becomes an alias
+    assert index.lookup('ACME Holdings Group')['article_title'] == 'Acme Corporation'
+    assert index.lookup('Acme Holdings') is None
+    assert index.lookup('Nana') is None
+    assert index.lookup('Banana') is None
@@ -0,0 +1,157 @@
+import os
+import re
+import csv
+import time
+import logging
+import threading
+from array import array
+from collections import defaultdict
+
+logger = logging.getLogger('TickerIndex')
+
+DEFAULT_LISTINGS_FILE = os.environ.get('SCRAPER_LISTINGS_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'listings.csv'))
+# Fuzzy matches below this similarity are not trusted; quoting the wrong company is worse than none
+FUZZY_MIN_SCORE = float(os.environ.get('SCRAPER_TICKER_FUZZY_MIN_SCORE', 0.75))
+
+# Legal-form words that don't help tell companies apart
+LEGAL_SUFFIXES = {'inc', 'incorporated', 'corp', 'corporation', 'co', 'company', 'companies', 'ltd', 'limited',
+                  'plc', 'llc', 'lp', 'sa', 'ag', 'nv', 'se', 'the'}
+
+
+def normalize_company_name(name):
+    """Lowercase a company name and drop punctuation and legal-form words"""
+    name = (name or '').lower().replace('&', ' and ')
+    name = re.sub(r"[.'’!]", '', name)
+    words = [word for word in re.split(r'[^a-z0-9]+', name) if word and word not in LEGAL_SUFFIXES]
+    return ' '.join(words)
+
+
+def trigrams(key):
+    padded = f'  {key} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TickerMatch:
+    def __init__(self, ticker, name, exchange, score):
+        self.ticker = ticker
+        self.name = name
+        self.exchange = exchange
+        self.score = score
+
+    def __repr__(self):
+        return f'TickerMatch({self.ticker!r}, {self.name!r}, {self.score:.2f})'
+
+
+class TickerIndex:
+    """In-memory ticker lookup over a listings file of name, aliases, ticker and exchange.
+
+    Every name and alias is a normalized key. Keys map to listings through a flat array,
+    and a trigram index over the keys finds fuzzy candidates without scanning them all.
+    """
+
+    def __init__(self, rows=()):
+        self.names = []
+        self.tickers = []
+        self.exchanges = []
+        self.keys = []
+        self.key_listing = array('I')  # key index -> listing index
+        self.key_grams = array('H')  # key index -> number of trigrams in the key
+        self.exact = {}  # normalized key -> key index
+        self.grams = {}  # trigram -> array of key indexes
+        for row in rows:
+            self._add(row)
+        self._freeze()
+
+    @classmethod
+    def from_csv(cls, path=DEFAULT_LISTINGS_FILE):
+        started = time.perf_counter()
+        with open(path, newline='', encoding='utf-8') as f:
+            index = cls(csv.DictReader(f))
+        logger.info(f"Loaded {len(index.tickers)} listings from {path} in {(time.perf_counter() - started) * 1000:.1f}ms")
+        return index
+
+    def _add(self, row):
+        ticker = (row.get('ticker') or '').strip()
+        name = (row.get('name') or '').strip()
+        if not ticker or not name:
+            return
+        listing = len(self.tickers)
+        self.names.append(name)
+        self.tickers.append(ticker)
+        self.exchanges.append((row.get('exchange') or '').strip())
+
+        aliases = [alias for alias in (row.get('aliases') or '').split('|') if alias.strip()]
+        for alias in [name] + aliases:
+            key = normalize_company_name(alias)
+            if not key or key in self.exact:
+                continue
+            key_index = len(self.keys)
+            self.keys.append(key)
+            self.key_listing.append(listing)
+            self.exact[key] = key_index
+            key_grams = trigrams(key)
+            self.key_grams.append(len(key_grams))
+            for gram in key_grams:
+                self.grams.setdefault(gram, []).append(key_index)
+
+    def _freeze(self):
+        # Posting lists are only appended while loading, compact them afterwards
+        self.grams = {gram: array('I', postings) for gram, postings in self.grams.items()}
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def lookup(self, company_name, limit=5):
+        """Return up to limit TickerMatch candidates, best first; an exact name match scores 1.0"""
+        key = normalize_company_name(company_name)
+        if not key:
+            return []
+
+        key_index = self.exact.get(key)
+        if key_index is not None:
+            return [self._match(key_index, 1.0)]
+
+        # Dice similarity over trigrams, counting shared grams from the posting lists only
+        query_grams = trigrams(key)
+        shared = defaultdict(int)
+        for gram in query_grams:
+            for candidate in self.grams.get(gram, ()):
+                shared[candidate] += 1
+
+        best = {}  # listing -> (score, key index)
+        for candidate, count in shared.items():
+            score = 2.0 * count / (len(query_grams) + self.key_grams[candidate])
+            listing = self.key_listing[candidate]
+            if score > best.get(listing, (0, None))[0]:
+                best[listing] = (score, candidate)
+
+        ranked = sorted(best.values(), key=lambda item: item[0], reverse=True)[:limit]
+        return [self._match(candidate, round(score, 3)) for score, candidate in ranked]
+
+    def best(self, company_name, min_score=FUZZY_MIN_SCORE):
+        """Return the single best TickerMatch if it is similar enough, else None"""
+        matches = self.lookup(company_name, limit=1)
+        if matches and matches[0].score >= min_score:
+            return matches[0]
+        return None
+
+    def _match(self, key_index, score):
+        listing = self.key_listing[key_index]
+        return TickerMatch(self.tickers[listing], self.names[listing], self.exchanges[listing], score)
+
+
+_shared_index = None
+_shared_lock = threading.Lock()
+
+
+def get_ticker_index():
+    """Return the process-wide TickerIndex, loading the bundled listings on first use"""
+    global _shared_index
+    with _shared_lock:
+        if _shared_index is None:
+            try:
+                _shared_index = TickerIndex.from_csv()
+            except (OSError, csv.Error) as e:
+                logger.warning(f"Ticker listings unavailable, using an empty index: {e}")
+                _shared_index = TickerIndex()
+        return _shared_index
@@ -0,0 +1,361 @@
+"""Offline index of company infoboxes extracted from a Wikipedia XML dump.
+
+Build it once from a pages-articles dump (plain or .bz2):
+
+    python wiki_dump_index.py enwiki-latest-pages-articles.xml.bz2 data/wiki_companies.idx
+
+The index file is memory-mapped and searched in place, so opening it is instant and
+lookups don't load anything beyond the pages they touch.
+"""
+import os
+import re
+import bz2
+import sys
+import json
+import mmap
+import time
+import struct
+import logging
+import calendar
+import tempfile
+import xml.etree.ElementTree as ET
+
+from ticker_index import normalize_company_name
+
+logger = logging.getLogger('WikiDumpIndex')
+
+DEFAULT_INDEX_FILE = os.environ.get('SCRAPER_WIKI_INDEX', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'wiki_companies.idx'))
+
+MAGIC = b'WKIX'
+VERSION = 1
+HEADER = struct.Struct('<4sIIQQ')  # magic, version, key count, key table offset, keys blob offset
+KEY_ENTRY = struct.Struct('<IHQI')  # key offset, key length, record offset, record length
+
+INFOBOX_START = re.compile(r'\{\{\s*Infobox[ _](?:company|dot-com company)\b', re.IGNORECASE)
+LIST_TEMPLATES = {'ubl', 'unbulleted list', 'plainlist', 'plain list', 'flatlist', 'hlist', 'collapsible list', 'bulleted list'}
+DATE_TEMPLATES = {'start date', 'start date and age', 'founded date', 'birth date', 'start-date'}
+PASS_THROUGH_TEMPLATES = {'nowrap', 'nobr', 'small', 'lang', 'nobold'}
+CURRENCY_TEMPLATES = {'us$': 'US$', 'usd': 'US$', 'ussd': 'US$', 'gbp': '£', 'eur': '€', '€': '€', 'jpy': '¥'}
+
+# Infobox parameters for each field, in order of preference
+FIELD_PARAMS = {
+    'industry': ['industry'],
+    'founded': ['founded', 'foundation'],
+    'headquarters': ['hq_location', 'location'],
+    'employees': ['num_employees'],
+    'revenue': ['revenue']
+}
+LEADER_PARAMS = [('key_people', 'Key people'), ('founders', 'Founders'), ('founder', 'Founder')]
+
+
+def _render_template(match):
+    parts = match.group(1).split('|')
+    name = parts[0].strip().lower()
+    args = [part.strip() for part in parts[1:] if '=' not in part]
+    if name in LIST_TEMPLATES:
+        # Plainlist and friends take one bulleted argument rather than one argument per item
+        items = [item.strip() for arg in args for item in re.split(r'(?:^|\n)\s*\*+', arg)]
+        return ', '.join(item for item in items if item)
+    if name in DATE_TEMPLATES:
+        numbers = [arg for arg in args if arg.isdigit()]
+        if len(numbers) >= 3 and 1 <= int(numbers[1]) <= 12:
+            return f"{calendar.month_name[int(numbers[1])]} {int(numbers[2])}, {numbers[0]}"
+        return numbers[0] if numbers else ''
+    if name in PASS_THROUGH_TEMPLATES:
+        return args[-1] if args else ''
+    if name in CURRENCY_TEMPLATES:
+        return CURRENCY_TEMPLATES[name] + (args[0] if args else '')
+    # Citations, icons, trend arrows and anything else we can't render are dropped
+    return ''
+
+
+def strip_wikitext(text):
+    """Reduce wikitext to the plain text a reader would see"""
+    text = re.sub(r'<!--.*?-->', '', text, flags=re.S)
+    text = re.sub(r'<ref[^>]*/>', '', text)
+    text = re.sub(r'<ref[^>]*>.*?</ref>', '', text, flags=re.S)
+    text = re.sub(r'<br\s*/?>', ', ', text, flags=re.I)
+    # Links go first, their pipes would otherwise split template arguments
+    text = re.sub(r'\[\[(?:File|Image):[^\]]*\]\]', '', text, flags=re.I)
+    text = re.sub(r'\[\[(?:[^\]|]*\|)?([^\]]*)\]\]', r'\1', text)
+    # Render innermost templates first until none are left
+    previous = None
+    while previous != text:
+        previous = text
+        text = re.sub(r'\{\{([^{}]*)\}\}', _render_template, text)
+    text = re.sub(r'\[https?://\S+ ([^\]]*)\]', r'\1', text)
+    text = re.sub(r"'{2,}", '', text)
+    text = re.sub(r'<[^>]+>', '', text)
+    text = text.replace('&nbsp;', ' ')
+    text = re.sub(r'\n\*+\s*', ', ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r',(\s*,)+', ',', text)
+    return text.strip(' ,')
+
+
+def _template_end(text, start):
+    """Index just past the template that opens at start, or -1 if it is never closed"""
+    depth = 0
+    i = start
+    while i < len(text) - 1:
+        pair = text[i:i + 2]
+        if pair == '{{':
+            depth += 1
+            i += 2
+        elif pair == '}}':
+            depth -= 1
+            i += 2
+            if depth == 0:
+                return i
+        else:
+            i += 1
+    return -1
+
+
+def _split_params(body):
+    """Split a template body on the pipes that are not inside links or nested templates"""
+    params = {}
+    depth = 0
+    current = []
+    for i, char in enumerate(body):
+        pair = body[i:i + 2]
+        if pair in ('{{', '[['):
+            depth += 1
+        elif pair in ('}}', ']]') and depth:
+            depth -= 1
+        if char == '|' and depth == 0:
+            params_text = ''.join(current)
+            if '=' in params_text:
+                key, value = params_text.split('=', 1)
+                params[key.strip().lower()] = value.strip()
+            current = []
+        else:
+            current.append(char)
+    params_text = ''.join(current)
+    if '=' in params_text:
+        key, value = params_text.split('=', 1)
+        params[key.strip().lower()] = value.strip()
+    return params
+
+
+def _lead_paragraph(text):
+    previous = None
+    while previous != text:
+        previous = text
+        text = re.sub(r'\{\{[^{}]*\}\}', '', text)
+    for paragraph in re.split(r'\n\s*\n', text):
+        paragraph = paragraph.strip()
+        if not paragraph or paragraph[0] in '|!=*#:{}' or paragraph.startswith(('[[File:', '[[Image:', '[[Category:')):
+            continue
+        paragraph = strip_wikitext(paragraph)
+        if len(paragraph) > 40:
+            return paragraph
+    return ''
+
+
+def extract_company(title, text):
+    """Pull the company infobox fields and lead paragraph out of an article's wikitext, or None"""
+    match = INFOBOX_START.search(text)
+    if not match:
+        return None
+    end = _template_end(text, match.start())
+    if end < 0:
+        return None
+    params = _split_params(text[match.start() + 2:end - 2])
+
+    # 'title' would be taken for the page title by update_result
+    record = {'article_title': title, 'source_url': 'https://en.wikipedia.org/wiki/' + title.replace(' ', '_')}
+    overview = _lead_paragraph(text[end:])
+    if overview:
+        record['overview'] = overview
+    for field, names in FIELD_PARAMS.items():
+        for name in names:
+            value = strip_wikitext(params.get(name, ''))
+            if field == 'headquarters' and not value:
+                city = strip_wikitext(params.get(f'{name}_city', ''))
+                country = strip_wikitext(params.get(f'{name}_country', ''))
+                value = ', '.join(part for part in (city, country) if part)
+            if value:
+                record[field] = value
+                break
+
+    leadership = []
+    for name, position in LEADER_PARAMS:
+        value = strip_wikitext(params.get(name, ''))
+        for leader in re.split(r'[,\n]', value):
+            leader = leader.strip()
+            if leader:
+                leadership.append({'name': leader, 'position': position})
+    if leadership:
+        record['leadership'] = leadership
+    return record
+
+
+def iter_pages(dump_path):
+    """Yield (title, redirect target or None, wikitext) for every article in a dump"""
+    opener = bz2.open if dump_path.endswith('.bz2') else open
+    with opener(dump_path, 'rb') as f:
+        title = redirect = text = None
+        namespace = '0'
+        root = None
+        for event, element in ET.iterparse(f, events=('start', 'end')):
+            if root is None:
+                root = element
+            if event == 'start':
+                continue
+            tag = element.tag.rsplit('}', 1)[-1]
+            if tag == 'title':
+                title = element.text
+            elif tag == 'ns':
+                namespace = element.text
+            elif tag == 'redirect':
+                redirect = element.get('title')
+            elif tag == 'text':
+                text = element.text or ''
+            elif tag == 'page':
+                if namespace == '0' and title:
+                    yield title, redirect, text or ''
+                title = redirect = text = None
+                namespace = '0'
+                # Drop the finished page so memory stays flat across the whole dump
+                root.clear()
+
+
+def _title_keys(title):
+    """Lookup keys for an article title: as written, and without a disambiguating suffix"""
+    keys = [normalize_company_name(title)]
+    bare = re.sub(r'\s*\([^)]*\)$', '', title)
+    if bare != title:
+        keys.append(normalize_company_name(bare))
+    return [key for key in keys if key]
+
+
+def build_index(dump_path, index_path):
+    """Scan a dump for company infoboxes and write the memory-mappable index; returns the company count"""
+    started = time.time()
+    records = []
+    keys = {}  # normalized key -> record number
+    redirect_count = 0
+    pages = 0
+    # There are millions of redirects, mostly to non-companies, and a redirect can come before
+    # its target; spool them to disk and resolve them once every company is known
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as redirects:
+        for title, redirect, text in iter_pages(dump_path):
+            pages += 1
+            if pages % 100000 == 0:
+                logger.info(f"Scanned {pages} pages, {len(records)} companies so far")
+            if redirect:
+                redirects.write(f"{title}\t{redirect}\n")
+                redirect_count += 1
+                continue
+            record = extract_company(title, text)
+            if record is None:
+                continue
+            number = len(records)
+            records.append((title, record))
+            for key in _title_keys(title):
+                # The first company to claim a name keeps it
+                keys.setdefault(key, number)
+
+        # Redirects to company articles become aliases
+        logger.info(f"Resolving {redirect_count} redirects against {len(records)} companies")
+        by_title = {title: number for number, (title, _) in enumerate(records)}
+        redirects.seek(0)
+        for line in redirects:
+            alias, _, target = line.rstrip('\n').partition('\t')
+            number = by_title.get(target)
+            if number is not None:
+                for key in _title_keys(alias):
+                    keys.setdefault(key, number)
+
+    blobs = [json.dumps(record, ensure_ascii=False).encode('utf-8') for _, record in records]
+    sorted_keys = sorted((key.encode('utf-8'), number) for key, number in keys.items())
+
+    tmp_path = index_path + '.tmp'
+    os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+    with open(tmp_path, 'wb') as f:
+        f.write(b'\0' * HEADER.size)
+        record_offsets = []
+        for blob in blobs:
+            record_offsets.append((f.tell(), len(blob)))
+            f.write(blob)
+        keys_offset = f.tell()
+        key_offsets = []
+        for key, _ in sorted_keys:
+            key_offsets.append(f.tell() - keys_offset)
+            f.write(key)
+        table_offset = f.tell()
+        for (key, number), key_offset in zip(sorted_keys, key_offsets):
+            record_offset, record_length = record_offsets[number]
+            f.write(KEY_ENTRY.pack(key_offset, len(key), record_offset, record_length))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, len(sorted_keys), table_offset, keys_offset))
+    os.replace(tmp_path, index_path)
+    logger.info(f"Indexed {len(records)} companies under {len(sorted_keys)} names from {pages} pages in {time.time() - started:.0f}s")
+    return len(records)
+
+
+class WikiDumpIndex:
+    """Read-only view of an index written by build_index, searched by binary search over the mmap"""
+
+    def __init__(self, path=DEFAULT_INDEX_FILE):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count, self.table_offset, self.keys_offset = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.data.close()
+            raise ValueError(f"{path} is not a version {VERSION} company index")
+
+    def __len__(self):
+        return self.count
+
+    def lookup(self, company_name):
+        """Return the indexed infobox data for a company name, or None"""
+        key = normalize_company_name(company_name).encode('utf-8')
+        if not key:
+            return None
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            entry = self._entry(middle)
+            candidate = self._key(entry)
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                _, _, record_offset, record_length = entry
+                return json.loads(self.data[record_offset:record_offset + record_length])
+        return None
+
+    def close(self):
+        self.data.close()
+
+    def _entry(self, position):
+        return KEY_ENTRY.unpack_from(self.data, self.table_offset + position * KEY_ENTRY.size)
+
+    def _key(self, entry):
+        start = self.keys_offset + entry[0]
+        return self.data[start:start + entry[1]]
+
+
+def load_wiki_index(path=DEFAULT_INDEX_FILE):
+    """Open the offline index if one has been built, else None"""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        index = WikiDumpIndex(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Offline Wikipedia index unavailable: {e}")
+        return None
+    logger.info(f"Using offline Wikipedia index {path} with {len(index)} company names")
+    return index
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if len(sys.argv) not in (2, 3):
+        print(f"Usage: {sys.argv[0]} DUMP_FILE [INDEX_FILE]")
+        sys.exit(1)
+    build_index(sys.argv[1], sys.argv[2] if len(sys.argv) == 3 else DEFAULT_INDEX_FILE)
@@ -0,0 +1,128 @@
+import os
+import logging
+
+from http_client import get_http_client
+from micro_batcher import MicroBatcher
+from circuit_breaker import get_breaker
+from deadline import bounded_timeout
+
+logger = logging.getLogger('WikipediaApi')
+
+API_URL = os.environ.get('SCRAPER_WIKIPEDIA_API_URL', 'https://en.wikipedia.org/w/api.php')
+# The API returns intro extracts for at most 20 pages per query
+TITLE_BATCH_SIZE = int(os.environ.get('SCRAPER_WIKIPEDIA_BATCH_SIZE', 20))
+TITLE_BATCH_WAIT = float(os.environ.get('SCRAPER_WIKIPEDIA_BATCH_WAIT', 0.05))
+API_TIMEOUT = float(os.environ.get('SCRAPER_WIKIPEDIA_TIMEOUT', 20))
+
+
+class WikipediaApiError(Exception):
+    """The MediaWiki API could not be reached or returned an error"""
+
+
+class WikiPage:
+    def __init__(self, title, url, extract='', disambiguation=False):
+        self.title = title
+        self.url = url
+        self.extract = extract
+        self.disambiguation = disambiguation
+
+    @property
+    def intro(self):
+        """First paragraph of the plain-text intro"""
+        for paragraph in self.extract.split('\n'):
+            if paragraph.strip():
+                return paragraph.strip()
+        return ''
+
+
+class WikipediaApi:
+    """Wikipedia lookups through the MediaWiki API instead of rendered pages.
+
+    Title lookups from concurrent callers are batched into a single query that follows
+    redirects and returns each page's URL and intro extract.
+    """
+
+    def __init__(self, http_client=None, batch_size=TITLE_BATCH_SIZE, batch_wait=TITLE_BATCH_WAIT):
+        self.http = http_client or get_http_client()
+        self.breaker = get_breaker('wikipedia_api')
+        self.batcher = MicroBatcher(self._fetch_pages, max_batch=batch_size, max_wait=batch_wait, name='wikipedia title')
+
+    def get_pages(self, titles):
+        """Return {title: WikiPage} for the titles that exist, following redirects"""
+        titles = [title.replace('|', ' ').strip() for title in titles if title and title.strip()]
+        pages = self.batcher.get_many(titles, timeout=bounded_timeout(API_TIMEOUT))
+        return {title: page for title, page in pages.items() if page}
+
+    def search(self, query, limit=5):
+        """Return the titles of the best full-text search matches"""
+        data = self._query({'action': 'query', 'list': 'search', 'srsearch': query, 'srlimit': limit,
+                            'srprop': ''})
+        return [item['title'] for item in data.get('query', {}).get('search', [])]
+
+    def lead_html(self, title):
+        """HTML of the article's lead section, which holds the infobox"""
+        data = self._query({'action': 'parse', 'page': title, 'prop': 'text', 'section': 0, 'redirects': 1,
+                            'disabletoc': 1})
+        return data.get('parse', {}).get('text', '')
+
+    def _fetch_pages(self, titles):
+        data = self._query({
+            'action': 'query',
+            'titles': '|'.join(titles),
+            'redirects': 1,
+            'prop': 'extracts|info|pageprops',
+            'exintro': 1,
+            'explaintext': 1,
+            'exlimit': 'max',
+            'inprop': 'url',
+            'ppprop': 'disambiguation'
+        })
+        query = data.get('query', {})
+
+        # Requested titles reach the page through normalization and then redirects
+        aliases = {}
+        for item in query.get('normalized', []) + query.get('redirects', []):
+            aliases[item['from']] = item['to']
+        pages = {page['title']: page for page in query.get('pages', [])}
+
+        found = {}
+        for title in titles:
+            resolved = title
+            seen = set()
+            while resolved in aliases and resolved not in seen:
+                seen.add(resolved)
+                resolved = aliases[resolved]
+            page = pages.get(resolved)
+            if not page or page.get('missing') or page.get('invalid'):
+                continue
+            found[title] = WikiPage(page['title'], page.get('fullurl'), page.get('extract', ''),
+                                    'disambiguation' in page.get('pageprops', {}))
+        logger.info(f"Resolved {len(found)} of {len(titles)} Wikipedia titles")
+        return found
+
+    def _query(self, params):
+        if not self.breaker.allow():
+            raise WikipediaApiError("Skipped, the API has been failing")
+        try:
+            data = self._request(params)
+        except WikipediaApiError:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return data
+
+    def _request(self, params):
+        params = dict(params, format='json', formatversion=2)
+        try:
+            response = self.http.get(API_URL, params=params, robots=False)
+        except Exception as e:
+            raise WikipediaApiError(f"Request failed: {e}")
+        if response.status_code != 200:
+            raise WikipediaApiError(f"API returned {response.status_code}")
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise WikipediaApiError(f"Invalid response: {e}")
+        if 'error' in data:
+            raise WikipediaApiError(data['error'].get('info', 'unknown error'))
+        return data